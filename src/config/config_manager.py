@@ -10,6 +10,10 @@ from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
+# Hugging Face model used for speaker embeddings. Kept here, away from the
+# torch/pyannote imports, so cache keys can name it cheaply
+EMBEDDING_MODEL = "pyannote/embedding"
+
 
 class ConfigManager:
     """Manages application configuration from environment variables."""
@@ -66,6 +70,66 @@ class ConfigManager:
         """Azure endpoint URL for container mode."""
         return os.getenv("AZURE_ENDPOINT")
     
+    @property
+    def azure_container_throttle_percent(self) -> int:
+        """Container audio throttle as a percentage of real time (0 = SDK default)."""
+        return int(os.getenv("AZURE_CONTAINER_THROTTLE_PERCENT", "500"))
+    
+    @property
+    def azure_container_transmit_before_throttle_ms(self) -> int:
+        """Audio sent to a container before throttling starts (milliseconds)."""
+        return int(os.getenv("AZURE_CONTAINER_TRANSMIT_BEFORE_THROTTLE_MS", "5000"))
+    
+    @property
+    def azure_container_max_buffer_seconds(self) -> int:
+        """Audio buffered by the SDK for container connections (seconds)."""
+        return int(os.getenv("AZURE_CONTAINER_MAX_BUFFER_SECONDS", "60"))
+    
+    @property
+    def azure_enable_dictation(self) -> bool:
+        """Enable dictation mode (spoken punctuation commands)."""
+        return os.getenv("AZURE_ENABLE_DICTATION", "false").lower() in ("true", "1", "yes")
+    
+    @property
+    def azure_word_timestamps(self) -> bool:
+        """Request word-level timestamps in detailed results."""
+        return os.getenv("AZURE_WORD_TIMESTAMPS", "false").lower() in ("true", "1", "yes")
+    
+    @property
+    def azure_sentence_boundary(self) -> bool:
+        """Request sentence boundary events in detailed results."""
+        return os.getenv("AZURE_SENTENCE_BOUNDARY", "false").lower() in ("true", "1", "yes")
+    
+    @property
+    def azure_rest_short_audio(self) -> bool:
+        """Send short segments to the REST short-audio endpoint (async API only)."""
+        return os.getenv("AZURE_REST_SHORT_AUDIO", "false").lower() in ("true", "1", "yes")
+    
+    @property
+    def azure_prewarm(self) -> bool:
+        """Warm DNS/TLS with a throwaway Azure connection at service start."""
+        return os.getenv("AZURE_PREWARM", "false").lower() in ("true", "1", "yes")
+    
+    @property
+    def azure_concurrency(self) -> int:
+        """Maximum concurrent Azure recognitions for batch transcription."""
+        return int(os.getenv("AZURE_CONCURRENCY", "8"))
+    
+    @property
+    def transcription_batch_max_seconds(self) -> float:
+        """Maximum audio per batched continuous-recognition session (seconds)."""
+        return float(os.getenv("TRANSCRIPTION_BATCH_MAX_SECONDS", "60"))
+    
+    @property
+    def transcription_cache_size(self) -> int:
+        """Maximum cached transcription results in memory (0 disables the cache)."""
+        return int(os.getenv("TRANSCRIPTION_CACHE_SIZE", "4096"))
+    
+    @property
+    def transcription_cache_persist(self) -> bool:
+        """Persist cached transcription results under the temp directory."""
+        return os.getenv("TRANSCRIPTION_CACHE_PERSIST", "true").lower() in ("true", "1", "yes")
+    
     # Hugging Face Configuration
     @property
     def huggingface_token(self) -> str:
@@ -5,12 +5,18 @@ Orchestrates all services to process audio files in batch mode,
 identifying and transcribing a specific target speaker.
 """
 
+import io
 import time
 from pathlib import Path
-from typing import List, Dict, Union, Optional, Callable
+from typing import Iterator, List, Dict, Tuple, Union, Optional, Callable
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config.config_manager import get_config
 from src.utils.logger import get_logger
 from src.utils.audio_utils import validate_audio_file, get_audio_duration
@@ -30,21 +36,30 @@ class BatchProcessor:
     for a specific target speaker.
     """
     
-    def __init__(self, use_gpu: Optional[bool] = None):
+    def __init__(
+        self,
+        use_gpu: Optional[bool] = None,
+        identification: Optional[IdentificationService] = None,
+        profile_manager: Optional[ProfileManager] = None
+    ):
         """
         Initialize batch processor.
         
         Args:
             use_gpu: Whether to use GPU. If None, uses config setting.
+            identification: Shared identification service; a new one is
+                loaded if not given
+            profile_manager: Shared profile manager; a new one is created
+                if not given
         """
         self.config = get_config()
         
         # Initialize services
         logger.info("Initializing batch processor services...")
         self.diarization = DiarizationService(use_gpu=use_gpu)
-        self.identification = IdentificationService(use_gpu=use_gpu)
+        self.identification = identification or IdentificationService(use_gpu=use_gpu)
         self.transcription = TranscriptionService()
-        self.profile_manager = ProfileManager()
+        self.profile_manager = profile_manager or ProfileManager()
         
         logger.info("Batch processor initialized")
     
@@ -237,15 +252,46 @@ class BatchProcessor:
         """
         start_time = time.time()
         
+        results = list(self.iter_batch(
+            audio_files=audio_files,
+            target_profile_id=target_profile_id,
+            threshold=threshold,
+            language=language,
+            progress_callback=progress_callback
+        ))
+        
+        return self.build_batch_result(results, time.time() - start_time)
+    
+    def iter_batch(
+        self,
+        audio_files: List[Union[str, Path]],
+        target_profile_id: str,
+        threshold: Optional[float] = None,
+        language: str = "en-US",
+        progress_callback: Optional[Callable[[str, int, int], None]] = None
+    ) -> Iterator[Dict]:
+        """
+        Process multiple audio files, yielding each file's result as it completes.
+        
+        Lets callers (e.g. the UI) show transcripts while the rest of the
+        batch is still running. Pass the collected results to
+        build_batch_result for the same aggregate process_batch returns.
+        
+        Args:
+            audio_files: List of audio file paths
+            target_profile_id: ID of target speaker profile
+            threshold: Similarity threshold
+            language: Language code for transcription
+            progress_callback: Optional callback(message, current_file, total_files)
+        
+        Yields:
+            Individual file result dictionaries, in input order
+        """
         logger.info(
             f"Starting batch processing: {len(audio_files)} files, "
             f"target profile={target_profile_id}"
         )
         
-        results = []
-        successful = 0
-        failed = 0
-        
         for i, audio_file in enumerate(audio_files, 1):
             if progress_callback:
                 progress_callback(
@@ -263,25 +309,32 @@ class BatchProcessor:
                     threshold=threshold,
                     language=language
                 )
-                
-                results.append(result)
-                
-                if result["success"]:
-                    successful += 1
-                else:
-                    failed += 1
                     
             except Exception as e:
                 logger.error(f"Failed to process {audio_file}: {e}")
-                results.append({
+                result = {
                     "success": False,
                     "audio_file": str(audio_file),
                     "error": str(e)
-                })
-                failed += 1
+                }
+            
+            yield result
+    
+    def build_batch_result(self, results: List[Dict], total_time: float) -> Dict:
+        """
+        Aggregate individual file results into a batch result.
+        
+        Args:
+            results: File results, e.g. collected from iter_batch
+            total_time: Wall-clock time the batch took, in seconds
+        
+        Returns:
+            Batch result dictionary (see process_batch)
+        """
+        successful = sum(1 for r in results if r.get("success", False))
+        failed = len(results) - successful
         
         # Calculate summary statistics
-        total_time = time.time() - start_time
         summary = self._create_summary(results)
         
         logger.info(
@@ -291,7 +344,7 @@ class BatchProcessor:
         
         return {
             "success": failed == 0,
-            "total_files": len(audio_files),
+            "total_files": len(results),
             "successful": successful,
             "failed": failed,
             "results": results,
@@ -304,7 +357,7 @@ class BatchProcessor:
         results: Dict,
         output_dir: Optional[Union[str, Path]] = None,
         format: str = "json"
-    ) -> Path:
+    ) -> Tuple[Path, bytes]:
         """
         Save processing results to file.
         
@@ -314,7 +367,8 @@ class BatchProcessor:
             format: Output format ('json' or 'txt')
         
         Returns:
-            Path to saved results file
+            Tuple of (path to saved results file, file content as bytes),
+            so callers can offer a download without re-reading the file
         """
         if output_dir is None:
             output_dir = self.config.results_dir
@@ -328,25 +382,24 @@ class BatchProcessor:
         
         if format == "json":
             output_file = output_dir / f"results_{timestamp}.json"
-            
-            # Convert numpy arrays to lists for JSON serialization
-            serializable_results = self._make_serializable(results)
-            
-            with open(output_file, 'w') as f:
-                json.dump(serializable_results, f, indent=2)
+            content = self._serialize_json(results)
                 
         elif format == "txt":
             output_file = output_dir / f"transcript_{timestamp}.txt"
             
-            with open(output_file, 'w') as f:
-                self._write_text_transcript(results, f)
+            buffer = io.StringIO()
+            self._write_text_transcript(results, buffer)
+            content = buffer.getvalue().encode("utf-8")
         
         else:
             raise ValueError(f"Unsupported format: {format}")
         
+        with open(output_file, 'wb') as f:
+            f.write(content)
+        
         logger.info(f"Results saved to: {output_file}")
         
-        return output_file
+        return output_file, content
     
     def _create_result(
         self,
@@ -424,6 +477,24 @@ class BatchProcessor:
             "total_characters_transcribed": total_characters
         }
     
+    def _serialize_json(self, results: Dict) -> bytes:
+        """
+        Serialize results to indented JSON bytes.
+        
+        Uses orjson (native numpy support, much faster on large batches)
+        when installed, otherwise the stdlib json module.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                results,
+                default=self._make_serializable,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        
+        # Convert numpy arrays to lists for JSON serialization
+        serializable_results = self._make_serializable(results)
+        return json.dumps(serializable_results, indent=2).encode("utf-8")
+    
     def _make_serializable(self, obj):
         """Convert numpy arrays and other non-serializable objects."""
         import numpy as np
@@ -434,8 +505,13 @@ class BatchProcessor:
             return [self._make_serializable(item) for item in obj]
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        elif isinstance(obj, (np.integer, np.floating)):
+        elif isinstance(obj, np.integer):
+            # Same output as orjson's native numpy support
+            return int(obj)
+        elif isinstance(obj, np.floating):
             return float(obj)
+        elif isinstance(obj, np.bool_):
+            return bool(obj)
         elif isinstance(obj, Path):
             return str(obj)
         else:
@@ -21,7 +21,7 @@ except ImportError:
 
 from src.config.config_manager import get_config
 from src.utils.logger import get_logger
-from src.utils.audio_utils import save_audio, extract_segment, load_audio
+from src.utils.audio_utils import save_audio, extract_segment
 from src.services.diarization_service import DiarizationService
 from src.services.identification_service import IdentificationService
 from src.services.transcription_service import TranscriptionService
@@ -39,22 +39,31 @@ class RealtimeProcessor:
     and transcribe only the target speaker.
     """
     
-    def __init__(self, use_gpu: Optional[bool] = None):
+    def __init__(
+        self,
+        use_gpu: Optional[bool] = None,
+        identification: Optional[IdentificationService] = None,
+        profile_manager: Optional[ProfileManager] = None
+    ):
         """
         Initialize real-time processor.
         
         Args:
             use_gpu: Whether to use GPU. If None, uses config setting.
+            identification: Shared identification service; a new one is
+                loaded if not given
+            profile_manager: Shared profile manager; a new one is created
+                if not given
         """
         self.config = get_config()
         
         # Initialize services
         logger.info("Initializing real-time processor services...")
         self.diarization = DiarizationService(use_gpu=use_gpu)
-        self.identification = IdentificationService(use_gpu=use_gpu)
+        self.identification = identification or IdentificationService(use_gpu=use_gpu)
         self.transcription = TranscriptionService()
         self.streaming_transcription = StreamingTranscriptionService(self.config)
-        self.profile_manager = ProfileManager()
+        self.profile_manager = profile_manager or ProfileManager()
         
         # Streaming mode flag (use streaming instead of file-based)
         self.use_streaming = True  # Enable by default for better accuracy
@@ -102,7 +111,8 @@ class RealtimeProcessor:
         Get list of available audio input devices.
         
         Returns:
-            List of device info dictionaries
+            List of device info dictionaries ('index', 'name', 'sample_rate',
+            'channels', and 'is_default' for the system default input)
         """
         if pyaudio is None:
             logger.error("pyaudio not available")
@@ -112,6 +122,12 @@ class RealtimeProcessor:
         devices = []
         
         try:
+            # Read the default in the same PortAudio session as the list
+            try:
+                default_index = p.get_default_input_device_info()['index']
+            except (IOError, OSError):
+                default_index = None
+            
             for i in range(p.get_device_count()):
                 info = p.get_device_info_by_index(i)
                 
@@ -121,7 +137,8 @@ class RealtimeProcessor:
                         'index': i,
                         'name': info.get('name', 'Unknown'),
                         'sample_rate': int(info.get('defaultSampleRate', 0)),
-                        'channels': info.get('maxInputChannels', 0)
+                        'channels': info.get('maxInputChannels', 0),
+                        'is_default': i == default_index
                     })
         finally:
             p.terminate()
@@ -405,10 +422,10 @@ class RealtimeProcessor:
                 # Stream target audio directly to Azure (NEW APPROACH)
                 if self.use_streaming and self.streaming_transcription.is_streaming:
                     # Stream target audio segments to Azure in real-time
-                    self._stream_target_audio(temp_file, target_segments)
+                    self._stream_target_audio(audio_chunk, target_segments)
                 else:
-                    # Fallback to file-based approach
-                    self._add_to_transcription_buffer(temp_file, target_segments)
+                    # Fallback to buffered approach
+                    self._add_to_transcription_buffer(audio_chunk, target_segments)
                     self._process_transcription_buffer()
             else:
                 logger.info("No target speaker detected in chunk")
@@ -416,8 +433,10 @@ class RealtimeProcessor:
             # Still transcribe other speakers immediately (without buffering)
             other_segments = [s for s in identified if not s.get('is_target', False)]
             if other_segments:
-                transcripts = self.transcription.transcribe_segments(
-                    audio_file=temp_file,
+                # Chunk is already in memory - no need to decode temp_file again
+                transcripts = self.transcription.transcribe_segments_array(
+                    audio=audio_chunk,
+                    sample_rate=self.sample_rate,
                     segments=other_segments,
                     language=self.language,
                     target_only=False
@@ -440,18 +459,16 @@ class RealtimeProcessor:
         except Exception as e:
             logger.error(f"Error processing audio chunk: {e}")
     
-    def _add_to_transcription_buffer(self, audio_file: Path, segments: List[Dict]) -> None:
+    def _add_to_transcription_buffer(self, audio: np.ndarray, segments: List[Dict]) -> None:
         """
         Add target speaker segments to transcription buffer for continuous context.
         
         Args:
-            audio_file: Path to audio file containing segments
+            audio: Chunk audio containing the segments
             segments: List of segment metadata
         """
         try:
-            # Load the audio file
-            from src.utils.audio_utils import load_audio
-            audio, sr = load_audio(audio_file, sample_rate=self.sample_rate)
+            sr = self.sample_rate
             
             # Add each target segment to buffer
             for segment in segments:
@@ -500,62 +517,39 @@ class RealtimeProcessor:
                 # Concatenate all buffered audio
                 combined_audio = np.concatenate(self.transcription_buffer)
                 
-                # Save to temporary file
-                temp_buffer_file = self.config.temp_dir / f"buffer_{int(time.time())}.wav"
-                save_audio(combined_audio, temp_buffer_file, self.sample_rate)
-                
-                # Create a single segment for the entire buffer
-                buffer_segment = {
-                    'start': 0.0,
-                    'end': buffer_duration,
-                    'speaker_label': 'TARGET',
-                    'is_target': True,
-                    'similarity': np.mean([seg.get('similarity', 0.5) for seg in self.buffer_segments])
-                }
-                
-                # Transcribe the accumulated buffer as ONE continuous segment
-                transcripts = self.transcription.transcribe_segments(
-                    audio_file=temp_buffer_file,
-                    segments=[buffer_segment],
-                    language=self.language,
-                    target_only=False
-                )
-                
-                # Process transcripts
-                for transcript in transcripts:
-                    if transcript.get("text"):
-                        transcript["timestamp"] = datetime.now().isoformat()
-                        transcript["is_target"] = True
-                        
-                        # Add to session
-                        self.session_transcripts.append(transcript)
-                        
-                        # Callback
-                        if self.transcript_callback:
-                            self.transcript_callback(transcript)
-                        
-                        logger.info(
-                            f"Real-time transcript [TARGET-BUFFERED]: "
-                            f"[{buffer_duration:.1f}s] {transcript['text'][:100]}... "
-                            f"(confidence={transcript.get('confidence', 0):.2f})"
-                        )
-                
-                # Clean up - wait longer to ensure all Azure callbacks are done
+                # Transcribe the accumulated buffer as ONE continuous segment,
+                # streamed straight from memory
                 try:
-                    time.sleep(2.0)  # Increased to 2s for Azure to finish all processing
+                    transcript = self.transcription.transcribe_array(
+                        combined_audio,
+                        self.sample_rate,
+                        language=self.language
+                    )
+                except Exception as e:
+                    logger.warning(f"Buffered transcription failed: {e}")
+                    transcript = {"text": ""}
+                
+                # Process transcript
+                if transcript.get("text"):
+                    transcript["speaker_label"] = "TARGET"
+                    transcript["similarity"] = np.mean(
+                        [seg.get('similarity', 0.5) for seg in self.buffer_segments]
+                    )
+                    transcript["timestamp"] = datetime.now().isoformat()
+                    transcript["is_target"] = True
                     
-                    # Also clean up segment temp files
-                    for temp_file in self.config.temp_dir.glob("segment_*.wav"):
-                        try:
-                            temp_file.unlink()
-                        except:
-                            pass
+                    # Add to session
+                    self.session_transcripts.append(transcript)
                     
-                    # Clean up buffer file
-                    if temp_buffer_file.exists():
-                        temp_buffer_file.unlink()
-                except Exception as cleanup_error:
-                    logger.warning(f"Failed to cleanup temp file: {cleanup_error}")
+                    # Callback
+                    if self.transcript_callback:
+                        self.transcript_callback(transcript)
+                    
+                    logger.info(
+                        f"Real-time transcript [TARGET-BUFFERED]: "
+                        f"[{buffer_duration:.1f}s] {transcript['text'][:100]}... "
+                        f"(confidence={transcript.get('confidence', 0):.2f})"
+                    )
                 
                 # Clear buffer
                 self._clear_transcription_buffer()
@@ -571,17 +565,16 @@ class RealtimeProcessor:
         self.last_transcription_time = time.time()
         logger.debug("Transcription buffer cleared")
     
-    def _stream_target_audio(self, audio_file: Path, segments: List[Dict]) -> None:
+    def _stream_target_audio(self, audio: np.ndarray, segments: List[Dict]) -> None:
         """
         Stream target speaker audio segments to Azure in real-time.
         
         Args:
-            audio_file: Path to audio file
+            audio: Chunk audio containing the segments
             segments: List of target speaker segments
         """
         try:
-            # Load audio
-            audio, sr = load_audio(audio_file, sample_rate=self.sample_rate)
+            sr = self.sample_rate
             
             # Stream each target segment
             for segment in segments:
@@ -718,29 +711,27 @@ class RealtimeProcessor:
             num_samples: Number of samples to return (for plotting)
         
         Returns:
-            Downsampled waveform array
+            Downsampled float32 waveform array of length num_samples
         """
         if not self.is_running:
             return np.zeros(num_samples, dtype=np.float32)
         
         try:
-            # Downsample the waveform buffer for visualization
-            buffer_len = len(self.waveform_buffer)
+            # Downsample the waveform buffer for visualization (the audio
+            # callback swaps in a new array, so this reference is stable)
+            buffer = self.waveform_buffer
+            buffer_len = len(buffer)
             if buffer_len == 0:
                 return np.zeros(num_samples, dtype=np.float32)
             
             # Calculate downsample factor
             downsample_factor = max(1, buffer_len // num_samples)
             
-            # Downsample by taking max of each window (preserves peaks)
-            downsampled = []
-            for i in range(0, buffer_len, downsample_factor):
-                window = self.waveform_buffer[i:i+downsample_factor]
-                if len(window) > 0:
-                    # Take max absolute value to preserve peaks
-                    downsampled.append(np.max(np.abs(window)) * np.sign(np.mean(window)))
-            
-            result = np.array(downsampled[:num_samples], dtype=np.float32)
+            # Downsample by taking max of each window (preserves peaks), as
+            # one vectorized pass over a (windows, factor) view
+            window_count = min(buffer_len // downsample_factor, num_samples)
+            windows = buffer[:window_count * downsample_factor].reshape(window_count, downsample_factor)
+            result = (np.abs(windows).max(axis=1) * np.sign(windows.mean(axis=1))).astype(np.float32, copy=False)
             
             # Pad if needed
             if len(result) < num_samples:
@@ -5,13 +5,14 @@ Provides speaker embedding extraction and comparison for identifying
 specific speakers in audio recordings.
 """
 
+import threading
 import torch
 import numpy as np
 from pyannote.audio import Inference, Model
 from pathlib import Path
 from typing import List, Dict, Union, Optional, Tuple
 from scipy.spatial.distance import cosine
-from src.config.config_manager import get_config
+from src.config.config_manager import EMBEDDING_MODEL, get_config
 from src.utils.logger import get_logger
 from src.utils.audio_utils import validate_audio_file, extract_segment, load_audio
 
@@ -43,6 +44,9 @@ class IdentificationService:
         
         # Load embedding model
         self.inference = self._load_embedding_model()
+        
+        # The UI shares one instance across sessions; serialize model calls
+        self._inference_lock = threading.Lock()
     
     def _get_device(self, use_gpu: bool) -> torch.device:
         """Determine the best available device."""
@@ -74,7 +78,7 @@ class IdentificationService:
             
             # Load the model from HuggingFace (pyannote.audio 4.0+ API)
             model = Model.from_pretrained(
-                "pyannote/embedding",
+                EMBEDDING_MODEL,
                 token=self.config.huggingface_token
             )
             
@@ -134,16 +138,18 @@ class IdentificationService:
                 segment_audio = audio[start_sample:end_sample]
                 
                 # Create temporary dict with audio waveform directly
-                embedding = self.inference({
-                    "waveform": torch.from_numpy(segment_audio[np.newaxis, :]).to(self.device),
-                    "sample_rate": sr
-                })
+                with self._inference_lock:
+                    embedding = self.inference({
+                        "waveform": torch.from_numpy(segment_audio[np.newaxis, :]).to(self.device),
+                        "sample_rate": sr
+                    })
             else:
                 logger.debug(f"Extracting embedding from entire file: {audio_file.name}")
                 # For full files, use file path
-                embedding = self.inference({
-                    "audio": str(audio_file)
-                })
+                with self._inference_lock:
+                    embedding = self.inference({
+                        "audio": str(audio_file)
+                    })
             
             # Convert to numpy array
             embedding_array = np.array(embedding)
@@ -385,12 +391,127 @@ class IdentificationService:
         
         return embeddings
     
+    def measure_audio_quality(
+        self,
+        audio_file: Union[str, Path],
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Dict:
+        """
+        Score the signal-level factors of an enrollment recording.
+        
+        Covers duration, audio level and SNR. Needs only the audio, so it
+        can run while the embedding is being extracted; pass the result to
+        assess_profile_quality as audio_quality.
+        
+        Args:
+            audio_file: Path to audio file
+            start: Optional start time (if segment)
+            end: Optional end time (if segment)
+        
+        Returns:
+            Dict with 'scores' (duration, audio_level, snr), 'details'
+            and 'recommendations'
+        """
+        from src.utils.audio_utils import load_audio
+        import librosa
+        
+        # Load audio
+        audio, sr = load_audio(audio_file, sample_rate=16000)
+        
+        # Extract segment if specified
+        if start is not None and end is not None:
+            start_sample = int(start * sr)
+            end_sample = int(end * sr)
+            audio = audio[start_sample:end_sample]
+        
+        duration = len(audio) / sr
+        
+        # Initialize scores
+        scores = {}
+        recommendations = []
+        details = {}
+        
+        # 1. Duration Score (30-60 seconds is ideal)
+        if duration < 10:
+            duration_score = duration / 10.0  # Linear scale up to 10s
+            recommendations.append("⚠️ Audio too short - use 30-60 seconds for best results")
+        elif duration < 30:
+            duration_score = 0.5 + (duration - 10) / 40.0  # 0.5 to 1.0
+            recommendations.append("💡 Consider using 30-60 seconds of audio for optimal quality")
+        elif duration <= 60:
+            duration_score = 1.0  # Ideal range
+        else:
+            duration_score = 0.9  # Still good, but diminishing returns
+        
+        scores['duration'] = duration_score
+        details['duration_seconds'] = round(duration, 1)
+        
+        # 2. Audio Level Score (check for good volume and no clipping)
+        rms = np.sqrt(np.mean(audio**2))
+        peak = np.max(np.abs(audio))
+        
+        # Ideal RMS is 0.05-0.3, peak should be < 0.95 (avoid clipping)
+        if rms < 0.01:
+            audio_level_score = 0.3
+            recommendations.append("⚠️ Audio level too low - speak louder or increase microphone gain")
+        elif rms < 0.05:
+            audio_level_score = 0.5 + (rms - 0.01) / 0.04 * 0.3  # 0.5 to 0.8
+            recommendations.append("💡 Audio level is low - consider speaking louder")
+        elif rms <= 0.3:
+            audio_level_score = 1.0  # Ideal range
+        else:
+            audio_level_score = 0.9  # A bit loud but OK
+        
+        # Penalize clipping
+        if peak > 0.95:
+            audio_level_score *= 0.7
+            recommendations.append("⚠️ Audio clipping detected - reduce microphone gain or speak softer")
+        
+        scores['audio_level'] = audio_level_score
+        details['rms_level'] = round(float(rms), 3)
+        details['peak_level'] = round(float(peak), 3)
+        
+        # 3. SNR Estimate (rough estimate using RMS)
+        # Calculate noise floor (use quietest 10% of frames)
+        frame_length = 2048
+        hop_length = 512
+        frames = librosa.util.frame(audio, frame_length=frame_length, hop_length=hop_length)
+        frame_rms = np.sqrt(np.mean(frames**2, axis=0))
+        noise_floor = np.percentile(frame_rms, 10)
+        
+        if noise_floor > 0:
+            snr_estimate = 20 * np.log10(rms / noise_floor) if noise_floor > 0 else 30
+        else:
+            snr_estimate = 30  # Very clean
+        
+        if snr_estimate > 20:
+            snr_score = 1.0
+        elif snr_estimate > 15:
+            snr_score = 0.8
+        elif snr_estimate > 10:
+            snr_score = 0.6
+            recommendations.append("⚠️ Moderate background noise detected - use quieter environment")
+        else:
+            snr_score = 0.4
+            recommendations.append("⚠️ High background noise - find a quieter environment")
+        
+        scores['snr'] = snr_score
+        details['snr_estimate_db'] = round(float(snr_estimate), 1)
+        
+        return {
+            'scores': scores,
+            'details': details,
+            'recommendations': recommendations
+        }
+    
     def assess_profile_quality(
         self,
         audio_file: Union[str, Path],
         embedding: np.ndarray,
         start: Optional[float] = None,
-        end: Optional[float] = None
+        end: Optional[float] = None,
+        audio_quality: Optional[Dict] = None
     ) -> Dict:
         """
         Assess the quality of an enrollment profile.
@@ -406,6 +527,8 @@ class IdentificationService:
             embedding: The extracted embedding to assess
             start: Optional start time (if segment)
             end: Optional end time (if segment)
+            audio_quality: Result of measure_audio_quality, if already
+                computed (e.g. concurrently with embedding extraction)
         
         Returns:
             Dict with:
@@ -418,66 +541,14 @@ class IdentificationService:
                 - recommendations: List of improvement suggestions
         """
         try:
-            from src.utils.audio_utils import load_audio
-            import librosa
-            
-            # Load audio
-            audio, sr = load_audio(audio_file, sample_rate=16000)
-            
-            # Extract segment if specified
-            if start is not None and end is not None:
-                start_sample = int(start * sr)
-                end_sample = int(end * sr)
-                audio = audio[start_sample:end_sample]
-            
-            duration = len(audio) / sr
-            
-            # Initialize scores
-            scores = {}
-            recommendations = []
-            details = {}
-            
-            # 1. Duration Score (30-60 seconds is ideal)
-            if duration < 10:
-                duration_score = duration / 10.0  # Linear scale up to 10s
-                recommendations.append("⚠️ Audio too short - use 30-60 seconds for best results")
-            elif duration < 30:
-                duration_score = 0.5 + (duration - 10) / 40.0  # 0.5 to 1.0
-                recommendations.append("💡 Consider using 30-60 seconds of audio for optimal quality")
-            elif duration <= 60:
-                duration_score = 1.0  # Ideal range
-            else:
-                duration_score = 0.9  # Still good, but diminishing returns
+            if audio_quality is None:
+                audio_quality = self.measure_audio_quality(audio_file, start=start, end=end)
             
-            scores['duration'] = duration_score
-            details['duration_seconds'] = round(duration, 1)
+            scores = dict(audio_quality['scores'])
+            details = dict(audio_quality['details'])
+            recommendations = list(audio_quality['recommendations'])
             
-            # 2. Audio Level Score (check for good volume and no clipping)
-            rms = np.sqrt(np.mean(audio**2))
-            peak = np.max(np.abs(audio))
-            
-            # Ideal RMS is 0.05-0.3, peak should be < 0.95 (avoid clipping)
-            if rms < 0.01:
-                audio_level_score = 0.3
-                recommendations.append("⚠️ Audio level too low - speak louder or increase microphone gain")
-            elif rms < 0.05:
-                audio_level_score = 0.5 + (rms - 0.01) / 0.04 * 0.3  # 0.5 to 0.8
-                recommendations.append("💡 Audio level is low - consider speaking louder")
-            elif rms <= 0.3:
-                audio_level_score = 1.0  # Ideal range
-            else:
-                audio_level_score = 0.9  # A bit loud but OK
-            
-            # Penalize clipping
-            if peak > 0.95:
-                audio_level_score *= 0.7
-                recommendations.append("⚠️ Audio clipping detected - reduce microphone gain or speak softer")
-            
-            scores['audio_level'] = audio_level_score
-            details['rms_level'] = round(float(rms), 3)
-            details['peak_level'] = round(float(peak), 3)
-            
-            # 3. Embedding Quality (check if embedding is well-formed)
+            # 4. Embedding Quality (check if embedding is well-formed)
             embedding_norm = np.linalg.norm(embedding)
             embedding_std = np.std(embedding)
             
@@ -503,33 +574,6 @@ class IdentificationService:
             details['embedding_norm'] = round(float(embedding_norm), 3)
             details['embedding_std'] = round(float(embedding_std), 3)
             
-            # 4. SNR Estimate (rough estimate using RMS)
-            # Calculate noise floor (use quietest 10% of frames)
-            frame_length = 2048
-            hop_length = 512
-            frames = librosa.util.frame(audio, frame_length=frame_length, hop_length=hop_length)
-            frame_rms = np.sqrt(np.mean(frames**2, axis=0))
-            noise_floor = np.percentile(frame_rms, 10)
-            
-            if noise_floor > 0:
-                snr_estimate = 20 * np.log10(rms / noise_floor) if noise_floor > 0 else 30
-            else:
-                snr_estimate = 30  # Very clean
-            
-            if snr_estimate > 20:
-                snr_score = 1.0
-            elif snr_estimate > 15:
-                snr_score = 0.8
-            elif snr_estimate > 10:
-                snr_score = 0.6
-                recommendations.append("⚠️ Moderate background noise detected - use quieter environment")
-            else:
-                snr_score = 0.4
-                recommendations.append("⚠️ High background noise - find a quieter environment")
-            
-            scores['snr'] = snr_score
-            details['snr_estimate_db'] = round(float(snr_estimate), 1)
-            
             # 5. Calculate Overall Score (weighted average)
             weights = {
                 'duration': 0.25,
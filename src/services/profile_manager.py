@@ -5,29 +5,67 @@ Manages speaker profiles including creation, storage, retrieval, and deletion.
 Profiles contain speaker embeddings and metadata for identification.
 """
 
+import base64
 import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 import numpy as np
 from src.config.config_manager import get_config
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Component scores shown for a profile's quality assessment
+QUALITY_SCORE_FIELDS = ("duration_score", "audio_level_score", "embedding_score", "snr_score")
+
+
+def format_quality_display(quality: Dict) -> Dict[str, str]:
+    """
+    Format a quality assessment's scores for display.
+    
+    Args:
+        quality: Result of IdentificationService.assess_profile_quality
+    
+    Returns:
+        Dictionary with 'overall' (2 decimals), 'overall_percent', and one
+        2-decimal string per component score present in quality
+    """
+    overall_score = quality.get("overall_score", 0)
+    display = {
+        "overall": f"{overall_score:.2f}",
+        "overall_percent": f"{overall_score:.0%}"
+    }
+    
+    for field in QUALITY_SCORE_FIELDS:
+        if field in quality:
+            display[field] = f"{quality[field]:.2f}"
+    
+    return display
+
 
 class ProfileManager:
     """
     Manages speaker profiles with embeddings and metadata.
     
     Profiles are stored as JSON files in the profiles directory.
+    
+    One instance may be shared across threads and Streamlit sessions: the
+    only mutable state is the profile summary cache, which is swapped in
+    whole after each directory scan. Each profile is a separate file;
+    concurrent writes to the same profile are last-writer-wins.
     """
     
     def __init__(self):
         """Initialize profile manager."""
         self.config = get_config()
         self.profiles_dir = self.config.profiles_dir
+        
+        # Profile summaries keyed by path, with the file (mtime, size) they were read at
+        self._summaries: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
+        
         logger.info(f"Profile manager initialized (dir={self.profiles_dir})")
     
     def create_profile(
@@ -77,9 +115,11 @@ class ProfileManager:
             # Add embedding shape info
             profile["metadata"]["embedding_shape"] = embedding.shape[0]
             
-            # Add quality assessment if provided in metadata
+            # Add quality assessment if provided in metadata, with its
+            # display strings formatted once here instead of on every render
             if metadata and "quality" in metadata:
-                profile["quality"] = metadata["quality"]
+                quality = metadata["quality"]
+                profile["quality"] = {**quality, "display": format_quality_display(quality)}
             
             # Save to file
             self._save_profile(profile)
@@ -115,7 +155,7 @@ class ProfileManager:
                 profile = json.load(f)
             
             # Convert embedding back to numpy array
-            profile["embedding"] = np.array(profile["embedding"])
+            profile["embedding"] = decode_embedding(profile)
             
             logger.debug(f"Loaded profile: {profile['name']} (ID={profile_id})")
             
@@ -156,23 +196,33 @@ class ProfileManager:
                 - 'metadata': Metadata dict
         """
         profiles = []
+        summaries = {}
         
         try:
             for profile_path in self.profiles_dir.glob("*.json"):
                 try:
-                    with open(profile_path, 'r') as f:
-                        profile = json.load(f)
+                    # Only re-parse files that changed since the last scan
+                    stat = profile_path.stat()
+                    version = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._summaries.get(profile_path)
                     
-                    # Return summary without embedding (for performance)
-                    summary = {
-                        "id": profile["id"],
-                        "name": profile["name"],
-                        "created_date": profile["created_date"],
-                        "metadata": profile.get("metadata", {}),
-                        "quality": profile.get("quality", {})  # Include quality info
-                    }
+                    if cached is not None and cached[0] == version:
+                        summary = cached[1]
+                    else:
+                        with open(profile_path, 'r') as f:
+                            profile = json.load(f)
+                        
+                        # Return summary without embedding (for performance)
+                        summary = {
+                            "id": profile["id"],
+                            "name": profile["name"],
+                            "created_date": profile["created_date"],
+                            "metadata": profile.get("metadata", {}),
+                            "quality": profile.get("quality", {})  # Include quality info
+                        }
                     
-                    profiles.append(summary)
+                    summaries[profile_path] = (version, summary)
+                    profiles.append(dict(summary))
                     
                 except Exception as e:
                     logger.warning(f"Failed to load profile {profile_path}: {e}")
@@ -183,6 +233,8 @@ class ProfileManager:
         except Exception as e:
             logger.error(f"Failed to list profiles: {e}")
         
+        self._summaries = summaries
+        
         # Sort by name
         profiles.sort(key=lambda p: p["name"].lower())
         
@@ -323,16 +375,20 @@ class ProfileManager:
             ValueError: If profile cannot be saved
         """
         try:
-            # Convert numpy array to list if present
+            # Store the embedding as base64 int8 rather than a float list
             profile_to_save = profile.copy()
-            if isinstance(profile_to_save.get("embedding"), np.ndarray):
-                profile_to_save["embedding"] = profile_to_save["embedding"].tolist()
+            embedding = profile_to_save.pop("embedding", None)
+            if embedding is not None:
+                profile_to_save.update(encode_embedding(embedding))
             
-            # Save to file
+            # Write to a temp file and rename over the target, so readers never
+            # see a partial file and every save bumps the directory mtime
             profile_path = self.profiles_dir / f"{profile['id']}.json"
+            tmp_path = profile_path.with_suffix(".json.tmp")
             
-            with open(profile_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(profile_to_save, f, indent=2)
+            os.replace(tmp_path, profile_path)
             
             logger.debug(f"Saved profile to: {profile_path}")
             
@@ -352,19 +408,15 @@ class ProfileManager:
             ValueError: If export fails
         """
         try:
-            profile = self.load_profile(profile_id)
+            content = self.export_profile_json(profile_id)
             output_path = Path(output_path)
             
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Convert embedding to list for JSON
-            if isinstance(profile["embedding"], np.ndarray):
-                profile["embedding"] = profile["embedding"].tolist()
-            
             # Save
             with open(output_path, 'w') as f:
-                json.dump(profile, f, indent=2)
+                f.write(content)
             
             logger.info(f"Exported profile to: {output_path}")
             
@@ -372,6 +424,27 @@ class ProfileManager:
             logger.error(f"Failed to export profile {profile_id}: {e}")
             raise ValueError(f"Cannot export profile: {e}")
     
+    def export_profile_json(self, profile_id: str) -> str:
+        """
+        Serialize a profile in the export format without touching disk.
+        
+        Args:
+            profile_id: Profile ID to export
+        
+        Returns:
+            Profile as an indented JSON string (importable via import_profile)
+        
+        Raises:
+            ValueError: If the profile cannot be loaded
+        """
+        profile = self.load_profile(profile_id)
+        
+        # Convert embedding to list for JSON
+        if isinstance(profile["embedding"], np.ndarray):
+            profile["embedding"] = profile["embedding"].tolist()
+        
+        return json.dumps(profile, indent=2)
+    
     def import_profile(self, input_path: Union[str, Path]) -> Dict:
         """
         Import profile from a JSON file.
@@ -391,9 +464,10 @@ class ProfileManager:
             with open(input_path, 'r') as f:
                 profile = json.load(f)
             
-            # Validate required fields
-            required_fields = ["name", "embedding"]
-            missing = [f for f in required_fields if f not in profile]
+            # Validate required fields (accept exports and stored profile files)
+            missing = [f for f in ("name",) if f not in profile]
+            if "embedding" not in profile and "emb_q" not in profile:
+                missing.append("embedding")
             if missing:
                 raise ValueError(f"Missing required fields: {missing}")
             
@@ -402,7 +476,7 @@ class ProfileManager:
                 profile["id"] = str(uuid.uuid4())
             
             # Convert embedding to numpy array
-            profile["embedding"] = np.array(profile["embedding"])
+            profile["embedding"] = decode_embedding(profile)
             
             # Save profile
             self._save_profile(profile)
@@ -414,3 +488,51 @@ class ProfileManager:
         except Exception as e:
             logger.error(f"Failed to import profile from {input_path}: {e}")
             raise ValueError(f"Cannot import profile: {e}")
+
+
+def encode_embedding(embedding: Union[np.ndarray, List[float]]) -> Dict:
+    """
+    Quantize an embedding to int8 with a per-vector scale for storage.
+    
+    Cosine similarity between speaker embeddings is essentially unchanged
+    by int8 rounding, and profile files shrink roughly 10x compared to a
+    JSON float list.
+    
+    Args:
+        embedding: Embedding vector
+    
+    Returns:
+        Dictionary with 'emb_q' (base64 int8 bytes), 'emb_scale' and 'emb_dim'
+    """
+    embedding = np.asarray(embedding, dtype=np.float32).ravel()
+    peak = float(np.abs(embedding).max()) if embedding.size else 0.0
+    scale = peak / 127 if peak > 0 else 1.0
+    quantized = np.round(embedding / scale).astype(np.int8)
+    
+    return {
+        "emb_q": base64.b64encode(quantized.tobytes()).decode("ascii"),
+        "emb_scale": scale,
+        "emb_dim": int(quantized.size)
+    }
+
+
+def decode_embedding(profile: Dict) -> np.ndarray:
+    """
+    Restore a profile's embedding as a float array.
+    
+    Reads the int8 storage fields (removing them from the dict) and falls
+    back to a plain 'embedding' list for profiles saved before quantization.
+    
+    Args:
+        profile: Profile dictionary as read from JSON
+    
+    Returns:
+        Embedding vector
+    """
+    if "emb_q" in profile:
+        quantized = np.frombuffer(base64.b64decode(profile.pop("emb_q")), dtype=np.int8)
+        scale = profile.pop("emb_scale")
+        profile.pop("emb_dim", None)
+        return quantized.astype(np.float32) * np.float32(scale)
+    
+    return np.array(profile["embedding"])
@@ -0,0 +1,174 @@
+"""
+REST Transcription Client for Azure Speech short-audio recognition.
+
+Sends clips of up to 60 seconds to the short-audio REST endpoint over a
+pooled keep-alive HTTP connection, avoiding the SDK's per-recognition
+WebSocket handshake.
+"""
+
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+from src.config.config_manager import get_config
+from src.utils.logger import get_logger
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = get_logger(__name__)
+
+# The short-audio endpoint rejects anything longer than 60 seconds;
+# stay a little below to leave headroom for resampling rounding
+REST_MAX_SECONDS = 58.0
+
+# Bytes sent per chunk of the chunked-transfer upload
+UPLOAD_CHUNK_BYTES = 32 * 1024
+
+RECOGNITION_PATH = "/speech/recognition/conversation/cognitiveservices/v1"
+
+
+class TranscriptionRestClient:
+    """
+    Async client for the Azure Speech short-audio REST API.
+    
+    Use as an async context manager so the connection pool is closed:
+    
+        async with TranscriptionRestClient() as client:
+            result = await client.transcribe(pcm, language="en-US")
+    """
+    
+    def __init__(self):
+        """
+        Initialize REST client.
+        
+        Raises:
+            RuntimeError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise RuntimeError(
+                "aiohttp is required for REST transcription: pip install aiohttp"
+            )
+        
+        self.config = get_config()
+        self.url = self._build_url()
+        self._session: Optional["aiohttp.ClientSession"] = None
+    
+    def _build_url(self) -> str:
+        """
+        Build the recognition URL for the configured deployment.
+        
+        Returns:
+            Recognition endpoint URL
+        """
+        if self.config.azure_mode == "container":
+            # Containers serve REST on the same host as the SDK endpoint
+            endpoint = urlparse(self.config.azure_endpoint or "")
+            scheme = "https" if endpoint.scheme in ("https", "wss") else "http"
+            return f"{scheme}://{endpoint.netloc}{RECOGNITION_PATH}"
+        
+        return f"https://{self.config.azure_region}.stt.speech.microsoft.com{RECOGNITION_PATH}"
+    
+    async def __aenter__(self) -> "TranscriptionRestClient":
+        connector = aiohttp.TCPConnector(
+            limit=self.config.azure_concurrency,
+            keepalive_timeout=60
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def transcribe(self, pcm: bytes, language: str = "en-US") -> Dict:
+        """
+        Transcribe a short clip of 16 kHz mono 16-bit PCM.
+        
+        Args:
+            pcm: Raw little-endian 16-bit PCM samples at 16 kHz
+            language: Language code
+        
+        Returns:
+            Dictionary containing 'text', 'confidence', 'duration' and 'language'
+        
+        Raises:
+            RuntimeError: If the request fails or the service reports an error
+        """
+        if self._session is None:
+            raise RuntimeError("REST client session is not open")
+        
+        headers = {
+            "Ocp-Apim-Subscription-Key": self.config.azure_speech_key,
+            "Content-Type": "audio/wav; codecs=audio/pcm; samplerate=16000",
+            "Accept": "application/json"
+        }
+        params = {"language": language, "format": "detailed"}
+        
+        try:
+            # An async generator body makes aiohttp use chunked transfer
+            async with self._session.post(
+                self.url,
+                params=params,
+                headers=headers,
+                data=self._chunks(pcm)
+            ) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise RuntimeError(f"HTTP {response.status}: {body[:200]}")
+                details = await response.json()
+        
+        except aiohttp.ClientError as e:
+            logger.error(f"REST transcription request failed: {e}")
+            raise RuntimeError(f"Cannot transcribe audio: {e}")
+        
+        return self._parse_result(details, language)
+    
+    @staticmethod
+    async def _chunks(pcm: bytes) -> AsyncIterator[bytes]:
+        """Yield the PCM payload in upload-sized chunks."""
+        view = memoryview(pcm)
+        for offset in range(0, len(view), UPLOAD_CHUNK_BYTES):
+            yield bytes(view[offset:offset + UPLOAD_CHUNK_BYTES])
+    
+    @staticmethod
+    def _parse_result(details: Dict, language: str) -> Dict:
+        """
+        Convert a detailed REST response into a transcription result.
+        
+        Args:
+            details: Parsed JSON response
+            language: Language code used
+        
+        Returns:
+            Transcription result dictionary
+        
+        Raises:
+            RuntimeError: If the service reports a recognition error
+        """
+        status = details.get("RecognitionStatus")
+        
+        if status == "Success":
+            best = (details.get("NBest") or [{}])[0]
+            return {
+                "text": best.get("Display", details.get("DisplayText", "")),
+                "confidence": best.get("Confidence", 0.5),
+                "duration": details.get("Duration", 0) / 10_000_000,
+                "language": language
+            }
+        
+        if status in ("NoMatch", "InitialSilenceTimeout", "BabbleTimeout"):
+            logger.debug(f"No speech recognized ({status})")
+            return {
+                "text": "",
+                "confidence": 0.0,
+                "duration": 0.0,
+                "language": language
+            }
+        
+        raise RuntimeError(f"Transcription error: {status}")
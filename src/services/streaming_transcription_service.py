@@ -11,6 +11,7 @@ import azure.cognitiveservices.speech as speechsdk
 import numpy as np
 from typing import Optional, Callable, Dict
 from pathlib import Path
+from src.services.transcription_service import extract_confidence
 
 logger = logging.getLogger(__name__)
 
@@ -254,18 +255,4 @@ class StreamingTranscriptionService:
         Returns:
             Confidence score (0.0-1.0)
         """
-        try:
-            import json
-            
-            # Get JSON details
-            json_result = json.loads(result.json)
-            
-            # Extract confidence from NBest
-            if "NBest" in json_result and len(json_result["NBest"]) > 0:
-                return json_result["NBest"][0].get("Confidence", 0.0)
-            
-            return 0.5  # Default if not available
-            
-        except Exception as e:
-            logger.debug(f"Could not extract confidence: {e}")
-            return 0.5
+        return extract_confidence(result.json)
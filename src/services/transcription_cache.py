@@ -0,0 +1,156 @@
+"""
+Transcription Cache for Speaker Diarization System.
+
+Caches transcription results keyed by a hash of the exact PCM sent to Azure,
+so repeated utterances skip the service round-trip. An in-memory LRU sits in
+front of an optional on-disk shelf that survives restarts.
+"""
+
+import atexit
+import hashlib
+import shelve
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# One cache per shelf path in this process; see get_shared_cache
+_shared_caches: Dict[Optional[str], "TranscriptionCache"] = {}
+_shared_lock = threading.Lock()
+
+
+class TranscriptionCache:
+    """
+    Thread-safe LRU cache of transcription results.
+    
+    Keys combine a BLAKE2b digest of the 16-bit PCM with the language code.
+    """
+    
+    def __init__(self, max_size: int = 4096, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize transcription cache.
+        
+        Args:
+            max_size: Maximum entries kept in memory
+            path: Optional shelf file for persistence across restarts
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._shelf = None
+        
+        if path is not None:
+            try:
+                self._shelf = shelve.open(str(path))
+                logger.debug(f"Transcription cache persisted to: {path}")
+            except Exception as e:
+                logger.warning(f"Transcription cache persistence disabled: {e}")
+    
+    @staticmethod
+    def make_key(pcm: bytes, language: str) -> str:
+        """
+        Build the cache key for a PCM buffer.
+        
+        Args:
+            pcm: Exact PCM bytes sent to Azure
+            language: Language code
+        
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.blake2b(pcm, digest_size=16).hexdigest()
+        return f"{language}:{digest}"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Key from make_key
+        
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return dict(result)
+            
+            if self._shelf is not None:
+                try:
+                    result = self._shelf.get(key)
+                except Exception as e:
+                    logger.debug(f"Transcription cache read failed: {e}")
+                    result = None
+                
+                if result is not None:
+                    self._remember(key, result)
+                    return dict(result)
+        
+        return None
+    
+    def put(self, key: str, result: Dict) -> None:
+        """
+        Store a result.
+        
+        Args:
+            key: Key from make_key
+            result: Transcription result (copied before storing)
+        """
+        result = dict(result)
+        
+        with self._lock:
+            self._remember(key, result)
+            
+            if self._shelf is not None:
+                try:
+                    self._shelf[key] = result
+                    self._shelf.sync()
+                except Exception as e:
+                    logger.debug(f"Transcription cache write failed: {e}")
+    
+    def _remember(self, key: str, result: Dict) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def close(self) -> None:
+        """Close the persistent shelf, if any."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
+
+def get_shared_cache(max_size: int = 4096, path: Optional[Union[str, Path]] = None) -> TranscriptionCache:
+    """
+    Get the process-wide cache for a shelf path, creating it on first use.
+    
+    Every TranscriptionService (one per processor, two per Streamlit
+    session) shares one cache per path. Separate shelve handles on the
+    same file overwrite each other's index (dbm.dumb) or fail to open
+    (gdbm). The shelf is closed when the process exits.
+    
+    Args:
+        max_size: Maximum entries kept in memory (used on first creation)
+        path: Optional shelf file for persistence across restarts
+    
+    Returns:
+        Shared TranscriptionCache instance
+    """
+    key = str(path) if path is not None else None
+    
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = TranscriptionCache(max_size=max_size, path=path)
+            _shared_caches[key] = cache
+            atexit.register(cache.close)
+    
+    return cache
@@ -5,121 +5,353 @@ Provides speech-to-text transcription functionality with support for
 both cloud and container deployments.
 """
 
+import asyncio
+import bisect
+import io
+import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 import azure.cognitiveservices.speech as speechsdk
 import numpy as np
+from math import gcd
 from pathlib import Path
-from typing import List, Dict, Union, Optional
+from scipy.signal import resample_poly
+from typing import Any, Callable, Iterable, List, Dict, NamedTuple, Tuple, Union, Optional
 from src.config.config_manager import get_config
+from src.services.transcription_cache import TranscriptionCache, get_shared_cache
+from src.services.rest_transcription_client import TranscriptionRestClient, REST_MAX_SECONDS
 from src.utils.logger import get_logger
 from src.utils.audio_utils import (
     validate_audio_file,
     load_audio,
+    load_audio_segment,
     extract_segment,
-    save_audio
+    PCMPool
 )
 
+try:
+    import orjson as _json  # 2-5x faster parsing of detailed results
+except ImportError:
+    import json as _json
+
 logger = get_logger(__name__)
 
+# First NBest confidence in a detailed result, matched without parsing the
+# whole document (word timings can make it tens of KB)
+_CONFIDENCE_RE = re.compile(r'"NBest"\s*:\s*\[\s*\{[^{}]*?"Confidence"\s*:\s*([0-9.eE+-]+)')
 
-class TranscriptionService:
-    """
-    Service for speech-to-text transcription using Azure Speech Service.
+# Retries after Azure throttles a request ("Too many requests")
+THROTTLE_MAX_RETRIES = 5
+
+# Upper bound on the backoff between throttle retries (seconds)
+THROTTLE_MAX_DELAY = 30.0
+
+# Native input format of Azure speech recognition (16 kHz, 16-bit, mono)
+AZURE_SAMPLE_RATE = 16000
+
+# Audio written to a push stream per write() call; ~750 ms windows balance
+# SDK per-write overhead against recognition latency
+PUSH_CHUNK_SECONDS = 0.75
+PUSH_CHUNK_BYTES = int(AZURE_SAMPLE_RATE * PUSH_CHUNK_SECONDS) * 2  # 16-bit samples
+
+# Azure reports offsets and durations in 100-nanosecond ticks
+TICKS_PER_SECOND = 10_000_000
+
+# Segments up to this length use single-shot recognition and are eligible
+# for batched recognition; longer ones use continuous recognition
+SHORT_SEGMENT_SECONDS = 10.0
+
+# Silence that ends a phrase (ms). Hebrew speech needs a long timeout to
+# avoid mid-sentence cuts
+SEGMENTATION_SILENCE_MS = 1500
+
+# Batched sessions end phrases sooner, so a phrase never runs across the
+# silence between two segments
+BATCH_SEGMENTATION_SILENCE_MS = 500
+
+# Silence inserted between batched segments (seconds); kept well above
+# BATCH_SEGMENTATION_SILENCE_MS so Azure always closes the phrase in the gap
+BATCH_SILENCE_GAP = 1.0
+
+
+class _SpeechSettings(NamedTuple):
+    """Config values that determine a SpeechConfig (the cache key)."""
     
-    Supports both cloud and container deployments.
-    """
+    mode: str
+    endpoint: Optional[str]
+    region: str
+    key: str
+    throttle_percent: int
+    transmit_before_throttle_ms: int
+    max_buffer_seconds: int
+    enable_dictation: bool
+    sentence_boundary: bool
+    word_timestamps: bool
     
-    def __init__(self):
-        """Initialize transcription service."""
-        self.config = get_config()
-        self.speech_config = self._create_speech_config()
-        logger.info(
-            f"Transcription service initialized "
-            f"(mode={self.config.azure_mode}, region={self.config.azure_region})"
+    @classmethod
+    def from_config(cls, config) -> "_SpeechSettings":
+        """Snapshot the relevant settings from a ConfigManager."""
+        return cls(
+            mode=config.azure_mode,
+            endpoint=config.azure_endpoint,
+            region=config.azure_region,
+            key=config.azure_speech_key,
+            throttle_percent=config.azure_container_throttle_percent,
+            transmit_before_throttle_ms=config.azure_container_transmit_before_throttle_ms,
+            max_buffer_seconds=config.azure_container_max_buffer_seconds,
+            enable_dictation=config.azure_enable_dictation,
+            sentence_boundary=config.azure_sentence_boundary,
+            word_timestamps=config.azure_word_timestamps
         )
     
-    def _create_speech_config(self) -> speechsdk.SpeechConfig:
-        """
-        Create Azure Speech SDK configuration.
-        
-        Returns:
-            Configured SpeechConfig instance
-        
-        Raises:
-            RuntimeError: If configuration fails
-        """
-        try:
-            if self.config.azure_mode == "container":
-                # Container mode
-                if not self.config.azure_endpoint:
-                    raise ValueError(
-                        "AZURE_ENDPOINT must be set for container mode"
-                    )
-                
-                speech_config = speechsdk.SpeechConfig(
-                    subscription=self.config.azure_speech_key,
-                    endpoint=self.config.azure_endpoint
-                )
-                logger.info(f"Using container endpoint: {self.config.azure_endpoint}")
-                
-            else:
-                # Cloud mode
-                speech_config = speechsdk.SpeechConfig(
-                    subscription=self.config.azure_speech_key,
-                    region=self.config.azure_region
+    def __repr__(self) -> str:
+        # Never print the subscription key
+        return f"_SpeechSettings(mode={self.mode!r}, region={self.region!r})"
+
+
+@lru_cache(maxsize=16)
+def _build_speech_config(
+    settings: "_SpeechSettings",
+    language: str,
+    segmentation_silence_ms: int = SEGMENTATION_SILENCE_MS
+) -> speechsdk.SpeechConfig:
+    """
+    Create Azure Speech SDK configuration.
+    
+    Cached at module scope, so every service instance (e.g. one per
+    Streamlit session) shares the same immutable config per language.
+    
+    Args:
+        settings: Connection and output settings from ConfigManager
+        language: Recognition language; language-specific tweaks are
+            applied here so the config never needs mutating later
+        segmentation_silence_ms: Silence that ends a phrase (ms)
+    
+    Returns:
+        Configured SpeechConfig instance
+    
+    Raises:
+        RuntimeError: If configuration fails
+    """
+    try:
+        if settings.mode == "container":
+            # Container mode
+            if not settings.endpoint:
+                raise ValueError(
+                    "AZURE_ENDPOINT must be set for container mode"
                 )
-                logger.info(f"Using cloud region: {self.config.azure_region}")
             
-            # Set output format to detailed
-            speech_config.output_format = speechsdk.OutputFormat.Detailed
+            speech_config = speechsdk.SpeechConfig(
+                subscription=settings.key,
+                endpoint=settings.endpoint
+            )
+            logger.info(f"Using container endpoint: {settings.endpoint}")
             
-            # Enable profanity filter (can be disabled if needed)
-            speech_config.set_profanity(speechsdk.ProfanityOption.Masked)
+            # Containers throttle audio to ~2x real time by default;
+            # raise the limit for offline (pre-recorded) processing
+            throttle_percent = settings.throttle_percent
+            if throttle_percent > 0:
+                speech_config.set_property_by_name(
+                    "SPEECH-AudioThrottleAsPercentageOfRealTime",
+                    str(throttle_percent)
+                )
+                speech_config.set_property_by_name(
+                    "SPEECH-TransmitLengthBeforThrottleMs",  # SDK spelling
+                    str(settings.transmit_before_throttle_ms)
+                )
+                speech_config.set_property_by_name(
+                    "SPEECH-MaxBufferSizeSeconds",
+                    str(settings.max_buffer_seconds)
+                )
+                logger.info(f"Container throttle set to {throttle_percent}% of real time")
             
-            # Enable punctuation for better readability
+        else:
+            # Cloud mode
+            speech_config = speechsdk.SpeechConfig(
+                subscription=settings.key,
+                region=settings.region
+            )
+            logger.info(f"Using cloud region: {settings.region}")
+        
+        # Set output format to detailed
+        speech_config.output_format = speechsdk.OutputFormat.Detailed
+        
+        # Enable profanity filter (can be disabled if needed)
+        speech_config.set_profanity(speechsdk.ProfanityOption.Masked)
+        
+        # Dictation mode (spoken punctuation) - opt-in
+        if settings.enable_dictation:
             speech_config.enable_dictation()
-            
-            # Optimize for accuracy in continuous speech recognition
-            # Enable sentence boundary detection
+        
+        # Sentence boundary detection - opt-in, nothing here consumes it
+        if settings.sentence_boundary:
             speech_config.set_property(
                 speechsdk.PropertyId.SpeechServiceResponse_RequestSentenceBoundary,
                 "true"
             )
+        
+        # Enable automatic punctuation (improves accuracy)
+        speech_config.set_property(
+            speechsdk.PropertyId.SpeechServiceResponse_ProfanityOption,
+            "masked"
+        )
+        
+        # Set segmentation silence timeout (in milliseconds)
+        speech_config.set_property(
+            speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
+            str(segmentation_silence_ms)
+        )
+        
+        # Word-level timing (useful for debugging) - opt-in, since it
+        # roughly doubles the JSON payload per phrase
+        if settings.word_timestamps:
+            speech_config.request_word_level_timestamps()
+        
+        # Set initial silence timeout (how long to wait before starting recognition)
+        speech_config.set_property(
+            speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs,
+            "5000"  # 5 seconds - give time for speech to start
+        )
+        
+        # Set end silence timeout (for better phrase detection)
+        # Increased to 2 seconds to capture complete sentences
+        speech_config.set_property(
+            speechsdk.PropertyId.SpeechServiceConnection_EndSilenceTimeoutMs,
+            "2000"  # 2 seconds of silence at end
+        )
+        
+        # Set language
+        speech_config.speech_recognition_language = language
+        
+        # Hebrew-specific optimizations for better accuracy
+        if language == "he-IL":
+            # Disable profanity filter for Hebrew (can misinterpret words)
+            speech_config.set_profanity(speechsdk.ProfanityOption.Raw)
             
-            # Enable automatic punctuation (improves accuracy)
+            # Enable diacritics for Hebrew (niqqud) - improves accuracy
             speech_config.set_property(
-                speechsdk.PropertyId.SpeechServiceResponse_ProfanityOption,
-                "masked"
+                speechsdk.PropertyId.SpeechServiceResponse_RequestWordLevelTimestamps,
+                "true"
             )
             
-            # Set segmentation silence timeout (in milliseconds)
-            # For Hebrew speech, need longer timeout to avoid mid-sentence cuts
-            # Increased from 800ms to 1500ms for complete phrases
+            # Enable language detection for better Hebrew recognition
             speech_config.set_property(
-                speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs,
-                "1500"  # 1.5s of silence before considering phrase ended
+                speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
+                "Continuous"
             )
             
-            # Enable word-level timing (useful for debugging)
-            speech_config.request_word_level_timestamps()
-            
-            # Set initial silence timeout (how long to wait before starting recognition)
-            speech_config.set_property(
-                speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs,
-                "5000"  # 5 seconds - give time for speech to start
+            logger.debug("Applied Hebrew-specific optimizations (disabled profanity filter, enabled diacritics)")
+        
+        return speech_config
+        
+    except Exception as e:
+        logger.error(f"Failed to create speech config: {e}")
+        raise RuntimeError(f"Cannot create speech configuration: {e}")
+
+
+
+class TranscriptionService:
+    """
+    Service for speech-to-text transcription using Azure Speech Service.
+    
+    Supports both cloud and container deployments.
+    """
+    
+    def __init__(self):
+        """Initialize transcription service."""
+        self.config = get_config()
+        
+        # Key for the module-level SpeechConfig cache. Configs are never
+        # mutated after creation, so recognizers on different threads and
+        # service instances can share them safely.
+        self._speech_settings = _SpeechSettings.from_config(self.config)
+        
+        # Caps in-flight recognitions across all threads using this service
+        self._rate_limiter = threading.Semaphore(self.config.azure_concurrency)
+        
+        # Reusable int16 output and float32 working buffers for PCM encoding
+        self._pcm_pool = PCMPool(max_buffers=self.config.azure_concurrency)
+        self._scratch_pool = PCMPool(max_buffers=self.config.azure_concurrency, dtype=np.float32)
+        
+        # Results for identical segment audio, keyed by PCM hash; shared by
+        # every service in the process so the shelf is opened only once
+        self._cache: Optional[TranscriptionCache] = None
+        if self.config.transcription_cache_size > 0:
+            self._cache = get_shared_cache(
+                max_size=self.config.transcription_cache_size,
+                path=(
+                    self.config.temp_dir / ".trans_cache"
+                    if self.config.transcription_cache_persist else None
+                )
             )
-            
-            # Set end silence timeout (for better phrase detection)
-            # Increased to 2 seconds to capture complete sentences
-            speech_config.set_property(
-                speechsdk.PropertyId.SpeechServiceConnection_EndSilenceTimeoutMs,
-                "2000"  # 2 seconds of silence at end
+        
+        # Build the default config eagerly so misconfiguration fails fast
+        self._get_speech_config("en-US")
+        
+        # Optionally open and close a throwaway connection in the background
+        # so DNS lookup and TLS setup are cached before the first segment
+        if self.config.azure_prewarm:
+            threading.Thread(
+                target=self._prewarm_connection,
+                name="azure-prewarm",
+                daemon=True
+            ).start()
+        
+        logger.info(
+            f"Transcription service initialized "
+            f"(mode={self.config.azure_mode}, region={self.config.azure_region})"
+        )
+    
+    def _prewarm_connection(self) -> None:
+        """
+        Open and close a recognizer connection ahead of the first transcription.
+        
+        Only DNS and TLS state is warmed; recognitions still open their own
+        connections. Nothing is held open afterwards. Failures are logged
+        and ignored; the first request then simply pays the handshake itself.
+        """
+        try:
+            stream = speechsdk.audio.PushAudioInputStream(
+                speechsdk.audio.AudioStreamFormat(
+                    samples_per_second=AZURE_SAMPLE_RATE,
+                    bits_per_sample=16,
+                    channels=1
+                )
             )
-            
-            return speech_config
+            recognizer = speechsdk.SpeechRecognizer(
+                speech_config=self._get_speech_config("en-US"),
+                audio_config=speechsdk.audio.AudioConfig(stream=stream)
+            )
+            connection = speechsdk.Connection.from_recognizer(recognizer)
+            connection.open(True)
+            connection.close()
+            stream.close()
+            logger.debug("Pre-warmed Azure speech connection")
             
         except Exception as e:
-            logger.error(f"Failed to create speech config: {e}")
-            raise RuntimeError(f"Cannot create speech configuration: {e}")
+            logger.warning(f"Could not pre-warm Azure speech connection: {e}")
+    
+    def _get_speech_config(
+        self,
+        language: str,
+        segmentation_silence_ms: int = SEGMENTATION_SILENCE_MS
+    ) -> speechsdk.SpeechConfig:
+        """
+        Get the cached speech configuration for a language.
+        
+        Args:
+            language: Language code
+            segmentation_silence_ms: Silence that ends a phrase (ms)
+        
+        Returns:
+            Configured SpeechConfig instance
+        """
+        return _build_speech_config(self._speech_settings, language, segmentation_silence_ms)
     
     def transcribe_file(
         self,
@@ -154,48 +386,86 @@ class TranscriptionService:
         
         logger.info(f"Transcribing file: {audio_file.name} (language={language}, continuous={use_continuous})")
         
-        try:
-            # Set language
-            self.speech_config.speech_recognition_language = language
-            
-            # Hebrew-specific optimizations for better accuracy
-            if language == "he-IL":
-                # Disable profanity filter for Hebrew (can misinterpret words)
-                self.speech_config.set_profanity(speechsdk.ProfanityOption.Raw)
-                
-                # Enable diacritics for Hebrew (niqqud) - improves accuracy
-                self.speech_config.set_property(
-                    speechsdk.PropertyId.SpeechServiceResponse_RequestWordLevelTimestamps,
-                    "true"
-                )
-                
-                # Use detailed output format for better confidence scores
-                self.speech_config.output_format = speechsdk.OutputFormat.Detailed
-                
-                # Enable language detection for better Hebrew recognition
-                self.speech_config.set_property(
-                    speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
-                    "Continuous"
-                )
-                
-                logger.debug("Applied Hebrew-specific optimizations (disabled profanity filter, enabled diacritics)")
-            
-            # Create audio config
-            audio_config = speechsdk.audio.AudioConfig(filename=str(audio_file))
+        # Audio config is consumed by a recognition, so build one per attempt
+        return self._with_retry(
+            lambda: self._recognize(
+                speechsdk.audio.AudioConfig(filename=str(audio_file)),
+                language=language,
+                use_continuous=use_continuous
+            )
+        )
+    
+    def _with_retry(self, func: Callable[[], Any]) -> Any:
+        """
+        Run a recognition call, retrying when Azure throttles it.
+        
+        Each attempt holds a rate-limiter slot; backoff sleeps do not.
+        Retries use jittered exponential backoff capped at
+        THROTTLE_MAX_DELAY. Non-throttling errors propagate immediately.
+        
+        Args:
+            func: Zero-argument callable that builds its own audio input
+                and performs the recognition
+        
+        Returns:
+            Whatever func returns; result dicts (or lists of them) get a
+            'retries' count. A final failure carries the count as the
+            exception's 'retries' attribute.
+        """
+        for attempt in range(THROTTLE_MAX_RETRIES + 1):
+            with self._rate_limiter:
+                try:
+                    result = func()
+                except Exception as e:
+                    if attempt == THROTTLE_MAX_RETRIES or not _is_throttled(e):
+                        e.retries = attempt
+                        raise
+                else:
+                    for item in (result if isinstance(result, list) else [result]):
+                        if isinstance(item, dict):
+                            item["retries"] = attempt
+                    return result
             
-            # Create speech recognizer
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config,
-                audio_config=audio_config
+            delay = min(THROTTLE_MAX_DELAY, 0.5 * 2 ** attempt) + random.random() * 0.5
+            logger.warning(
+                f"Azure throttled the request, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{THROTTLE_MAX_RETRIES})"
             )
+            time.sleep(delay)
+    
+    def _recognize(
+        self,
+        audio_config: speechsdk.audio.AudioConfig,
+        language: str = "en-US",
+        use_continuous: bool = False
+    ) -> Dict:
+        """
+        Run recognition on an already-built audio config.
+        
+        Shared by file-based and in-memory (push stream) transcription.
+        
+        Args:
+            audio_config: Audio input (file or push stream)
+            language: Language code (e.g., 'en-US', 'es-ES')
+            use_continuous: If True, use continuous recognition for longer speech
+        
+        Returns:
+            Dictionary with transcription results
+        
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        try:
+            recognizer = self._create_recognizer(audio_config, language)
             
             # Use continuous recognition for longer segments
             if use_continuous:
-                return self._transcribe_continuous(recognizer)
+                return self._transcribe_continuous(recognizer, language)
             
-            # Otherwise use single-shot recognition with extended timeout
-            # Perform recognition
-            result = recognizer.recognize_once()
+            # Otherwise use single-shot recognition with extended timeout.
+            # The async variant returns as soon as the request is queued
+            # inside the SDK; we only block on the final result.
+            result = recognizer.recognize_once_async().get()
             
             # Process result
             if result.reason == speechsdk.ResultReason.RecognizedSpeech:
@@ -231,8 +501,10 @@ class TranscriptionService:
                 cancellation = result.cancellation_details
                 logger.error(f"Transcription canceled: {cancellation.reason}")
                 if cancellation.reason == speechsdk.CancellationReason.Error:
-                    raise RuntimeError(
-                        f"Transcription error: {cancellation.error_details}"
+                    raise _recognition_error(
+                        f"Transcription error ({cancellation.error_code}): "
+                        f"{cancellation.error_details}",
+                        cancellation.error_code
                     )
                 return {
                     "text": "",
@@ -245,7 +517,36 @@ class TranscriptionService:
             logger.error(f"Transcription failed: {e}")
             raise RuntimeError(f"Cannot transcribe audio: {e}")
     
-    def _transcribe_continuous(self, recognizer: speechsdk.SpeechRecognizer) -> Dict:
+    def _create_recognizer(
+        self,
+        audio_config: speechsdk.audio.AudioConfig,
+        language: str,
+        segmentation_silence_ms: int = SEGMENTATION_SILENCE_MS
+    ) -> speechsdk.SpeechRecognizer:
+        """
+        Create a speech recognizer for the given language.
+        
+        Args:
+            audio_config: Audio input (file or push stream)
+            language: Language code
+            segmentation_silence_ms: Silence that ends a phrase (ms)
+        
+        Returns:
+            Configured SpeechRecognizer
+        """
+        # Create speech recognizer
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self._get_speech_config(language, segmentation_silence_ms),
+            audio_config=audio_config
+        )
+        
+        return recognizer
+    
+    def _transcribe_continuous(
+        self,
+        recognizer: speechsdk.SpeechRecognizer,
+        language: str
+    ) -> Dict:
         """
         Use continuous recognition to transcribe entire audio stream.
         Better for longer segments with continuous speech.
@@ -253,107 +554,237 @@ class TranscriptionService:
         
         Args:
             recognizer: Configured speech recognizer
+            language: Language code the recognizer was created with
         
         Returns:
             Dictionary with transcription results
         """
-        import threading
+        results = self._run_continuous(recognizer, keep_phrases=False)
+        
+        # Check for errors; throttling is raised so callers can retry
+        if results.error:
+            error = _recognition_error(results.error, results.error_code)
+            if _is_throttled(error):
+                raise error
+            
+            logger.error(f"Transcription error: {results.error}")
+            return {
+                "text": "",
+                "confidence": 0.0,
+                "duration": 0.0,
+                "language": language,
+                "error": results.error
+            }
+        
+        # Combine results
+        full_text = results.buf.getvalue().strip()
+        confidences = results.confidences
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
         
-        # Storage for results
-        results = {
-            "texts": [],
-            "confidences": [],
-            "done": threading.Event(),
-            "error": None,
-            "stopped": False  # Flag to prevent processing after stop
+        logger.debug(f"Fast transcription complete: {len(full_text)} chars, {results.phrase_count} phrases")
+        
+        return {
+            "text": full_text,
+            "confidence": avg_confidence,
+            "duration": 0.0,  # Not available in continuous mode
+            "language": language
         }
+    
+    def _run_continuous(
+        self,
+        recognizer: speechsdk.SpeechRecognizer,
+        timeout: float = 20.0,
+        keep_phrases: bool = True
+    ) -> "_ContinuousSink":
+        """
+        Run continuous recognition until the session stops.
         
-        def recognizing_callback(evt):
-            """Called during recognition (intermediate results)."""
-            # Only log first few to avoid spam
-            if not results["stopped"] and evt.result.text and len(results["texts"]) < 2:
-                logger.debug(f"Recognizing: {evt.result.text[:30]}...")
-        
-        def recognized_callback(evt):
-            """Called when speech is recognized (final results)."""
-            # Stop processing if already stopped
-            if results["stopped"]:
-                return
-                
-            if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                text = evt.result.text.strip()
-                confidence = self._get_confidence(evt.result)
-                
-                # Filter out low-confidence and invalid results
-                # Skip if: empty, only dots, or confidence too low
-                if text and text != "..." and confidence > 0.3:
-                    # Avoid duplicates - check if this text was already added
-                    if not results["texts"] or text != results["texts"][-1]:
-                        results["texts"].append(text)
-                        results["confidences"].append(confidence)
-                        logger.debug(f"Recognized: {text[:50]}... (confidence={confidence:.2f})")
-                else:
-                    logger.debug(f"Skipping low-quality result: '{text}' (confidence={confidence:.2f})")
-        
-        def canceled_callback(evt):
-            """Called when recognition is canceled."""
-            if evt.cancellation_details.reason == speechsdk.CancellationReason.Error:
-                error_msg = f"Recognition error: {evt.cancellation_details.error_details}"
-                logger.error(error_msg)
-                results["error"] = error_msg
-            results["done"].set()
-        
-        def stopped_callback(evt):
-            """Called when recognition stops."""
-            results["stopped"] = True  # Set flag to stop processing
-            logger.debug("Recognition session stopped")
-            results["done"].set()
+        Args:
+            recognizer: Configured speech recognizer
+            timeout: Maximum time to wait for the session (seconds)
+            keep_phrases: Keep every phrase in 'texts' and 'offsets' for the
+                caller to deduplicate; when False only the joined transcript
+                in 'buf' is built, with repeated phrases dropped
+        
+        Returns:
+            Sink holding 'buf', 'confidences', 'error' and, if requested,
+            per-phrase 'texts' and 'offsets' ((offset, duration) in 100-ns ticks)
+        """
+        sink = _ContinuousSink(self, keep_phrases=keep_phrases)
         
         # Connect callbacks
-        recognizer.recognizing.connect(recognizing_callback)  # Intermediate results
-        recognizer.recognized.connect(recognized_callback)     # Final results
-        recognizer.canceled.connect(canceled_callback)
-        recognizer.session_stopped.connect(stopped_callback)
+        recognizer.recognizing.connect(sink.on_recognizing)  # Intermediate results
+        recognizer.recognized.connect(sink.on_recognized)    # Final results
+        recognizer.canceled.connect(sink.on_canceled)
+        recognizer.session_stopped.connect(sink.on_stopped)
         
         # Start continuous recognition
         logger.debug("Starting continuous recognition with fast transcription...")
         recognizer.start_continuous_recognition()
         
         # Wait for completion (with timeout - 15 seconds for 8s buffer)
-        if not results["done"].wait(timeout=20):
+        if not sink.done.wait(timeout=timeout):
             logger.warning("Continuous recognition timed out")
-            results["stopped"] = True  # Mark as stopped
-            recognizer.stop_continuous_recognition()
         
         # Stop recognition
-        results["stopped"] = True  # Mark as stopped before calling stop
+        sink.stopped = True  # Mark as stopped before calling stop
         recognizer.stop_continuous_recognition()
         
-        # Check for errors
-        if results["error"]:
-            logger.error(f"Transcription error: {results['error']}")
-            return {
-                "text": "",
-                "confidence": 0.0,
-                "duration": 0.0,
-                "language": "unknown",
-                "error": results["error"]
-            }
+        return sink
+    
+    def _group_segments(self, segments: List[Dict]) -> List[List[Dict]]:
+        """
+        Group adjacent short segments for batched recognition.
         
-        # Combine results
-        full_text = " ".join(results["texts"]).strip()
-        avg_confidence = np.mean(results["confidences"]) if results["confidences"] else 0.0
+        Consecutive segments from the same speaker are merged into one group
+        as long as each is short enough for single-shot recognition and the
+        group (including silence gaps) stays under the configured
+        TRANSCRIPTION_BATCH_MAX_SECONDS.
+        Long segments always form their own group.
         
-        logger.debug(f"Fast transcription complete: {len(full_text)} chars, {len(results['texts'])} phrases")
+        Args:
+            segments: Segments in transcription order
         
-        return {
-            "text": full_text,
-            "confidence": avg_confidence,
-            "duration": 0.0,  # Not available in continuous mode
-            "language": recognizer.properties.get_property(
-                speechsdk.PropertyId.SpeechServiceConnection_RecoLanguage
-            ) or "unknown"
-        }
+        Returns:
+            List of segment groups (each a non-empty list)
+        """
+        batch_max_seconds = self.config.transcription_batch_max_seconds
+        
+        groups = []
+        add_group = groups.append
+        current = []
+        current_speaker = None
+        current_duration = 0.0
+        
+        for segment in segments:
+            duration = segment["end"] - segment["start"]
+            speaker = segment.get("speaker_label")
+            is_short = duration <= SHORT_SEGMENT_SECONDS
+            
+            fits = (
+                current
+                and is_short
+                and speaker == current_speaker
+                and current_duration + BATCH_SILENCE_GAP + duration <= batch_max_seconds
+            )
+            
+            if fits:
+                current.append(segment)
+                current_duration += BATCH_SILENCE_GAP + duration
+                continue
+            
+            if current:
+                add_group(current)
+            
+            if is_short:
+                current = [segment]
+                current_speaker = speaker
+                current_duration = duration
+            else:
+                add_group([segment])
+                current = []
+                current_duration = 0.0
+        
+        if current:
+            groups.append(current)
+        
+        return groups
+    
+    def _transcribe_group(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        group: List[Dict],
+        language: str = "en-US"
+    ) -> List[Dict]:
+        """
+        Transcribe several segments in one continuous-recognition session.
+        
+        Segment audio is concatenated with silence gaps and streamed as one
+        push stream. The session uses a segmentation timeout shorter than
+        the gaps, so phrases end between segments; each phrase is then
+        attributed to the segment its offset range overlaps most.
+        
+        Args:
+            audio: Full audio samples (mono)
+            sr: Sample rate of the audio
+            group: Segments to transcribe together
+            language: Language code
+        
+        Returns:
+            One transcription result per segment, in group order
+        
+        Raises:
+            RuntimeError: If recognition fails
+        """
+        gap = np.zeros(int(BATCH_SILENCE_GAP * sr), dtype=audio.dtype)
+        
+        pieces = []
+        spans = []  # (start, end) of each segment in the stream (ticks)
+        position = 0
+        
+        for i, segment in enumerate(group):
+            if i > 0:
+                pieces.append(gap)
+                position += len(gap)
+            
+            segment_audio = extract_segment(audio, sr, segment["start"], segment["end"])
+            start_ticks = position * TICKS_PER_SECOND // sr
+            pieces.append(segment_audio)
+            position += len(segment_audio)
+            spans.append((start_ticks, position * TICKS_PER_SECOND // sr))
+        
+        total_seconds = position / sr
+        logger.debug(f"Transcribing {len(group)} segments in one session ({total_seconds:.1f}s)")
+        
+        try:
+            audio_config = self._create_push_audio_config(np.concatenate(pieces), sr)
+            recognizer = self._create_recognizer(
+                audio_config, language, segmentation_silence_ms=BATCH_SEGMENTATION_SILENCE_MS
+            )
+            # Leave headroom for service latency on long sessions
+            run = self._run_continuous(recognizer, timeout=20.0 + total_seconds)
+        except Exception as e:
+            logger.error(f"Batched transcription failed: {e}")
+            raise RuntimeError(f"Cannot transcribe segment group: {e}")
+        
+        if run.error:
+            raise _recognition_error(run.error, run.error_code)
+        
+        # Attribute each phrase to the segment it overlaps most
+        texts = [[] for _ in group]
+        confidences = [[] for _ in group]
+        durations = [0 for _ in group]
+        segment_starts = [start for start, _ in spans]
+        
+        for text, confidence, (offset, duration) in zip(
+            run.texts, run.confidences, run.offsets
+        ):
+            index = _attribute_phrase(spans, segment_starts, offset, duration)
+            
+            # Azure can re-emit a phrase; drop repeats within one segment only,
+            # so identical replies in neighbouring segments are both kept
+            if texts[index] and texts[index][-1] == text:
+                continue
+            
+            texts[index].append(text)
+            confidences[index].append(confidence)
+            durations[index] += duration
+        
+        results = []
+        for segment, seg_texts, seg_confidences, seg_duration in zip(
+            group, texts, confidences, durations
+        ):
+            results.append({
+                "text": " ".join(seg_texts),
+                "confidence": sum(seg_confidences) / len(seg_confidences) if seg_confidences else 0.0,
+                "duration": seg_duration / TICKS_PER_SECOND,
+                "language": language,
+                "start": segment["start"],
+                "end": segment["end"]
+            })
+        
+        return results
     
     def transcribe_segment(
         self,
@@ -377,45 +808,213 @@ class TranscriptionService:
             Dictionary with transcription results
         """
         audio_file = Path(audio_file)
-        segment_duration = end - start
-        
-        logger.debug(f"Transcribing segment [{start:.2f}s - {end:.2f}s] (duration={segment_duration:.2f}s)")
         
         try:
-            # Load audio and extract segment
-            audio, sr = load_audio(audio_file, sample_rate=self.config.sample_rate)
-            segment_audio = extract_segment(audio, sr, start, end)
+            # Read just this segment (seek for WAV/FLAC, full decode otherwise)
+            audio, sr = load_audio_segment(
+                audio_file, start, end, sample_rate=self.config.sample_rate
+            )
+        except Exception as e:
+            logger.error(f"Segment transcription failed: {e}")
+            raise RuntimeError(f"Cannot transcribe segment: {e}")
+        
+        result = self._with_retry(
+            lambda: self._transcribe_segment_array(
+                audio, sr, 0.0, len(audio) / sr, language=language
+            )
+        )
+        
+        # Report timing relative to the file, not the extracted slice
+        result["start"] = start
+        result["end"] = end
+        
+        return result
+    
+    def transcribe_array(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        language: str = "en-US"
+    ) -> Dict:
+        """
+        Transcribe audio that is already in memory.
+        
+        The samples are streamed to Azure directly; nothing is written to disk.
+        
+        Args:
+            audio: Mono audio samples (float, -1.0 to 1.0)
+            sample_rate: Sample rate of the audio
+            language: Language code
+        
+        Returns:
+            Dictionary with transcription results ('start' is 0.0)
+        """
+        duration = len(audio) / sample_rate
+        return self._with_retry(
+            lambda: self._transcribe_segment_array(
+                audio, sample_rate, 0.0, duration, language=language
+            )
+        )
+    
+    def _transcribe_segment_array(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        start: float,
+        end: float,
+        language: str = "en-US"
+    ) -> Dict:
+        """
+        Transcribe a segment of already-decoded audio.
+        
+        Args:
+            audio: Full audio samples (mono)
+            sr: Sample rate of the audio
+            start: Start time in seconds
+            end: End time in seconds
+            language: Language code
+        
+        Returns:
+            Dictionary with transcription results
+        """
+        segment_duration = end - start
+        
+        logger.debug(f"Transcribing segment [{start:.2f}s - {end:.2f}s] (duration={segment_duration:.2f}s)")
+        
+        try:
+            segment_audio = extract_segment(audio, sr, start, end)
             
             # DISABLED: Audio preprocessing was degrading quality
             # Azure Speech Service handles normalization better internally
             # Just pass the raw audio without modifications
             
-            # Save segment to temporary file
-            temp_file = self.config.temp_dir / f"segment_{start:.2f}_{end:.2f}.wav"
-            save_audio(segment_audio, temp_file, sr)
+            pcm = self._to_pcm16(segment_audio, sr)
+            
+            # Identical audio (repeated phrases, re-processed files) is served
+            # from the cache without an Azure round-trip
+            cache_key = None
+            if self._cache is not None:
+                cache_key = TranscriptionCache.make_key(pcm, language)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Transcription cache hit for segment [{start:.2f}s - {end:.2f}s]")
+                    cached["start"] = start
+                    cached["end"] = end
+                    return cached
+            
+            # Stream segment PCM to Azure in memory (no temp WAV round-trip)
+            audio_config = self._create_pcm_audio_config(pcm)
             
             # Choose recognition mode based on segment duration
             # recognize_once: Good for <10s (better quality, but has max duration limit)
             # continuous: Required for >10s (handles any duration)
-            use_continuous_mode = segment_duration > 10.0
+            use_continuous_mode = segment_duration > SHORT_SEGMENT_SECONDS
             
             # Transcribe segment
-            result = self.transcribe_file(temp_file, language=language, use_continuous=use_continuous_mode)
+            result = self._recognize(audio_config, language=language, use_continuous=use_continuous_mode)
+            
+            # Only cache clean results; errors should be retried next time
+            if cache_key is not None and "error" not in result:
+                self._cache.put(cache_key, result)
             
             # Add timing information
             result["start"] = start
             result["end"] = end
             
-            # DON'T delete temp file immediately - Azure might still be processing
-            # It will be cleaned up by the caller or on next run
-            # This prevents "file not found" race condition errors
-            
             return result
             
         except Exception as e:
             logger.error(f"Segment transcription failed: {e}")
             raise RuntimeError(f"Cannot transcribe segment: {e}")
     
+    def _create_push_audio_config(
+        self,
+        audio: np.ndarray,
+        sample_rate: int
+    ) -> speechsdk.audio.AudioConfig:
+        """
+        Build an in-memory audio config from float audio samples.
+        
+        Normalizes the samples to Azure's native 16 kHz mono 16-bit PCM and
+        writes them to a PushAudioInputStream, so Azure reads the audio
+        without a temp file and never has to convert it server-side.
+        
+        Args:
+            audio: Audio samples (float, -1.0 to 1.0), mono or (n_samples, n_channels)
+            sample_rate: Sample rate of the audio
+        
+        Returns:
+            AudioConfig backed by a closed (fully written) push stream
+        """
+        return self._create_pcm_audio_config(self._to_pcm16(audio, sample_rate))
+    
+    def _create_pcm_audio_config(self, pcm: bytes) -> speechsdk.audio.AudioConfig:
+        """
+        Build an in-memory audio config from 16 kHz mono 16-bit PCM.
+        
+        Args:
+            pcm: Little-endian 16-bit PCM bytes at 16 kHz
+        
+        Returns:
+            AudioConfig backed by a closed (fully written) push stream
+        """
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=AZURE_SAMPLE_RATE,
+            bits_per_sample=16,
+            channels=1
+        )
+        stream = speechsdk.audio.PushAudioInputStream(stream_format)
+        
+        for offset in range(0, len(pcm), PUSH_CHUNK_BYTES):
+            stream.write(pcm[offset:offset + PUSH_CHUNK_BYTES])
+        
+        # Closing signals end-of-stream so recognition can finish
+        stream.close()
+        
+        return speechsdk.audio.AudioConfig(stream=stream)
+    
+    def _to_pcm16(self, audio: np.ndarray, sample_rate: int) -> bytes:
+        """
+        Convert float audio to Azure's native 16 kHz mono 16-bit PCM.
+        
+        Args:
+            audio: Audio samples (float, -1.0 to 1.0), mono or (n_samples, n_channels)
+            sample_rate: Sample rate of the audio
+        
+        Returns:
+            Little-endian 16-bit PCM bytes at 16 kHz
+        """
+        if audio.ndim > 1:
+            audio = audio.mean(axis=-1)
+        
+        if sample_rate != AZURE_SAMPLE_RATE:
+            divisor = gcd(AZURE_SAMPLE_RATE, sample_rate)
+            audio = resample_poly(
+                audio,
+                AZURE_SAMPLE_RATE // divisor,
+                sample_rate // divisor
+            )
+        
+        # Azure expects little-endian 16-bit PCM. Scale, clip (so resampling
+        # overshoot cannot wrap around) and round in place in a pooled
+        # float32 buffer, then cast once into a pooled int16 buffer - no
+        # per-segment temporaries
+        n_samples = len(audio)
+        buf = self._pcm_pool.acquire(n_samples)
+        scratch = self._scratch_pool.acquire(n_samples)
+        try:
+            work = scratch[:n_samples]
+            np.multiply(audio, 32767.0, out=work, casting='same_kind')
+            np.clip(work, -32768.0, 32767.0, out=work)
+            np.rint(work, out=work)
+            
+            pcm = buf[:n_samples]
+            np.copyto(pcm, work, casting='unsafe')
+            return pcm.tobytes()
+        finally:
+            self._scratch_pool.release(scratch)
+            self._pcm_pool.release(buf)
+    
     def transcribe_segments(
         self,
         audio_file: Union[str, Path],
@@ -436,65 +1035,350 @@ class TranscriptionService:
             List of transcription results with timing information
         """
         audio_file = Path(audio_file)
+        segments_to_transcribe = self._select_segments(segments, target_only)
         
-        # Filter segments if needed
-        if target_only:
-            segments_to_transcribe = [
-                seg for seg in segments
-                if seg.get("is_target", False)
+        if not segments_to_transcribe:
+            return []
+        
+        # Decode the file once; every segment is sliced from this buffer
+        audio, sr = load_audio(audio_file, sample_rate=self.config.sample_rate)
+        
+        return self._transcribe_selected(audio, sr, segments_to_transcribe, language)
+    
+    def transcribe_segments_array(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        segments: List[Dict],
+        language: str = "en-US",
+        target_only: bool = True
+    ) -> List[Dict]:
+        """
+        Transcribe multiple segments of audio that is already in memory.
+        
+        Same as transcribe_segments, for callers that already hold the
+        decoded samples and would otherwise reload them from disk.
+        
+        Args:
+            audio: Mono audio samples (float, -1.0 to 1.0)
+            sample_rate: Sample rate of the audio
+            segments: List of segments (must have 'start', 'end', and optionally 'is_target')
+            language: Language code
+            target_only: If True, only transcribe segments where is_target=True
+        
+        Returns:
+            List of transcription results with timing information
+        """
+        segments_to_transcribe = self._select_segments(segments, target_only)
+        
+        if not segments_to_transcribe:
+            return []
+        
+        return self._transcribe_selected(audio, sample_rate, segments_to_transcribe, language)
+    
+    def _transcribe_selected(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        segments: List[Dict],
+        language: str
+    ) -> List[Dict]:
+        """Transcribe already-selected segments of decoded audio."""
+        groups = self._group_segments(segments)
+        
+        # Size pooled PCM buffers for the longest single recognition
+        longest = max(
+            sum(seg["end"] - seg["start"] for seg in group) + BATCH_SILENCE_GAP * (len(group) - 1)
+            for group in groups
+        )
+        self._pcm_pool.reserve(int(longest * AZURE_SAMPLE_RATE) + 1)
+        self._scratch_pool.reserve(int(longest * AZURE_SAMPLE_RATE) + 1)
+        
+        # The SDK releases the GIL while waiting on Azure, so groups run in
+        # parallel threads; executor.map keeps results in segment order
+        max_workers = min(self.config.azure_concurrency, len(groups))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transcribe") as executor:
+            return self._collect_results(
+                executor.map(
+                    lambda group: self._transcribe_group_safe(audio, sr, group, language),
+                    groups
+                ),
+                count=len(segments)
+            )
+    
+    async def transcribe_file_async(
+        self,
+        audio_file: Union[str, Path],
+        language: str = "en-US",
+        use_continuous: bool = False
+    ) -> Dict:
+        """
+        Async variant of transcribe_file.
+        
+        The blocking SDK call runs in a worker thread so the event loop
+        stays free while Azure processes the audio.
+        """
+        return await asyncio.to_thread(
+            self.transcribe_file, audio_file, language, use_continuous
+        )
+    
+    async def transcribe_segment_async(
+        self,
+        audio_file: Union[str, Path],
+        start: float,
+        end: float,
+        language: str = "en-US"
+    ) -> Dict:
+        """Async variant of transcribe_segment."""
+        return await asyncio.to_thread(
+            self.transcribe_segment, audio_file, start, end, language
+        )
+    
+    async def transcribe_segments_async(
+        self,
+        audio_file: Union[str, Path],
+        segments: List[Dict],
+        language: str = "en-US",
+        target_only: bool = True
+    ) -> List[Dict]:
+        """
+        Async variant of transcribe_segments.
+        
+        Segment groups are transcribed concurrently, with at most
+        config.azure_concurrency recognitions in flight. When
+        AZURE_REST_SHORT_AUDIO is enabled, segments up to REST_MAX_SECONDS
+        go through the short-audio REST endpoint instead of the SDK.
+        
+        Args:
+            audio_file: Path to audio file
+            segments: List of segments (must have 'start', 'end', and optionally 'is_target')
+            language: Language code
+            target_only: If True, only transcribe segments where is_target=True
+        
+        Returns:
+            List of transcription results, in segment order
+        """
+        audio_file = Path(audio_file)
+        segments_to_transcribe = self._select_segments(segments, target_only)
+        
+        if not segments_to_transcribe:
+            return []
+        
+        audio, sr = await asyncio.to_thread(
+            load_audio, audio_file, sample_rate=self.config.sample_rate
+        )
+        
+        semaphore = asyncio.Semaphore(self.config.azure_concurrency)
+        
+        async def run_group(group: List[Dict]) -> List[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._transcribe_group_safe, audio, sr, group, language
+                )
+        
+        if self.config.azure_rest_short_audio:
+            rest_segments = [
+                seg for seg in segments_to_transcribe
+                if seg["end"] - seg["start"] <= REST_MAX_SECONDS
+            ]
+            sdk_segments = [
+                seg for seg in segments_to_transcribe
+                if seg["end"] - seg["start"] > REST_MAX_SECONDS
+            ]
+            
+            async with TranscriptionRestClient() as client:
+                
+                async def run_rest(segment: Dict) -> List[Dict]:
+                    async with semaphore:
+                        return await self._transcribe_rest_safe(
+                            client, audio, sr, segment, language
+                        )
+                
+                group_results = await asyncio.gather(
+                    *(run_rest(segment) for segment in rest_segments),
+                    *(run_group(group) for group in self._group_segments(sdk_segments))
+                )
+            
+            # REST and SDK results finish interleaved; restore segment order
+            group_results = [
+                sorted(
+                    (result for group in group_results for result in group),
+                    key=lambda r: r["start"]
+                )
             ]
+            
+        else:
+            group_results = await asyncio.gather(
+                *(run_group(group) for group in self._group_segments(segments_to_transcribe))
+            )
+        
+        return self._collect_results(group_results, count=len(segments_to_transcribe))
+    
+    def _select_segments(self, segments: List[Dict], target_only: bool) -> List[Dict]:
+        """Filter segments down to the ones that should be transcribed."""
+        if target_only:
+            # Boolean mask -> index array keeps the selection scan in C
+            is_target = np.fromiter(
+                (seg.get("is_target", False) for seg in segments),
+                dtype=bool,
+                count=len(segments)
+            )
+            target_idx = np.flatnonzero(is_target)
+            segments_to_transcribe = [segments[i] for i in target_idx]
             logger.info(
-                f"Transcribing {len(segments_to_transcribe)}/{len(segments)} "
+                f"Transcribing {target_idx.size}/{len(segments)} "
                 f"target segments"
             )
         else:
             segments_to_transcribe = segments
             logger.info(f"Transcribing all {len(segments)} segments")
         
-        results = []
+        return segments_to_transcribe
+    
+    def _transcribe_group_safe(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        group: List[Dict],
+        language: str
+    ) -> List[Dict]:
+        """
+        Transcribe a segment group and attach segment metadata.
         
-        for i, segment in enumerate(segments_to_transcribe, 1):
-            try:
-                result = self.transcribe_segment(
-                    audio_file,
-                    start=segment["start"],
-                    end=segment["end"],
-                    language=language
+        Failures never propagate: failed segments get an empty result so
+        the output always has one entry per input segment.
+        """
+        try:
+            if len(group) == 1:
+                group_results = [
+                    self._with_retry(
+                        lambda: self._transcribe_segment_array(
+                            audio,
+                            sr,
+                            start=group[0]["start"],
+                            end=group[0]["end"],
+                            language=language
+                        )
+                    )
+                ]
+            else:
+                group_results = self._with_retry(
+                    lambda: self._transcribe_group(audio, sr, group, language=language)
                 )
-                
-                # Add segment metadata
-                result["speaker_label"] = segment.get("speaker_label", "UNKNOWN")
-                result["similarity"] = segment.get("similarity", 0.0)
-                result["is_target"] = segment.get("is_target", False)  # CRITICAL: Preserve is_target flag
-                
-                results.append(result)
-                
-                logger.debug(
-                    f"Segment {i}/{len(segments_to_transcribe)}: "
+            
+        except Exception as e:
+            logger.warning(
+                f"Failed to transcribe {len(group)} segment(s) starting at "
+                f"{group[0]['start']:.2f}s: {e}"
+            )
+            # Add empty results
+            group_results = [self._empty_result(segment, language) for segment in group]
+            for result in group_results:
+                result["retries"] = getattr(e, "retries", 0)
+        
+        return self._annotate_results(group, group_results)
+    
+    async def _transcribe_rest_safe(
+        self,
+        client: TranscriptionRestClient,
+        audio: np.ndarray,
+        sr: int,
+        segment: Dict,
+        language: str
+    ) -> List[Dict]:
+        """
+        Transcribe one short segment via the REST endpoint.
+        
+        Like _transcribe_group_safe, failures yield an empty result.
+        """
+        start, end = segment["start"], segment["end"]
+        
+        try:
+            pcm = self._to_pcm16(extract_segment(audio, sr, start, end), sr)
+            result = await client.transcribe(pcm, language=language)
+            result["start"] = start
+            result["end"] = end
+            
+        except Exception as e:
+            logger.warning(f"Failed to transcribe segment at {start:.2f}s via REST: {e}")
+            result = self._empty_result(segment, language)
+        
+        return self._annotate_results([segment], [result])
+    
+    def _empty_result(self, segment: Dict, language: str) -> Dict:
+        """Build the placeholder result used when a segment fails."""
+        return {
+            "start": segment["start"],
+            "end": segment["end"],
+            "text": "",
+            "confidence": 0.0,
+            "language": language
+        }
+    
+    def _annotate_results(self, group: List[Dict], group_results: List[Dict]) -> List[Dict]:
+        """Copy speaker metadata from each segment onto its result."""
+        # Bind per-segment lookups once; skip building debug strings when
+        # debug logging is off
+        debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else None
+        
+        for segment, result in zip(group, group_results):
+            get = segment.get
+            
+            # Add segment metadata
+            result["speaker_label"] = get("speaker_label", "UNKNOWN")
+            result["similarity"] = get("similarity", 0.0)
+            result["is_target"] = get("is_target", False)  # CRITICAL: Preserve is_target flag
+            
+            if debug is not None:
+                debug(
+                    f"Segment [{segment['start']:.2f}s - {segment['end']:.2f}s]: "
                     f"{len(result['text'])} chars, confidence={result['confidence']:.2f}"
                 )
-                
-            except Exception as e:
-                logger.warning(f"Failed to transcribe segment {i}: {e}")
-                # Add empty result
-                results.append({
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": "",
-                    "confidence": 0.0,
-                    "speaker_label": segment.get("speaker_label", "UNKNOWN"),
-                    "similarity": segment.get("similarity", 0.0),
-                    "is_target": segment.get("is_target", False),  # Preserve is_target flag
-                    "language": language
-                })
         
-        # Log summary
-        total_chars = sum(len(r["text"]) for r in results)
-        avg_confidence = np.mean([r["confidence"] for r in results if r["confidence"] > 0])
+        return group_results
+    
+    def _collect_results(
+        self,
+        group_results: Iterable[List[Dict]],
+        count: int
+    ) -> List[Dict]:
+        """
+        Flatten per-group results and log batch statistics.
+        
+        Timing, confidence and text length are gathered into parallel
+        arrays while flattening so the summary is computed with vectorized
+        reductions instead of repeated passes over the result dicts.
+        
+        Args:
+            group_results: Result lists, one per segment group, in order
+            count: Total number of segments across all groups
+        
+        Returns:
+            Flat list of results
+        """
+        results: List[Dict] = [None] * count
+        starts = np.empty(count, dtype=np.float64)
+        ends = np.empty(count, dtype=np.float64)
+        confidences = np.empty(count, dtype=np.float64)
+        chars = np.empty(count, dtype=np.int64)
+        
+        i = 0
+        for group in group_results:
+            for r in group:
+                results[i] = r
+                starts[i] = r["start"]
+                ends[i] = r["end"]
+                confidences[i] = r["confidence"]
+                chars[i] = len(r["text"])
+                i += 1
+        
+        recognized = confidences[confidences > 0]
+        avg_confidence = float(recognized.mean()) if recognized.size else 0.0
         
         logger.info(
-            f"Transcription complete: {len(results)} segments, "
-            f"{total_chars} chars, avg_confidence={avg_confidence:.2f}"
+            f"Transcription complete: {count} segments "
+            f"({float((ends - starts).sum()):.1f}s audio), "
+            f"{int(chars.sum())} chars, avg_confidence={avg_confidence:.2f}"
         )
         
         return results
@@ -509,19 +1393,7 @@ class TranscriptionService:
         Returns:
             Confidence score (0.0-1.0)
         """
-        try:
-            import json
-            details = json.loads(result.json)
-            
-            # Get best result confidence
-            if "NBest" in details and len(details["NBest"]) > 0:
-                return details["NBest"][0].get("Confidence", 0.0)
-            
-        except Exception as e:
-            logger.debug(f"Could not extract confidence: {e}")
-        
-        # Default confidence
-        return 0.5
+        return extract_confidence(result.json)
     
     def get_supported_languages(self) -> List[str]:
         """
@@ -536,3 +1408,186 @@ class TranscriptionService:
             "it-IT", "pt-BR", "pt-PT", "ja-JP", "ko-KR", "zh-CN",
             "zh-TW", "ar-SA", "hi-IN", "ru-RU", "nl-NL", "pl-PL"
         ]
+
+
+def extract_confidence(result_json: str) -> float:
+    """
+    Extract the best-hypothesis confidence from a detailed result payload.
+    
+    Reads NBest[0].Confidence with a regex scan and only falls back to a
+    full JSON parse when the payload has an unexpected layout.
+    
+    Args:
+        result_json: Raw JSON of a detailed recognition result
+    
+    Returns:
+        Confidence score (0.0-1.0), 0.5 if unavailable
+    """
+    try:
+        match = _CONFIDENCE_RE.search(result_json)
+        if match:
+            return float(match.group(1))
+        
+        # Unexpected layout (e.g. Confidence after a nested object)
+        details = _json.loads(result_json)
+        
+        # Get best result confidence
+        if "NBest" in details and len(details["NBest"]) > 0:
+            return details["NBest"][0].get("Confidence", 0.0)
+        
+    except Exception as e:
+        logger.debug(f"Could not extract confidence: {e}")
+    
+    # Default confidence
+    return 0.5
+
+
+def _attribute_phrase(
+    spans: List[Tuple[int, int]],
+    starts: List[int],
+    offset: int,
+    duration: int
+) -> int:
+    """
+    Find the segment a phrase from a batched session belongs to.
+    
+    Args:
+        spans: (start, end) of each segment in the session, in ticks
+        starts: Start of each span, for bisecting
+        offset: Phrase offset in ticks
+        duration: Phrase duration in ticks
+    
+    Returns:
+        Index of the segment the phrase overlaps most; a phrase lying
+        entirely in a silence gap goes to the nearer segment
+    """
+    end = offset + duration
+    
+    # Only the segment holding the phrase start, the segments starting
+    # within the phrase and the next one after it can be closest
+    first = max(0, bisect.bisect_right(starts, offset) - 1)
+    last = min(len(spans) - 1, bisect.bisect_left(starts, end))
+    
+    best = first
+    best_overlap = None
+    for i in range(first, last + 1):
+        span_start, span_end = spans[i]
+        # Negative when disjoint: minus the distance to the segment
+        overlap = min(end, span_end) - max(offset, span_start)
+        if best_overlap is None or overlap > best_overlap:
+            best = i
+            best_overlap = overlap
+    
+    return best
+
+
+def _recognition_error(
+    message: str,
+    error_code: Optional[speechsdk.CancellationErrorCode]
+) -> RuntimeError:
+    """Build a recognition error that carries the SDK cancellation code."""
+    error = RuntimeError(message)
+    error.error_code = error_code
+    return error
+
+
+def _is_throttled(error: Exception) -> bool:
+    """
+    Check whether an Azure error means the request was rate limited.
+    
+    Uses the SDK cancellation code when the error (or one it was raised
+    from) carries one; otherwise matches the service's "too many requests"
+    text or a REST "HTTP 429" status.
+    """
+    cause = error
+    while cause is not None:
+        error_code = getattr(cause, "error_code", None)
+        if error_code is not None:
+            return error_code == speechsdk.CancellationErrorCode.TooManyRequests
+        cause = cause.__cause__ or cause.__context__
+    
+    message = str(error).lower()
+    return "too many requests" in message or "http 429" in message
+
+
+@dataclass(slots=True)
+class _ContinuousSink:
+    """
+    Collects continuous recognition events for a single session.
+    
+    Bound methods are connected directly to the recognizer's events, so
+    each callback works on slot attributes instead of string-keyed dict
+    lookups.
+    """
+    
+    service: TranscriptionService
+    keep_phrases: bool = True
+    buf: io.StringIO = field(default_factory=io.StringIO)
+    phrase_count: int = 0
+    texts: List[str] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)
+    offsets: List[Tuple[int, int]] = field(default_factory=list)
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Optional[str] = None
+    error_code: Optional[speechsdk.CancellationErrorCode] = None
+    stopped: bool = False  # Flag to prevent processing after stop
+    last_text: str = ""
+    
+    def on_recognizing(self, evt) -> None:
+        """Called during recognition (intermediate results)."""
+        # Only log first few to avoid spam
+        if not self.stopped and evt.result.text and self.phrase_count < 2:
+            logger.debug(f"Recognizing: {evt.result.text[:30]}...")
+    
+    def on_recognized(self, evt) -> None:
+        """Called when speech is recognized (final results)."""
+        # Stop processing if already stopped
+        if self.stopped:
+            return
+        
+        result = evt.result
+        if result.reason == speechsdk.ResultReason.RecognizedSpeech:
+            text = result.text.strip()
+            confidence = self.service._get_confidence(result)
+            
+            # Filter out low-confidence and invalid results
+            # Skip if: empty, only dots, or confidence too low
+            if text and text != "..." and confidence > 0.3:
+                # Phrase-level data is only needed to split a batched
+                # session back into segments. Repeats are dropped there
+                # per segment, since one session spans several segments
+                if self.keep_phrases:
+                    self.phrase_count += 1
+                    self.confidences.append(confidence)
+                    self.texts.append(text)
+                    self.offsets.append((result.offset, result.duration))
+                    logger.debug(f"Recognized: {text[:50]}... (confidence={confidence:.2f})")
+                
+                # Avoid duplicates - check if this text was already added
+                elif text != self.last_text:
+                    self.last_text = text
+                    self.phrase_count += 1
+                    self.confidences.append(confidence)
+                    self.buf.write(text)
+                    self.buf.write(" ")
+                    logger.debug(f"Recognized: {text[:50]}... (confidence={confidence:.2f})")
+            else:
+                logger.debug(f"Skipping low-quality result: '{text}' (confidence={confidence:.2f})")
+    
+    def on_canceled(self, evt) -> None:
+        """Called when recognition is canceled."""
+        if evt.cancellation_details.reason == speechsdk.CancellationReason.Error:
+            error_msg = (
+                f"Recognition error ({evt.cancellation_details.error_code}): "
+                f"{evt.cancellation_details.error_details}"
+            )
+            logger.error(error_msg)
+            self.error = error_msg
+            self.error_code = evt.cancellation_details.error_code
+        self.done.set()
+    
+    def on_stopped(self, evt) -> None:
+        """Called when recognition stops."""
+        self.stopped = True  # Set flag to stop processing
+        logger.debug("Recognition session stopped")
+        self.done.set()
@@ -23,10 +23,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Import UI components
-from src.ui.enrollment_tab import render_enrollment_tab
-from src.ui.batch_tab import render_batch_tab
-from src.ui.live_tab import render_live_tab
+# Tab modules pull in torch/pyannote; they are imported inside each tab so
+# the page chrome paints before the heavy imports run
 from src.config.config_manager import get_config
 from src.utils.logger import get_logger
 
@@ -43,6 +41,23 @@ def initialize_session_state():
         logger.info("Session state initialized")
 
 
+@st.cache_resource
+def _probe_accelerator() -> str:
+    """
+    Detect the available compute device once per server process.
+    
+    Returns:
+        "mps", "cuda" or "cpu"
+    """
+    import torch
+    
+    if torch.backends.mps.is_available():
+        return "mps"
+    if torch.cuda.is_available():
+        return "cuda"
+    return "cpu"
+
+
 def render_sidebar():
     """Render sidebar with configuration and info."""
     with st.sidebar:
@@ -64,10 +79,10 @@ def render_sidebar():
             # System info
             st.subheader("📊 System Info")
             
-            import torch
-            if torch.backends.mps.is_available():
+            accelerator = _probe_accelerator()
+            if accelerator == "mps":
                 st.success("✓ MPS GPU Available")
-            elif torch.cuda.is_available():
+            elif accelerator == "cuda":
                 st.success("✓ CUDA GPU Available")
             else:
                 st.info("ℹ️ Using CPU")
@@ -127,12 +142,15 @@ def main():
     ])
     
     with tab1:
+        from src.ui.enrollment_tab import render_enrollment_tab
         render_enrollment_tab()
     
     with tab2:
+        from src.ui.batch_tab import render_batch_tab
         render_batch_tab()
     
     with tab3:
+        from src.ui.live_tab import render_live_tab
         render_live_tab()
 
 
@@ -8,14 +8,30 @@ import streamlit as st
 from pathlib import Path
 import tempfile
 import json
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from src.processors.batch_processor import BatchProcessor
-from src.services.profile_manager import ProfileManager
+from src.ui.resources import (
+    LANGUAGE_LABELS,
+    get_profile_manager,
+    list_profiles,
+    new_batch_processor
+)
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # The processor pulls in torch/pyannote; sessions get one through
+    # new_batch_processor(), which imports it on first use
+    from src.processors.batch_processor import BatchProcessor
+
 logger = get_logger(__name__)
 
+# Copy buffer size for writing uploads to disk
+UPLOAD_CHUNK_BYTES = 1 << 20
+
 
 def render_batch_tab():
     """Render the batch processing interface."""
@@ -24,16 +40,13 @@ def render_batch_tab():
     
     # Initialize services
     if 'batch_processor' not in st.session_state:
-        st.session_state.batch_processor = BatchProcessor()
-    
-    if 'profile_manager' not in st.session_state:
-        st.session_state.profile_manager = ProfileManager()
+        st.session_state.batch_processor = new_batch_processor()
     
     batch_processor = st.session_state.batch_processor
-    profile_manager = st.session_state.profile_manager
+    profile_manager = get_profile_manager()
     
-    # Check if profiles exist
-    profiles = profile_manager.list_profiles()
+    # Check if profiles exist (served from memory until the store changes)
+    profiles = list_profiles(profile_manager)
     
     if not profiles:
         st.warning("⚠️ No speaker profiles found. Please create a profile in the Enrollment tab first.")
@@ -45,11 +58,13 @@ def render_batch_tab():
     col1, col2, col3 = st.columns(3)
     
     with col1:
+        id_to_name = {p['id']: p['name'] for p in profiles}
+        
         # Profile selection
         selected_profile_id = st.selectbox(
             "Target Speaker",
             options=[p['id'] for p in profiles],
-            format_func=lambda x: next(p['name'] for p in profiles if p['id'] == x),
+            format_func=id_to_name.__getitem__,
             help="Select the speaker profile to identify and transcribe",
             key="batch_target_profile"
         )
@@ -71,19 +86,9 @@ def render_batch_tab():
         # Language selection
         language = st.selectbox(
             "Language",
-            options=[
-                "en-US", "en-GB", "he-IL", "es-ES", "fr-FR", "de-DE",
-                "it-IT", "pt-BR", "ja-JP", "ko-KR", "zh-CN", "ar-SA"
-            ],
+            options=tuple(LANGUAGE_LABELS),
             index=0,
-            format_func=lambda x: {
-                "en-US": "English (US)", "en-GB": "English (UK)",
-                "he-IL": "Hebrew (Israel)", "es-ES": "Spanish (Spain)",
-                "fr-FR": "French (France)", "de-DE": "German (Germany)",
-                "it-IT": "Italian (Italy)", "pt-BR": "Portuguese (Brazil)",
-                "ja-JP": "Japanese (Japan)", "ko-KR": "Korean (Korea)",
-                "zh-CN": "Chinese (Mandarin)", "ar-SA": "Arabic (Saudi Arabia)"
-            }.get(x, x),
+            format_func=LANGUAGE_LABELS.get,
             help="Select the language for transcription",
             key="batch_language"
         )
@@ -116,17 +121,10 @@ def render_batch_tab():
         type="primary",
         disabled=not uploaded_files
     ):
-        # Save uploaded files to temp directory
-        temp_files = []
-        
+        # Save uploaded files to temp directory (writes overlap across files)
         with st.spinner("Preparing files..."):
-            for uploaded_file in uploaded_files:
-                with tempfile.NamedTemporaryFile(
-                    delete=False,
-                    suffix=Path(uploaded_file.name).suffix
-                ) as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
-                    temp_files.append(Path(tmp_file.name))
+            with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+                temp_files = list(executor.map(_save_upload, uploaded_files))
         
         # Progress tracking
         progress_bar = st.progress(0)
@@ -138,16 +136,31 @@ def render_batch_tab():
             progress_bar.progress(progress)
             status_text.text(f"Processing {current}/{total}: {message}")
         
+        # Summary goes above the per-file results, which render as each
+        # file finishes instead of after the whole batch
+        summary_area = st.container()
+        st.subheader("📄 File Results")
+        file_area = st.container()
+        
         # Process files
         try:
-            with st.spinner("Processing audio files..."):
-                results = batch_processor.process_batch(
-                    audio_files=temp_files,
-                    target_profile_id=selected_profile_id,
-                    threshold=threshold,
-                    language=language,
-                    progress_callback=progress_callback
-                )
+            start_time = time.time()
+            file_results = []
+            
+            for result in batch_processor.iter_batch(
+                audio_files=temp_files,
+                target_profile_id=selected_profile_id,
+                threshold=threshold,
+                language=language,
+                progress_callback=progress_callback
+            ):
+                file_results.append(result)
+                with file_area:
+                    _render_file_result(result, len(file_results))
+            
+            results = batch_processor.build_batch_result(
+                file_results, time.time() - start_time
+            )
             
             # Clean up temp files
             for temp_file in temp_files:
@@ -163,11 +176,14 @@ def render_batch_tab():
             progress_bar.empty()
             status_text.empty()
             
-            st.success("✅ Processing complete!")
+            with summary_area:
+                st.success("✅ Processing complete!")
+                
+                # Display summary
+                st.markdown("---")
+                _render_summary(results)
             
-            # Display summary
-            st.markdown("---")
-            display_batch_results(results, batch_processor)
+            _render_export(results, batch_processor)
             
         except Exception as e:
             st.error(f"❌ Processing failed: {e}")
@@ -187,9 +203,41 @@ def render_batch_tab():
         display_batch_results(st.session_state.batch_results, batch_processor)
 
 
-def display_batch_results(results: dict, batch_processor: BatchProcessor):
+def _save_upload(uploaded_file) -> Path:
+    """
+    Write an uploaded file to a named temp file.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile
+    
+    Returns:
+        Path to the temp file (caller deletes it)
+    """
+    with tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix=Path(uploaded_file.name).suffix
+    ) as tmp_file:
+        # Stream in 1 MB chunks instead of materializing one large write
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, tmp_file, length=UPLOAD_CHUNK_BYTES)
+        return Path(tmp_file.name)
+
+
+def display_batch_results(results: dict, batch_processor: "BatchProcessor"):
     """Display batch processing results."""
+    _render_summary(results)
+    
+    # Individual file results
+    st.subheader("📄 File Results")
+    
+    for i, result in enumerate(results['results'], 1):
+        _render_file_result(result, i)
     
+    _render_export(results, batch_processor)
+
+
+def _render_summary(results: dict):
+    """Render the batch summary metrics."""
     # Summary metrics
     st.subheader("📊 Summary")
     
@@ -237,57 +285,58 @@ def display_batch_results(results: dict, batch_processor: BatchProcessor):
             )
     
     st.markdown("---")
+
+
+def _render_file_result(result: dict, i: int):
+    """Render one file's result as an expander."""
+    if not result.get('success'):
+        with st.expander(f"❌ {result.get('filename', f'File {i}')} - Failed", expanded=False):
+            st.error(f"Error: {result.get('error', 'Unknown error')}")
+        return
     
-    # Individual file results
-    st.subheader("📄 File Results")
+    # Successful result
+    filename = result.get('filename', f'File {i}')
+    target_segments = result.get('identification', {}).get('target_segments', 0)
+    total_chars = result.get('transcription', {}).get('total_characters', 0)
     
-    for i, result in enumerate(results['results'], 1):
-        if not result.get('success'):
-            with st.expander(f"❌ {result.get('filename', f'File {i}')} - Failed", expanded=False):
-                st.error(f"Error: {result.get('error', 'Unknown error')}")
-            continue
+    with st.expander(
+        f"✓ {filename} - {target_segments} segments, {total_chars} chars",
+        expanded=False
+    ):
+        # File info
+        col_a, col_b = st.columns(2)
         
-        # Successful result
-        filename = result.get('filename', f'File {i}')
-        target_segments = result.get('identification', {}).get('target_segments', 0)
-        total_chars = result.get('transcription', {}).get('total_characters', 0)
+        with col_a:
+            st.text(f"Duration: {result.get('duration', 0):.1f}s")
+            st.text(f"Processing Time: {result.get('processing_time', 0):.1f}s")
         
-        with st.expander(
-            f"✓ {filename} - {target_segments} segments, {total_chars} chars",
-            expanded=False
-        ):
-            # File info
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                st.text(f"Duration: {result.get('duration', 0):.1f}s")
-                st.text(f"Processing Time: {result.get('processing_time', 0):.1f}s")
-            
-            with col_b:
-                st.text(f"Total Segments: {result.get('diarization', {}).get('total_segments', 0)}")
-                st.text(f"Target Segments: {target_segments}")
-            
-            # Transcripts
-            transcripts = result.get('transcription', {}).get('transcripts', [])
+        with col_b:
+            st.text(f"Total Segments: {result.get('diarization', {}).get('total_segments', 0)}")
+            st.text(f"Target Segments: {target_segments}")
+        
+        # Transcripts
+        transcripts = result.get('transcription', {}).get('transcripts', [])
+        
+        if transcripts:
+            st.markdown("**Transcript:**")
             
-            if transcripts:
-                st.markdown("**Transcript:**")
+            for transcript in transcripts:
+                start = transcript.get('start', 0)
+                end = transcript.get('end', 0)
+                text = transcript.get('text', '')
+                confidence = transcript.get('confidence', 0)
                 
-                for transcript in transcripts:
-                    start = transcript.get('start', 0)
-                    end = transcript.get('end', 0)
-                    text = transcript.get('text', '')
-                    confidence = transcript.get('confidence', 0)
-                    
-                    st.markdown(
-                        f"**[{start:.1f}s - {end:.1f}s]** {text}  \n"
-                        f"*Confidence: {confidence:.2f}*"
-                    )
-                    st.markdown("---")
-            else:
-                st.info("No transcripts for this file")
-    
-    # Export options
+                st.markdown(
+                    f"**[{start:.1f}s - {end:.1f}s]** {text}  \n"
+                    f"*Confidence: {confidence:.2f}*"
+                )
+                st.markdown("---")
+        else:
+            st.info("No transcripts for this file")
+
+
+def _render_export(results: dict, batch_processor: "BatchProcessor"):
+    """Render the export buttons."""
     st.markdown("---")
     st.subheader("💾 Export Results")
     
@@ -296,33 +345,31 @@ def display_batch_results(results: dict, batch_processor: BatchProcessor):
     with col1:
         if st.button("📥 Save as JSON"):
             try:
-                output_file = batch_processor.save_results(results, format="json")
+                output_file, content = batch_processor.save_results(results, format="json")
                 st.success(f"✓ Saved to: {output_file}")
                 
-                # Download button
-                with open(output_file, 'r') as f:
-                    st.download_button(
-                        "Download JSON",
-                        f.read(),
-                        file_name=output_file.name,
-                        mime="application/json"
-                    )
+                # Download button (serves the bytes just written; no re-read)
+                st.download_button(
+                    "Download JSON",
+                    content,
+                    file_name=output_file.name,
+                    mime="application/json"
+                )
             except Exception as e:
                 st.error(f"Failed to save: {e}")
     
     with col2:
         if st.button("📄 Save as Text"):
             try:
-                output_file = batch_processor.save_results(results, format="txt")
+                output_file, content = batch_processor.save_results(results, format="txt")
                 st.success(f"✓ Saved to: {output_file}")
                 
-                # Download button
-                with open(output_file, 'r') as f:
-                    st.download_button(
-                        "Download Text",
-                        f.read(),
-                        file_name=output_file.name,
-                        mime="text/plain"
-                    )
+                # Download button (serves the bytes just written; no re-read)
+                st.download_button(
+                    "Download Text",
+                    content,
+                    file_name=output_file.name,
+                    mime="text/plain"
+                )
             except Exception as e:
                 st.error(f"Failed to save: {e}")
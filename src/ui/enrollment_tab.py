@@ -5,31 +5,100 @@ Allows users to create and manage speaker profiles from reference audio.
 """
 
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 from pathlib import Path
+import asyncio
+import atexit
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
 import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
-from src.services.profile_manager import ProfileManager
-from src.services.identification_service import IdentificationService
-from src.utils.audio_utils import validate_audio_file, get_audio_duration
+import numpy as np
+
+from src.config.config_manager import EMBEDDING_MODEL
+from src.services.profile_manager import ProfileManager, format_quality_display
+from src.ui.resources import (
+    get_identification_service,
+    get_profile_manager,
+    list_profiles,
+    load_profile,
+    query_profiles
+)
+from src.utils.audio_utils import (
+    validate_audio_file,
+    get_audio_duration,
+    sniff_audio_format,
+    concatenate_audio_files
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Copy buffer size for writing uploads to disk
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+# Profiles rendered per page in Manage Profiles
+PROFILES_PER_PAGE = 10
+
+# Above this many profiles, Manage Profiles shows a table instead of cards
+PROFILE_TABLE_THRESHOLD = 50
+
+# Audio formats accepted for enrollment
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac")
+
+# Files processed at once during batch enrollment
+BATCH_ENROLL_CONCURRENCY = 4
+
+# Upload temp files older than this are treated as leaked
+STALE_TEMP_SECONDS = 3600
+
+# Fallbacks for fields a stored profile may lack
+DEFAULT_QUALITY = {
+    'quality_emoji': '📊',
+    'quality_label': '',
+    'overall_score': 0,
+    'display': None,
+    'details': {},
+    'recommendations': []
+}
+DEFAULT_METADATA = {
+    'audio_duration': None,
+    'audio_file': None
+}
+
+# Temp files staged for enrollment uploads, removed at interpreter exit
+_staged_uploads = set()
+
+
+@atexit.register
+def _remove_staged_uploads() -> None:
+    """Delete staged upload temp files still on disk."""
+    for path in list(_staged_uploads):
+        path.unlink(missing_ok=True)
+
 
 def render_enrollment_tab():
     """Render the speaker enrollment interface."""
     st.header("👤 Speaker Enrollment")
     st.markdown("Create a speaker profile from reference audio samples")
     
-    # Initialize services
-    if 'profile_manager' not in st.session_state:
-        st.session_state.profile_manager = ProfileManager()
-    
-    if 'identification_service' not in st.session_state:
-        st.session_state.identification_service = IdentificationService()
+    # Clear temp files leaked by earlier sessions (once per session)
+    if not st.session_state.get('_tmp_swept'):
+        _sweep_stale_temp_files()
+        st.session_state._tmp_swept = True
     
-    profile_manager = st.session_state.profile_manager
-    identification = st.session_state.identification_service
+    # Services are shared across sessions; the embedding model loads on
+    # first profile creation
+    profile_manager = get_profile_manager()
     
     # Two columns: Create Profile | Manage Profiles
     col1, col2 = st.columns([1, 1])
@@ -37,14 +106,7 @@ def render_enrollment_tab():
     with col1:
         st.subheader("Create New Profile")
         
-        # Speaker name input
-        speaker_name = st.text_input(
-            "Speaker Name",
-            placeholder="e.g., John Doe",
-            help="Enter the name of the person you want to identify"
-        )
-        
-        # Audio input method selection
+        # Audio input method selection (outside the form: it switches widgets)
         audio_input_method = st.radio(
             "Audio Input Method",
             options=["Upload File", "Record from Microphone"],
@@ -52,346 +114,939 @@ def render_enrollment_tab():
             help="Choose how to provide reference audio"
         )
         
-        uploaded_file = None
-        temp_path = None
-        duration = None
-        file_extension = None
-        
-        if audio_input_method == "Upload File":
-            # Audio file upload
-            uploaded_file = st.file_uploader(
-                "Upload Reference Audio",
-                type=["wav", "mp3", "m4a", "flac"],
-                help="Upload a clear audio sample of the target speaker (minimum 3 seconds recommended)"
+        # Inputs are batched in a form so typing the name or choosing a file
+        # doesn't rerun the script; staging, validation and extraction all
+        # happen once, on submit
+        with st.form("create_profile", clear_on_submit=False):
+            # Speaker name input
+            speaker_name = st.text_input(
+                "Speaker Name",
+                placeholder="e.g., John Doe",
+                help="Enter the name of the person you want to identify"
             )
-        else:
-            # Microphone recording
-            st.markdown("**🎤 Record from Microphone**")
-            st.info("Speak clearly for 5-10 seconds. Longer recordings work better!")
             
-            # Use Streamlit's audio_input (available in recent versions)
-            recorded_audio = st.audio_input("Record your voice")
+            if audio_input_method == "Upload File":
+                # Audio file upload (several clips are joined into one sample)
+                uploaded_file = st.file_uploader(
+                    "Upload Reference Audio",
+                    type=["wav", "mp3", "m4a", "flac"],
+                    accept_multiple_files=True,
+                    help="Upload clear audio of the target speaker (minimum 3 seconds recommended). "
+                         "Select several clips of the same speaker to combine them into one profile."
+                )
+            else:
+                # Microphone recording
+                st.markdown("**🎤 Record from Microphone**")
+                st.info("Speak clearly for 5-10 seconds. Longer recordings work better!")
+                
+                # Use Streamlit's audio_input (available in recent versions)
+                # Recorded audio is treated the same as an uploaded file
+                uploaded_file = st.audio_input("Record your voice")
             
-            if recorded_audio is not None:
-                uploaded_file = recorded_audio  # Treat recorded audio same as uploaded file
-                st.success("✓ Recording captured!")
+            # Create profile button
+            submitted = st.form_submit_button("Create Profile", type="primary")
         
-        # Process audio (uploaded or recorded)
-        if uploaded_file is not None:
-            # Preview audio
-            file_extension = uploaded_file.name.split('.')[-1] if hasattr(uploaded_file, 'name') and '.' in uploaded_file.name else 'wav'
-            st.audio(uploaded_file, format=f"audio/{file_extension}")
-            
-            # Show file info
-            suffix = f".{file_extension}" if file_extension else ".wav"
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                temp_path = Path(tmp_file.name)
+        if submitted:
+            if not speaker_name or not uploaded_file:
+                st.warning("⚠️ Enter a speaker name and provide reference audio.")
+            else:
+                if isinstance(uploaded_file, list):
+                    uploaded_file = uploaded_file[0] if len(uploaded_file) == 1 else _combine_clips(uploaded_file)
+                
+                if uploaded_file is not None:
+                    _create_profile(profile_manager, speaker_name, uploaded_file, audio_input_method)
+        
+        # Batch enrollment: one profile per audio file, named after the file
+        with st.expander("📦 Batch Enroll", expanded=False):
+            batch_zip = st.file_uploader(
+                "Upload a zip of reference audio files",
+                type=["zip"],
+                help="Each file becomes a profile named after the file (e.g. john_doe.wav -> john_doe)",
+                key="batch_enroll_zip"
+            )
             
-            try:
-                if validate_audio_file(temp_path):
-                    duration = get_audio_duration(temp_path)
-                    st.info(f"📊 Duration: {duration:.1f}s")
+            if st.button("Enroll All", disabled=batch_zip is None):
+                _batch_enroll(profile_manager, batch_zip)
+    
+    with col2:
+        _render_manage_profiles(profile_manager)
+    
+    # Show current selected profile at bottom
+    if st.session_state.current_profile:
+        st.markdown("---")
+        st.info(f"🎯 **Current Profile:** {st.session_state.current_profile['name']}")
+
+
+
+@st.fragment
+def _render_manage_profiles(profile_manager: ProfileManager):
+    """
+    Render the Manage Profiles column.
+    
+    Runs as a fragment: searching, paging, deleting and importing rerun
+    only this column, not the Create Profile form.
+    
+    Args:
+        profile_manager: Profile manager to list and modify
+    """
+    st.subheader("Manage Profiles")
+    
+    # Get all profiles (served from memory until the store changes)
+    profiles = list_profiles(profile_manager)
+    
+    if not profiles:
+        st.info("📝 No profiles yet. Create one on the left!")
+    else:
+        st.success(f"📚 {len(profiles)} profile(s) available")
+        
+        # Search profiles
+        search_query = st.text_input(
+            "🔍 Search profiles",
+            placeholder="Type to search..."
+        )
+        
+        if len(profiles) > PROFILE_TABLE_THRESHOLD:
+            # One table element instead of an expander per profile
+            _render_profile_table(profile_manager, search_query)
+        else:
+            _render_profile_cards(profile_manager, search_query)
+        
+        # Export/Import section
+        st.markdown("---")
+        st.subheader("📤 Export / Import")
+        
+        id_to_name = {p['id']: p['name'] for p in profiles}
+        
+        # Export
+        profile_to_export = st.selectbox(
+            "Export Profile",
+            options=[p['id'] for p in profiles],
+            format_func=id_to_name.__getitem__,
+            key="enrollment_export_profile"
+        )
+        
+        # Serve exports straight from memory; nothing is written to disk
+        col_exp1, col_exp2 = st.columns(2)
+        
+        with col_exp1:
+            if st.button("Export Profile"):
+                try:
+                    st.download_button(
+                        "Download Profile",
+                        profile_manager.export_profile_json(profile_to_export),
+                        file_name=f"profile_{profile_to_export[:8]}.json",
+                        mime="application/json"
+                    )
+                except Exception as e:
+                    st.error(f"Export failed: {e}")
+        
+        with col_exp2:
+            if st.button("Export All"):
+                try:
+                    st.download_button(
+                        "Download All (.zip)",
+                        _export_profiles_zip(profile_manager, [p['id'] for p in profiles]),
+                        file_name="profiles.zip",
+                        mime="application/zip"
+                    )
+                except Exception as e:
+                    st.error(f"Export failed: {e}")
+        
+        # Import
+        st.markdown("**Import Profile:**")
+        import_file = st.file_uploader(
+            "Upload Profile JSON",
+            type=["json"],
+            key="profile_import"
+        )
+        
+        if import_file is not None:
+            if st.button("Import Profile"):
+                try:
+                    # Save to temp file
+                    tmp_path = _save_upload(import_file, ".json")
                     
-                    if duration < 3.0:
-                        st.warning("⚠️ Audio is short. Longer samples (>5s) work better.")
-                else:
-                    st.error("❌ Invalid audio file")
-                    temp_path.unlink()
-                    return
+                    # Import
+                    imported_profile = profile_manager.import_profile(tmp_path)
+                    tmp_path.unlink()
                     
-            except Exception as e:
-                st.error(f"Error validating audio: {e}")
-                temp_path.unlink()
-                return
+                    st.toast(f"✅ Imported: {imported_profile['name']}")
+                    st.rerun(scope="fragment")
+                    
+                except Exception as e:
+                    st.error(f"Import failed: {e}")
+
+
+def _render_profile_cards(profile_manager: ProfileManager, search_query: str):
+    """
+    Render one page of matching profiles as expandable cards.
+    
+    Args:
+        profile_manager: Profile manager the profiles belong to
+        search_query: Name filter from the search box
+    """
+    # Fetch only the page being shown, filtered on cached lowercase names
+    page = st.session_state.get("enrollment_profiles_page", 1)
+    page_profiles, total = query_profiles(
+        profile_manager,
+        search_query or None,
+        offset=(page - 1) * PROFILES_PER_PAGE,
+        limit=PROFILES_PER_PAGE
+    )
+    
+    page_count = max(1, math.ceil(total / PROFILES_PER_PAGE))
+    if page > page_count:
+        # A narrower search can leave the remembered page out of range
+        page = page_count
+        st.session_state.enrollment_profiles_page = page
+        page_profiles, total = query_profiles(
+            profile_manager,
+            search_query or None,
+            offset=(page - 1) * PROFILES_PER_PAGE,
+            limit=PROFILES_PER_PAGE
+        )
+    
+    # Display one page of profiles; each expander costs dozens of widgets
+    if page_count > 1:
+        st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count,
+            key="enrollment_profiles_page"
+        )
+        st.caption(f"Page {page} of {page_count} ({total} profiles)")
+    
+    # Display profiles
+    for profile in page_profiles:
+        # Get quality info if available, resolving fallbacks once
+        quality_info = profile.get('quality', {})
+        q = SimpleNamespace(**{**DEFAULT_QUALITY, **quality_info})
+        m = SimpleNamespace(**{**DEFAULT_METADATA, **profile.get('metadata', {})})
         
-        # Create profile button
-        if st.button("Create Profile", type="primary", disabled=not speaker_name or uploaded_file is None):
-            if speaker_name and uploaded_file:
-                with st.spinner("Creating speaker profile..."):
+        # Include quality in expander title if available
+        title = f"{q.quality_emoji} {profile['name']}"
+        if q.quality_label:
+            title += f" - {q.quality_label}"
+        
+        with st.expander(title, expanded=False):
+            # Profile Info Section
+            st.markdown("### 📋 Profile Information")
+            col_info1, col_info2 = st.columns(2)
+            
+            with col_info1:
+                st.text(f"ID: {profile['short_id']}...")
+                st.text(f"Created: {profile['created_date'][:10]}")
+            
+            with col_info2:
+                # Metadata
+                if m.audio_duration is not None:
+                    st.text(f"Duration: {m.audio_duration:.1f}s")
+                if m.audio_file is not None:
+                    st.text(f"File: {m.audio_file}")
+            
+            # Quality Assessment Section
+            if quality_info:
+                # Profiles created before display strings were stored
+                # fall back to formatting here
+                display = q.display or format_quality_display(quality_info)
+                
+                st.markdown("---")
+                st.markdown("### 📊 Quality Assessment")
+                
+                # Overall quality with large display
+                col_q1, col_q2, col_q3 = st.columns([1, 2, 2])
+                with col_q1:
+                    st.markdown(f"<div style='font-size: 48px; text-align: center;'>{q.quality_emoji}</div>", unsafe_allow_html=True)
+                with col_q2:
+                    st.metric("Quality", q.quality_label or 'Unknown')
+                with col_q3:
+                    st.metric("Score", display['overall'])
+                
+                # Visual quality bar
+                progress_color = "green" if q.overall_score >= 0.8 else "orange" if q.overall_score >= 0.65 else "red"
+                st.progress(q.overall_score, text=f"Overall Quality: {display['overall_percent']}")
+                
+                # Component scores
+                if 'duration_score' in display:
+                    st.markdown("**Component Scores:**")
+                    _render_component_scores(display)
+                
+                # Detailed metrics
+                details = q.details
+                if details:
+                    with st.expander("🔍 Detailed Metrics", expanded=False):
+                        col_d1, col_d2 = st.columns(2)
+                        with col_d1:
+                            if 'duration_seconds' in details:
+                                st.text(f"Duration: {details['duration_seconds']:.1f}s")
+                            if 'rms_level' in details:
+                                st.text(f"RMS Level: {details['rms_level']:.3f}")
+                            if 'peak_level' in details:
+                                st.text(f"Peak Level: {details['peak_level']:.3f}")
+                        with col_d2:
+                            if 'snr_estimate_db' in details:
+                                st.text(f"SNR: {details['snr_estimate_db']:.1f} dB")
+                            if 'embedding_norm' in details:
+                                st.text(f"Embedding Norm: {details['embedding_norm']:.3f}")
+                            if 'embedding_std' in details:
+                                st.text(f"Embedding Std: {details['embedding_std']:.3f}")
+                
+                # Recommendations
+                if q.recommendations:
+                    st.markdown("**💡 Recommendations:**")
+                    for rec in q.recommendations:
+                        st.caption(rec)
+            else:
+                st.info("ℹ️ Quality information not available for this profile. Re-create the profile to assess quality.")
+            
+            # Action buttons at the bottom
+            st.markdown("---")
+            col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
+            
+            with col_btn1:
+                if st.button("✅ Select", key=f"select_{profile['id']}", help="Use this profile", use_container_width=True):
+                    full_profile = load_profile(profile_manager, profile['id'])
+                    st.session_state.current_profile = full_profile
+                    st.toast(f"✓ Selected: {profile['name']}")
+                    # The current-profile banner sits outside this fragment
+                    st.rerun()
+            
+            with col_btn2:
+                if st.button("� Export", key=f"export_{profile['id']}", help="Export this profile", use_container_width=True):
+                    # Serialized in memory and downloaded; nothing is written to disk
                     try:
-                        # Extract embedding
-                        st.info("🔍 Extracting speaker embedding...")
-                        embedding = identification.extract_embedding(temp_path)
-                        
-                        # Assess profile quality
-                        st.info("📊 Assessing profile quality...")
-                        quality_result = identification.assess_profile_quality(
-                            audio_file=temp_path,
-                            embedding=embedding
-                        )
-                        
-                        # Display quality assessment
-                        st.markdown("### Quality Assessment")
-                        
-                        # Overall quality with large emoji and score
-                        col_q1, col_q2, col_q3 = st.columns([1, 2, 2])
-                        with col_q1:
-                            st.markdown(f"## {quality_result['quality_emoji']}")
-                        with col_q2:
-                            st.metric("Overall Quality", quality_result['quality_label'])
-                        with col_q3:
-                            st.metric("Quality Score", f"{quality_result['overall_score']:.2f}")
-                        
-                        # Detailed scores
-                        st.markdown("**Component Scores:**")
-                        col_s1, col_s2, col_s3, col_s4 = st.columns(4)
-                        with col_s1:
-                            st.metric("Duration", f"{quality_result['duration_score']:.2f}")
-                        with col_s2:
-                            st.metric("Audio Level", f"{quality_result['audio_level_score']:.2f}")
-                        with col_s3:
-                            st.metric("Embedding", f"{quality_result['embedding_score']:.2f}")
-                        with col_s4:
-                            st.metric("SNR", f"{quality_result['snr_score']:.2f}")
-                        
-                        # Show recommendations
-                        if quality_result['recommendations']:
-                            st.markdown("**Recommendations:**")
-                            for rec in quality_result['recommendations']:
-                                st.markdown(f"- {rec}")
-                        
-                        # Show detailed metrics in expander
-                        with st.expander("📋 Detailed Metrics"):
-                            details = quality_result['details']
-                            st.json(details)
-                        
-                        # Create profile
-                        st.info("💾 Saving profile...")
-                        audio_filename = uploaded_file.name if hasattr(uploaded_file, 'name') else f"recorded_audio_{speaker_name}.wav"
-                        profile = profile_manager.create_profile(
-                            name=speaker_name,
-                            embedding=embedding,
-                            audio_file=audio_filename,
-                            metadata={
-                                "audio_duration": duration,
-                                "file_format": file_extension,
-                                "source": audio_input_method,
-                                "quality": quality_result  # Store quality info
-                            }
+                        st.download_button(
+                            "Download",
+                            profile_manager.export_profile_json(profile['id']),
+                            file_name=f"profile_{profile['name'].replace(' ', '_')}.json",
+                            mime="application/json",
+                            key=f"download_{profile['id']}",
+                            use_container_width=True
                         )
-                        
-                        # Clean up temp file
-                        temp_path.unlink()
-                        
-                        st.success(f"✅ Profile created successfully!")
-                        st.info(f"Profile ID: `{profile['id']}`")
-                        
-                        # Store in session state
-                        st.session_state.current_profile = profile
-                        
-                        # Rerun to refresh profile list
-                        st.rerun()
-                        
                     except Exception as e:
-                        st.error(f"❌ Failed to create profile: {e}")
-                        logger.error(f"Profile creation failed: {e}")
-                        if temp_path.exists():
-                            temp_path.unlink()
+                        st.error(f"Export failed: {e}")
+            
+            with col_btn3:
+                if st.button("�🗑️ Delete", key=f"delete_{profile['id']}", help="Delete this profile", use_container_width=True):
+                    if profile_manager.delete_profile(profile['id']):
+                        st.toast(f"Deleted: {profile['name']}")
+                        st.rerun(scope="fragment")
+                    else:
+                        st.error("Failed to delete profile")
+
+
+def _render_profile_table(profile_manager: ProfileManager, search_query: str):
+    """
+    Render all matching profiles as a single editable table.
     
-    with col2:
-        st.subheader("Manage Profiles")
-        
-        # Get all profiles
-        profiles = profile_manager.list_profiles()
+    Used for large profile stores, where an expander per profile costs
+    dozens of widgets each. Select and Delete are checkbox columns.
+    
+    Args:
+        profile_manager: Profile manager the profiles belong to
+        search_query: Name filter from the search box
+    """
+    import pandas as pd
+    
+    matches, _ = query_profiles(profile_manager, search_query or None, limit=None)
+    
+    if not matches:
+        st.info("No profiles match the search.")
+        return
+    
+    # Checkbox state is per search, since rows are positional
+    table_key = f"enrollment_profile_table:{search_query}"
+    
+    quality_default = DEFAULT_QUALITY['quality_label']
+    table = pd.DataFrame([
+        {
+            "Select": False,
+            "Delete": False,
+            "Name": p['name'],
+            "Quality": p.get('quality', {}).get('quality_label', quality_default),
+            "Duration (s)": p.get('metadata', {}).get('audio_duration'),
+            "Created": p['created_date'][:10],
+            "ID": p['short_id']
+        }
+        for p in matches
+    ])
+    
+    edited = st.data_editor(
+        table,
+        column_config={
+            "Select": st.column_config.CheckboxColumn(help="Use this profile"),
+            "Delete": st.column_config.CheckboxColumn(help="Mark for deletion"),
+            "Duration (s)": st.column_config.NumberColumn(format="%.1f")
+        },
+        disabled=["Name", "Quality", "Duration (s)", "Created", "ID"],
+        hide_index=True,
+        use_container_width=True,
+        key=table_key
+    )
+    
+    selected = edited.index[edited["Select"]].tolist()
+    if selected:
+        profile = matches[selected[-1]]
+        current = st.session_state.current_profile
+        if current is None or current['id'] != profile['id']:
+            st.session_state.current_profile = load_profile(profile_manager, profile['id'])
+            st.toast(f"✓ Selected: {profile['name']}")
+            # The current-profile banner sits outside this fragment
+            st.rerun()
+    
+    to_delete = [matches[i] for i in edited.index[edited["Delete"]]]
+    if to_delete and st.button(f"🗑️ Delete {len(to_delete)} profile(s)", type="secondary"):
+        for profile in to_delete:
+            if not profile_manager.delete_profile(profile['id']):
+                st.error(f"Failed to delete: {profile['name']}")
         
-        if not profiles:
-            st.info("📝 No profiles yet. Create one on the left!")
+        # Drop the checkbox state; its rows no longer line up
+        st.session_state.pop(table_key, None)
+        st.rerun(scope="fragment")
+
+
+def _create_profile(
+    profile_manager: ProfileManager,
+    speaker_name: str,
+    uploaded_file,
+    audio_input_method: str
+):
+    """
+    Validate reference audio and create a profile from it.
+    
+    Args:
+        profile_manager: Profile manager to save the profile with
+        speaker_name: Name for the new profile
+        uploaded_file: Uploaded or recorded audio
+        audio_input_method: Input method label, stored as the profile source
+    """
+    # Preview audio
+    file_extension = os.path.splitext(getattr(uploaded_file, 'name', ''))[1].lstrip('.').lower() or 'wav'
+    st.audio(uploaded_file, format=f"audio/{file_extension}")
+    
+    # Reject obviously non-audio uploads before writing or decoding them
+    uploaded_file.seek(0)
+    header = uploaded_file.read(12)
+    uploaded_file.seek(0)
+    if sniff_audio_format(header) is None:
+        st.error("❌ Invalid audio file")
+        return
+    
+    # Show file info
+    suffix = f".{file_extension}"
+    temp_path, content_hash = _stage_upload(uploaded_file, suffix)
+    
+    try:
+        is_valid, duration = _probe_audio(content_hash, temp_path)
+        if is_valid:
+            st.info(f"📊 Duration: {duration:.1f}s")
+            
+            if duration < 3.0:
+                st.warning("⚠️ Audio is short. Longer samples (>5s) work better.")
         else:
-            st.success(f"📚 {len(profiles)} profile(s) available")
+            st.error("❌ Invalid audio file")
+            temp_path.unlink()
+            return
+            
+    except Exception as e:
+        st.error(f"Error validating audio: {e}")
+        temp_path.unlink()
+        return
+    
+    with st.spinner("Creating speaker profile..."):
+        try:
+            # Same audio -> same embedding; repeats skip the model entirely
+            st.info("🔍 Extracting speaker embedding...")
+            embedding, quality_result = _analyze_upload(uploaded_file, temp_path, content_hash)
             
-            # Search profiles
-            search_query = st.text_input(
-                "🔍 Search profiles",
-                placeholder="Type to search..."
+            # Display quality assessment
+            st.markdown("### Quality Assessment")
+            
+            # Overall quality with large emoji and score
+            col_q1, col_q2, col_q3 = st.columns([1, 2, 2])
+            with col_q1:
+                st.markdown(f"## {quality_result['quality_emoji']}")
+            with col_q2:
+                st.metric("Overall Quality", quality_result['quality_label'])
+            with col_q3:
+                st.metric("Quality Score", f"{quality_result['overall_score']:.2f}")
+            
+            # Detailed scores
+            st.markdown("**Component Scores:**")
+            _render_component_scores(format_quality_display(quality_result))
+            
+            # Show recommendations
+            if quality_result['recommendations']:
+                st.markdown("**Recommendations:**")
+                for rec in quality_result['recommendations']:
+                    st.markdown(f"- {rec}")
+            
+            # Show detailed metrics in expander
+            with st.expander("📋 Detailed Metrics"):
+                details = quality_result['details']
+                st.json(details)
+            
+            # Create profile
+            st.info("💾 Saving profile...")
+            audio_filename = uploaded_file.name if hasattr(uploaded_file, 'name') else f"recorded_audio_{speaker_name}.wav"
+            profile = profile_manager.create_profile(
+                name=speaker_name,
+                embedding=embedding,
+                audio_file=audio_filename,
+                metadata={
+                    "audio_duration": duration,
+                    "file_format": file_extension,
+                    "source": audio_input_method,
+                    "quality": quality_result  # Store quality info
+                }
             )
             
-            # Filter profiles
-            if search_query:
-                filtered_profiles = [
-                    p for p in profiles
-                    if search_query.lower() in p["name"].lower()
-                ]
-            else:
-                filtered_profiles = profiles
+            # Clean up temp file
+            temp_path.unlink()
+            
+            st.success(f"✅ Profile created successfully!")
+            st.info(f"Profile ID: `{profile['id']}`")
+            st.toast(f"✅ Profile created: {speaker_name}")
             
-            # Display profiles
-            for profile in filtered_profiles:
-                # Get quality info if available
-                quality_info = profile.get('quality', {})
-                quality_emoji = quality_info.get('quality_emoji', '📊')
-                quality_label = quality_info.get('quality_label', '')
+            # Store in session state (Manage Profiles renders after this in
+            # the same run, so it already lists the new profile)
+            st.session_state.current_profile = profile
+            
+        except Exception as e:
+            st.error(f"❌ Failed to create profile: {e}")
+            logger.error(f"Profile creation failed: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+
+
+def _combine_clips(uploaded_files: list) -> Optional[io.BytesIO]:
+    """
+    Join several reference clips of one speaker into a single WAV.
+    
+    The joined audio then goes through profile creation as one upload, so
+    the embedding model runs once over all clips instead of once per clip.
+    
+    Args:
+        uploaded_files: Uploaded clips, in order
+    
+    Returns:
+        In-memory WAV named after the clip count, or None if a clip is
+        not valid audio (an error is shown)
+    """
+    temp_paths = []
+    
+    try:
+        for uploaded_file in uploaded_files:
+            uploaded_file.seek(0)
+            header = uploaded_file.read(12)
+            if sniff_audio_format(header) is None:
+                st.error(f"❌ Invalid audio file: {uploaded_file.name}")
+                return None
+            
+            temp_paths.append(_save_upload(uploaded_file, Path(uploaded_file.name).suffix))
+        
+        combined = io.BytesIO()
+        duration = concatenate_audio_files(temp_paths, combined)
+        combined.name = f"combined_{len(uploaded_files)}_clips.wav"
+        combined.seek(0)
+        
+        st.info(f"🔗 Combined {len(uploaded_files)} clips ({duration:.1f}s)")
+        return combined
+        
+    except ValueError as e:
+        st.error(f"❌ Could not combine clips: {e}")
+        return None
+    
+    finally:
+        for temp_path in temp_paths:
+            temp_path.unlink(missing_ok=True)
+
+
+def _batch_enroll(profile_manager: ProfileManager, zip_file):
+    """
+    Create one profile per audio file in an uploaded zip archive.
+    
+    Files are processed concurrently (at most BATCH_ENROLL_CONCURRENCY at
+    a time) so decoding and quality analysis overlap model inference, and
+    share the embedding cache with single-profile creation.
+    
+    Args:
+        profile_manager: Profile manager to save profiles with
+        zip_file: Uploaded zip archive
+    """
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audio_paths = _extract_audio_files(zip_file, Path(temp_dir))
+            
+            if not audio_paths:
+                st.warning("⚠️ No audio files found in the archive.")
+                return
+            
+            identification = get_identification_service()
+            progress_bar = st.progress(0.0, text=f"Enrolling {len(audio_paths)} speakers...")
+            
+            def analyze(path: Path) -> Tuple[np.ndarray, Dict]:
+                # Recordings enrolled before (singly or in a batch) skip the model
+                content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+                return _analyze_audio(path, content_hash, identification)
+            
+            async def run_all() -> list:
+                semaphore = asyncio.Semaphore(BATCH_ENROLL_CONCURRENCY)
+                done = 0
                 
-                # Include quality in expander title if available
-                title = f"{quality_emoji} {profile['name']}"
-                if quality_label:
-                    title += f" - {quality_label}"
+                async def run_one(path: Path):
+                    nonlocal done
+                    async with semaphore:
+                        try:
+                            return await asyncio.to_thread(analyze, path)
+                        finally:
+                            done += 1
+                            progress_bar.progress(done / len(audio_paths), text=f"Processed {path.name}")
                 
-                with st.expander(title, expanded=False):
-                    # Profile Info Section
-                    st.markdown("### 📋 Profile Information")
-                    col_info1, col_info2 = st.columns(2)
-                    
-                    with col_info1:
-                        st.text(f"ID: {profile['id'][:8]}...")
-                        st.text(f"Created: {profile['created_date'][:10]}")
-                    
-                    with col_info2:
-                        # Metadata
-                        metadata = profile.get('metadata', {})
-                        if 'audio_duration' in metadata:
-                            st.text(f"Duration: {metadata['audio_duration']:.1f}s")
-                        if 'audio_file' in metadata:
-                            st.text(f"File: {metadata['audio_file']}")
-                    
-                    # Quality Assessment Section
-                    if quality_info:
-                        st.markdown("---")
-                        st.markdown("### 📊 Quality Assessment")
-                        
-                        # Overall quality with large display
-                        col_q1, col_q2, col_q3 = st.columns([1, 2, 2])
-                        with col_q1:
-                            st.markdown(f"<div style='font-size: 48px; text-align: center;'>{quality_info.get('quality_emoji', '📊')}</div>", unsafe_allow_html=True)
-                        with col_q2:
-                            st.metric("Quality", quality_info.get('quality_label', 'Unknown'))
-                        with col_q3:
-                            st.metric("Score", f"{quality_info.get('overall_score', 0):.2f}")
-                        
-                        # Visual quality bar
-                        overall_score = quality_info.get('overall_score', 0)
-                        progress_color = "green" if overall_score >= 0.8 else "orange" if overall_score >= 0.65 else "red"
-                        st.progress(overall_score, text=f"Overall Quality: {overall_score:.0%}")
-                        
-                        # Component scores
-                        if 'duration_score' in quality_info:
-                            st.markdown("**Component Scores:**")
-                            col_s1, col_s2, col_s3, col_s4 = st.columns(4)
-                            with col_s1:
-                                st.metric("Duration", f"{quality_info['duration_score']:.2f}", 
-                                         help="Audio length quality (30-60s ideal)")
-                            with col_s2:
-                                st.metric("Audio Level", f"{quality_info['audio_level_score']:.2f}",
-                                         help="Volume and clipping check")
-                            with col_s3:
-                                st.metric("Embedding", f"{quality_info['embedding_score']:.2f}",
-                                         help="Voice fingerprint quality")
-                            with col_s4:
-                                st.metric("SNR", f"{quality_info['snr_score']:.2f}",
-                                         help="Signal-to-noise ratio")
-                        
-                        # Detailed metrics
-                        details = quality_info.get('details', {})
-                        if details:
-                            with st.expander("🔍 Detailed Metrics", expanded=False):
-                                col_d1, col_d2 = st.columns(2)
-                                with col_d1:
-                                    if 'duration_seconds' in details:
-                                        st.text(f"Duration: {details['duration_seconds']:.1f}s")
-                                    if 'rms_level' in details:
-                                        st.text(f"RMS Level: {details['rms_level']:.3f}")
-                                    if 'peak_level' in details:
-                                        st.text(f"Peak Level: {details['peak_level']:.3f}")
-                                with col_d2:
-                                    if 'snr_estimate_db' in details:
-                                        st.text(f"SNR: {details['snr_estimate_db']:.1f} dB")
-                                    if 'embedding_norm' in details:
-                                        st.text(f"Embedding Norm: {details['embedding_norm']:.3f}")
-                                    if 'embedding_std' in details:
-                                        st.text(f"Embedding Std: {details['embedding_std']:.3f}")
-                        
-                        # Recommendations
-                        recommendations = quality_info.get('recommendations', [])
-                        if recommendations:
-                            st.markdown("**💡 Recommendations:**")
-                            for rec in recommendations:
-                                st.caption(rec)
-                    else:
-                        st.info("ℹ️ Quality information not available for this profile. Re-create the profile to assess quality.")
-                    
-                    # Action buttons at the bottom
-                    st.markdown("---")
-                    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
-                    
-                    with col_btn1:
-                        if st.button("✅ Select", key=f"select_{profile['id']}", help="Use this profile", use_container_width=True):
-                            full_profile = profile_manager.load_profile(profile['id'])
-                            st.session_state.current_profile = full_profile
-                            st.success(f"✓ Selected: {profile['name']}")
-                    
-                    with col_btn2:
-                        if st.button("� Export", key=f"export_{profile['id']}", help="Export this profile", use_container_width=True):
-                            try:
-                                output_path = profile_manager.config.results_dir / f"profile_{profile['name'].replace(' ', '_')}.json"
-                                profile_manager.export_profile(profile['id'], output_path)
-                                st.success(f"Exported to: {output_path.name}")
-                            except Exception as e:
-                                st.error(f"Export failed: {e}")
-                    
-                    with col_btn3:
-                        if st.button("�🗑️ Delete", key=f"delete_{profile['id']}", help="Delete this profile", use_container_width=True):
-                            if profile_manager.delete_profile(profile['id']):
-                                st.success(f"Deleted: {profile['name']}")
-                                st.rerun()
-                            else:
-                                st.error("Failed to delete profile")
+                return await asyncio.gather(
+                    *(run_one(path) for path in audio_paths),
+                    return_exceptions=True
+                )
             
-            # Export/Import section
-            st.markdown("---")
-            st.subheader("📤 Export / Import")
+            results = asyncio.run(run_all())
             
-            # Export
-            profile_to_export = st.selectbox(
-                "Export Profile",
-                options=[p['id'] for p in profiles],
-                format_func=lambda x: next(p['name'] for p in profiles if p['id'] == x),
-                key="enrollment_export_profile"
-            )
+            created, failed = 0, []
+            for path, result in zip(audio_paths, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Batch enrollment failed for {path.name}: {result}")
+                    failed.append(f"{path.name}: {result}")
+                    continue
+                
+                embedding, quality = result
+                profile_manager.create_profile(
+                    name=path.stem,
+                    embedding=embedding,
+                    audio_file=path.name,
+                    metadata={
+                        "audio_duration": quality.get("details", {}).get("duration_seconds"),
+                        "file_format": path.suffix.lstrip("."),
+                        "source": "Batch Enroll",
+                        "quality": quality
+                    }
+                )
+                created += 1
             
-            if st.button("Export Profile"):
-                try:
-                    output_path = profile_manager.config.results_dir / f"profile_{profile_to_export[:8]}.json"
-                    profile_manager.export_profile(profile_to_export, output_path)
-                    st.success(f"Exported to: {output_path}")
-                    
-                    # Download button
-                    with open(output_path, 'r') as f:
-                        st.download_button(
-                            "Download Profile",
-                            f.read(),
-                            file_name=f"profile_{profile_to_export[:8]}.json",
-                            mime="application/json"
-                        )
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
+            progress_bar.empty()
+        
+        st.success(f"✅ Created {created} profile(s)")
+        if failed:
+            st.error("❌ Failed:\n" + "\n".join(f"- {line}" for line in failed))
+        
+    except Exception as e:
+        st.error(f"❌ Batch enrollment failed: {e}")
+        logger.error(f"Batch enrollment failed: {e}")
+
+
+def _extract_audio_files(zip_file, target_dir: Path) -> List[Path]:
+    """
+    Extract the audio files from an uploaded zip into a directory.
+    
+    Each entry is written to its own numbered subdirectory under its file
+    name. Entries cannot escape target_dir, and same-named files from
+    different archive folders (alice/clip1.wav, bob/clip1.wav) do not
+    overwrite each other.
+    
+    Args:
+        zip_file: Uploaded zip archive
+        target_dir: Directory to extract into
+    
+    Returns:
+        Paths of the extracted audio files, sorted by file name
+    """
+    paths = []
+    
+    with zipfile.ZipFile(zip_file) as archive:
+        for index, info in enumerate(archive.infolist()):
+            name = Path(info.filename).name
+            if info.is_dir() or name.startswith(".") or Path(name).suffix.lower() not in AUDIO_EXTENSIONS:
+                continue
             
-            # Import
-            st.markdown("**Import Profile:**")
-            import_file = st.file_uploader(
-                "Upload Profile JSON",
-                type=["json"],
-                key="profile_import"
+            entry_dir = target_dir / str(index)
+            entry_dir.mkdir()
+            path = entry_dir / name
+            with archive.open(info) as src, open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=UPLOAD_CHUNK_BYTES)
+            paths.append(path)
+    
+    return sorted(paths, key=lambda path: (path.name, int(path.parent.name)))
+
+
+def _render_component_scores(display: Dict[str, str]):
+    """
+    Render the four quality component scores as metrics.
+    
+    Args:
+        display: Formatted scores from format_quality_display
+    """
+    col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+    with col_s1:
+        st.metric("Duration", display['duration_score'],
+                  help="Audio length quality (30-60s ideal)")
+    with col_s2:
+        st.metric("Audio Level", display['audio_level_score'],
+                  help="Volume and clipping check")
+    with col_s3:
+        st.metric("Embedding", display['embedding_score'],
+                  help="Voice fingerprint quality")
+    with col_s4:
+        st.metric("SNR", display['snr_score'],
+                  help="Signal-to-noise ratio")
+
+
+@st.cache_data(show_spinner=False)
+def _probe_audio(content_hash: str, _path: Path) -> Tuple[bool, Optional[float]]:
+    """
+    Validate an upload and read its duration, once per distinct content.
+    
+    Keyed by content hash only (the leading underscore keeps the temp path
+    out of the cache key), so reruns that re-stage the same audio skip
+    reopening and decoding it.
+    
+    Args:
+        content_hash: SHA-256 of the uploaded audio bytes
+        _path: Temp file holding the audio
+    
+    Returns:
+        Tuple of (is_valid, duration in seconds or None if invalid)
+    """
+    if not validate_audio_file(_path):
+        return False, None
+    return True, get_audio_duration(_path)
+
+
+def _export_profiles_zip(profile_manager: ProfileManager, profile_ids: List[str]) -> bytes:
+    """
+    Bundle exported profiles into an in-memory zip archive.
+    
+    Args:
+        profile_manager: Profile manager to read profiles from
+        profile_ids: IDs of the profiles to include
+    
+    Returns:
+        Zip archive bytes with one JSON file per profile
+    """
+    buffer = io.BytesIO()
+    
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for profile_id in profile_ids:
+            archive.writestr(
+                f"profile_{profile_id[:8]}.json",
+                profile_manager.export_profile_json(profile_id)
             )
-            
-            if import_file is not None:
-                if st.button("Import Profile"):
-                    try:
-                        # Save to temp file
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as tmp:
-                            tmp.write(import_file.getvalue())
-                            tmp_path = Path(tmp.name)
-                        
-                        # Import
-                        imported_profile = profile_manager.import_profile(tmp_path)
-                        tmp_path.unlink()
-                        
-                        st.success(f"✅ Imported: {imported_profile['name']}")
-                        st.rerun()
-                        
-                    except Exception as e:
-                        st.error(f"Import failed: {e}")
     
-    # Show current selected profile at bottom
-    if st.session_state.current_profile:
-        st.markdown("---")
-        st.info(f"🎯 **Current Profile:** {st.session_state.current_profile['name']}")
+    return buffer.getvalue()
+
+
+def _sweep_stale_temp_files() -> None:
+    """
+    Delete upload temp files left behind by earlier sessions.
+    
+    Only removes NamedTemporaryFile-style files (tmp*) with an enrollment
+    suffix, owned by the current user and untouched for STALE_TEMP_SECONDS.
+    """
+    temp_dir = Path(tempfile.gettempdir())
+    cutoff = time.time() - STALE_TEMP_SECONDS
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    suffixes = AUDIO_EXTENSIONS + (".json",)
+    removed = 0
+    
+    for path in temp_dir.glob("tmp*"):
+        if path.suffix.lower() not in suffixes:
+            continue
+        try:
+            stat = path.stat()
+            if stat.st_mtime > cutoff or (uid is not None and stat.st_uid != uid):
+                continue
+            path.unlink()
+            removed += 1
+        except OSError:
+            continue
+    
+    if removed:
+        logger.info(f"Removed {removed} stale upload temp file(s) from {temp_dir}")
+
+
+def _stage_upload(uploaded_file, suffix: str) -> Tuple[Path, str]:
+    """
+    Get a temp file holding an upload, reusing it across reruns.
+    
+    The temp path is remembered per content hash in session state, so
+    reruns with the same upload skip the disk write. Files staged for
+    earlier uploads are removed.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile (or recorded audio)
+        suffix: Temp file suffix, including the dot
+    
+    Returns:
+        Tuple of (temp file path, SHA-256 hex digest of the content)
+    """
+    # Hash the upload's buffer in place; only a miss copies it to disk
+    content_hash = _hash_upload(uploaded_file)
+    
+    staged = st.session_state.setdefault("_upload_tmp", {})
+    temp_path = staged.get(content_hash)
+    if temp_path is not None and temp_path.exists():
+        return temp_path, content_hash
+    
+    # Drop files staged for uploads that have since been replaced
+    for stale_path in staged.values():
+        stale_path.unlink(missing_ok=True)
+        _staged_uploads.discard(stale_path)
+    staged.clear()
+    
+    temp_path = _save_upload(uploaded_file, suffix)
+    staged[content_hash] = temp_path
+    _staged_uploads.add(temp_path)
+    
+    return temp_path, content_hash
+
+
+def _save_upload(uploaded_file, suffix: str) -> Path:
+    """
+    Stream an uploaded file to a named temp file.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile (or recorded audio)
+        suffix: Temp file suffix, including the dot
+    
+    Returns:
+        Path to the temp file (caller deletes it)
+    """
+    uploaded_file.seek(0)
+    
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        # Copy in 1 MB chunks instead of materializing the whole upload
+        shutil.copyfileobj(uploaded_file, tmp_file, length=UPLOAD_CHUNK_BYTES)
+    
+    uploaded_file.seek(0)
+    return Path(tmp_file.name)
+
+
+def _hash_upload(uploaded_file) -> str:
+    """SHA-256 of an upload's bytes, read from its buffer without copying."""
+    with uploaded_file.getbuffer() as view:
+        return hashlib.sha256(view).hexdigest()
+
+
+def _embedding_cache_key(content_hash: str) -> str:
+    """Key an upload's embedding by its content and the embedding model."""
+    return hashlib.sha256(f"{EMBEDDING_MODEL}:{content_hash}".encode()).hexdigest()
+
+
+def _embedding_cache_path(key: str) -> Path:
+    """On-disk location of a cached embedding."""
+    cache_dir = get_profile_manager().config.temp_dir / "embeddings"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{key}.npz"
+
+
+@st.cache_data(
+    hash_funcs={UploadedFile: _hash_upload, io.BytesIO: _hash_upload},
+    max_entries=64,
+    show_spinner=False
+)
+def _analyze_upload(uploaded_file, _temp_path: Path, _content_hash: str) -> Tuple[np.ndarray, Dict]:
+    """
+    Extract the embedding and assess quality for an upload, memoized by content.
+    
+    Streamlit hashes the UploadedFile by its bytes (see _hash_upload), so
+    the in-memory cache is shared by every session that submits the same
+    audio. Misses fall back to the on-disk cache before running the model.
+    
+    Args:
+        uploaded_file: Uploaded, recorded or combined audio (the cache key)
+        _temp_path: Staged copy of the audio (not hashed)
+        _content_hash: SHA-256 of the audio, for the on-disk cache (not hashed)
+    
+    Returns:
+        Tuple of (embedding, quality_result)
+    """
+    return _analyze_audio(_temp_path, _content_hash, get_identification_service())
+
+
+def _analyze_audio(path: Path, content_hash: str, identification) -> Tuple[np.ndarray, Dict]:
+    """
+    Extract the embedding and assess quality for an audio file.
+    
+    Results are persisted by content hash, so the model runs once per
+    unique recording across single and batch enrollment.
+    
+    Args:
+        path: Audio file
+        content_hash: SHA-256 of the file's bytes
+        identification: IdentificationService to run
+    
+    Returns:
+        Tuple of (embedding, quality_result)
+    """
+    cached = _load_cached_embedding(content_hash)
+    if cached is not None:
+        return cached
+    
+    # Signal-level quality checks need only the audio and not the model,
+    # so they run on a worker while the embedding is extracted; the
+    # enrollment takes the longer of the two rather than their sum
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        audio_future = executor.submit(identification.measure_audio_quality, path)
+        embedding = identification.extract_embedding(path)
+        
+        try:
+            audio_quality = audio_future.result()
+        except Exception as e:
+            logger.warning(f"Audio quality measurement failed: {e}")
+            audio_quality = None
+    
+    quality_result = identification.assess_profile_quality(
+        audio_file=path,
+        embedding=embedding,
+        audio_quality=audio_quality
+    )
+    
+    _store_cached_embedding(content_hash, embedding, quality_result)
+    
+    return embedding, quality_result
+
+
+def _load_cached_embedding(content_hash: str) -> Optional[Tuple[np.ndarray, Dict]]:
+    """
+    Look up the persisted embedding and quality assessment for an upload.
+    
+    Args:
+        content_hash: SHA-256 of the uploaded audio bytes
+    
+    Returns:
+        (embedding, quality_result), or None on a miss
+    """
+    path = _embedding_cache_path(_embedding_cache_key(content_hash))
+    if not path.exists():
+        return None
+    
+    try:
+        with np.load(path) as data:
+            return data["embedding"], json.loads(str(data["quality"]))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable embedding cache entry {path.name}: {e}")
+        return None
+
+
+def _store_cached_embedding(content_hash: str, embedding: np.ndarray, quality_result: Dict) -> None:
+    """
+    Persist the embedding and quality assessment for an upload.
+    
+    Args:
+        content_hash: SHA-256 of the uploaded audio bytes
+        embedding: Extracted embedding
+        quality_result: Result of assess_profile_quality
+    """
+    key = _embedding_cache_key(content_hash)
+    
+    try:
+        np.savez(_embedding_cache_path(key), embedding=embedding, quality=json.dumps(quality_result))
+    except Exception as e:
+        logger.warning(f"Failed to persist embedding cache entry: {e}")
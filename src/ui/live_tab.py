@@ -5,17 +5,55 @@ Provides real-time speaker monitoring and transcription.
 """
 
 import streamlit as st
+from collections import deque
 from datetime import datetime
+import html
+import threading
 import time
+from typing import TYPE_CHECKING
 import numpy as np
-import plotly.graph_objects as go
 
-from src.processors.realtime_processor import RealtimeProcessor
-from src.services.profile_manager import ProfileManager
+from src.ui.resources import (
+    LANGUAGE_LABELS,
+    get_profile_manager,
+    list_profiles,
+    new_realtime_processor
+)
 from src.utils.logger import get_logger
+from src.utils.spsc_ring import PerThreadRings
+
+if TYPE_CHECKING:
+    # The processor pulls in torch/pyannote; sessions get one through
+    # new_realtime_processor(), which imports it on first use
+    from src.processors.realtime_processor import RealtimeProcessor
 
 logger = get_logger(__name__)
 
+# Transcription languages offered, Hebrew first (the default)
+LANGUAGE_CODES = (
+    "he-IL", "en-US", "en-GB", "es-ES", "fr-FR", "de-DE",
+    "it-IT", "pt-BR", "ja-JP", "ko-KR", "zh-CN", "ar-SA"
+)
+
+# Points plotted in the live waveform, and their time axis (last 2 seconds)
+WAVEFORM_POINTS = 200
+WAVEFORM_TIME_AXIS = np.linspace(-2.0, 0.0, WAVEFORM_POINTS, dtype=np.float32)
+
+# Seconds between refreshes of the live region while monitoring
+LIVE_REFRESH_SECONDS = 0.5
+
+# Transcripts each worker thread can hand off between two UI drains. The
+# live panel drains every LIVE_REFRESH_SECONDS and workers emit at most a
+# few transcripts per second, so this only fills after minutes without a
+# refresh (e.g. an abandoned browser tab)
+TRANSCRIPT_RING_CAPACITY = 1024
+
+# Transcripts kept for display; older ones drop off (save_session keeps all)
+LIVE_TRANSCRIPT_LIMIT = 500
+
+# Target speaker transcripts rendered in the transcript panel (newest kept)
+LIVE_TRANSCRIPTS_SHOWN = 50
+
 
 def render_live_tab():
     """Render the live monitoring interface."""
@@ -24,30 +62,35 @@ def render_live_tab():
     
     # Initialize services
     if 'realtime_processor' not in st.session_state:
-        st.session_state.realtime_processor = RealtimeProcessor()
-    
-    if 'profile_manager' not in st.session_state:
-        st.session_state.profile_manager = ProfileManager()
+        st.session_state.realtime_processor = new_realtime_processor()
     
     realtime_processor = st.session_state.realtime_processor
-    profile_manager = st.session_state.profile_manager
+    profile_manager = get_profile_manager()
     
     # Initialize session state
     if 'monitoring_active' not in st.session_state:
         st.session_state.monitoring_active = False
     
     if 'live_transcripts' not in st.session_state:
-        st.session_state.live_transcripts = []
+        st.session_state.live_transcripts = deque(maxlen=LIVE_TRANSCRIPT_LIMIT)
+    
+    if 'live_stats' not in st.session_state:
+        st.session_state.live_stats = _new_stats()
+    
+    if 'live_transcript_html' not in st.session_state:
+        st.session_state.live_transcript_html = deque(maxlen=LIVE_TRANSCRIPTS_SHOWN)
     
     if 'session_start_time' not in st.session_state:
         st.session_state.session_start_time = None
     
-    if 'transcript_queue' not in st.session_state:
-        import queue
-        st.session_state.transcript_queue = queue.Queue()
-    
-    # Check if profiles exist
-    profiles = profile_manager.list_profiles()
+    # Check if profiles exist (served from memory until the store changes).
+    # The profile selector is locked while monitoring, so keep the list it
+    # was started with rather than re-checking the store
+    if st.session_state.monitoring_active and 'live_profiles' in st.session_state:
+        profiles = st.session_state.live_profiles
+    else:
+        profiles = list_profiles(profile_manager)
+        st.session_state.live_profiles = profiles
     
     if not profiles:
         st.warning("⚠️ No speaker profiles found. Please create a profile in the Enrollment tab first.")
@@ -59,34 +102,20 @@ def render_live_tab():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        # Audio device selection
+        # Audio device selection (enumerated at most every 30s; PortAudio
+        # enumeration is slow and the tab refreshes while monitoring)
         try:
-            devices = realtime_processor.get_audio_devices()
-            
-            # Find default device
-            default_device_index = None
-            try:
-                import pyaudio
-                p = pyaudio.PyAudio()
-                default_device_index = p.get_default_input_device_info()['index']
-                p.terminate()
-            except:
-                pass
-            
-            device_options = {
-                device['index']: f"{device['name']}{' 🎤 DEFAULT' if device['index'] == default_device_index else ''} ({device['channels']} ch)"
-                for device in devices
-            }
+            devices, default_device_index, device_options = _enumerate_audio_devices(realtime_processor)
             
             if device_options:
                 # Default to the system default device
-                default_selection = default_device_index if default_device_index in device_options else list(device_options.keys())[0]
+                device_indices = tuple(device_options)
                 
                 selected_device = st.selectbox(
                     "Audio Input Device",
-                    options=list(device_options.keys()),
-                    format_func=lambda x: device_options[x],
-                    index=list(device_options.keys()).index(default_selection) if default_selection in device_options else 0,
+                    options=device_indices,
+                    format_func=device_options.__getitem__,
+                    index=device_indices.index(default_device_index) if default_device_index in device_options else 0,
                     help="⚠️ Use the DEFAULT device - same as used for enrollment!",
                     key="live_audio_device"
                 )
@@ -100,13 +129,19 @@ def render_live_tab():
         except Exception as e:
             st.error(f"❌ Failed to enumerate audio devices: {e}")
             selected_device = None
+        
+        if st.button("🔄 Refresh devices", disabled=st.session_state.monitoring_active):
+            _enumerate_audio_devices.clear()
+            st.rerun()
     
     with col2:
+        id_to_name = {p['id']: p['name'] for p in profiles}
+        
         # Profile selection
         selected_profile_id = st.selectbox(
             "Target Speaker",
             options=[p['id'] for p in profiles],
-            format_func=lambda x: next(p['name'] for p in profiles if p['id'] == x),
+            format_func=id_to_name.__getitem__,
             help="Select the speaker profile to monitor",
             disabled=st.session_state.monitoring_active,
             key="live_target_profile"
@@ -134,19 +169,9 @@ def render_live_tab():
     with col4:
         language = st.selectbox(
             "Language",
-            options=[
-                "he-IL", "en-US", "en-GB", "es-ES", "fr-FR", "de-DE",
-                "it-IT", "pt-BR", "ja-JP", "ko-KR", "zh-CN", "ar-SA"
-            ],
+            options=LANGUAGE_CODES,
             index=0,  # Default to Hebrew (he-IL)
-            format_func=lambda x: {
-                "en-US": "English (US)", "en-GB": "English (UK)",
-                "he-IL": "Hebrew (Israel)", "es-ES": "Spanish (Spain)",
-                "fr-FR": "French (France)", "de-DE": "German (Germany)",
-                "it-IT": "Italian (Italy)", "pt-BR": "Portuguese (Brazil)",
-                "ja-JP": "Japanese (Japan)", "ko-KR": "Korean (Korea)",
-                "zh-CN": "Chinese (Mandarin)", "ar-SA": "Arabic (Saudi Arabia)"
-            }.get(x, x),
+            format_func=LANGUAGE_LABELS.get,
             help="Select the language for transcription",
             disabled=st.session_state.monitoring_active,
             key="live_language"
@@ -165,9 +190,10 @@ def render_live_tab():
                 # Reload the config module
                 importlib.reload(config_manager)
                 
-                # Reinitialize services with new config
-                st.session_state.realtime_processor = RealtimeProcessor()
-                st.session_state.profile_manager = ProfileManager()
+                # Reinitialize services with new config (the shared
+                # embedding model is config-independent and is kept)
+                get_profile_manager.clear()
+                st.session_state.realtime_processor = new_realtime_processor()
                 
                 st.success("✅ Configuration reloaded successfully!")
                 st.rerun()
@@ -192,6 +218,11 @@ def render_live_tab():
     # Control Section
     st.subheader("🎛️ Controls")
     
+    # Set by start/stop before their rerun, shown once afterwards
+    notice = st.session_state.pop('live_notice', None)
+    if notice:
+        st.success(notice)
+    
     col1, col2, col3 = st.columns([1, 1, 2])
     
     with col1:
@@ -201,16 +232,21 @@ def render_live_tab():
                 type="primary",
                 disabled=selected_device is None
             ):
-                start_monitoring(
+                started = start_monitoring(
                     realtime_processor,
                     selected_device,
                     selected_profile_id,
                     threshold,
                     language
                 )
+                # Only the fragments refresh on their own; rerun the page so
+                # the controls and configuration reflect the new state
+                if started:
+                    st.rerun()
         else:
             if st.button("⏹️ Stop Monitoring", type="secondary"):
-                stop_monitoring(realtime_processor)
+                if stop_monitoring(realtime_processor):
+                    st.rerun()
     
     with col2:
         if st.session_state.monitoring_active:
@@ -220,26 +256,76 @@ def render_live_tab():
     
     with col3:
         if st.session_state.monitoring_active and st.session_state.session_start_time:
-            elapsed = (datetime.now() - st.session_state.session_start_time).total_seconds()
-            st.text(f"Session Duration: {elapsed:.0f}s")
+            st.text(f"Started: {st.session_state.session_start_time:%H:%M:%S}")
+    
+    # Audio level meter refreshes on its own 200ms timer
+    if st.session_state.monitoring_active:
+        st.markdown("---")
+        st.subheader("📊 Audio Level")
+        _level_meter(realtime_processor)
+    
+    # The live region reruns on its own timer while monitoring; the
+    # configuration and controls above only rerun when used
+    refresh = LIVE_REFRESH_SECONDS if st.session_state.monitoring_active else None
+    st.fragment(_live_panel, run_every=refresh)(realtime_processor)
+    
+    # Export Session
+    if st.session_state.live_transcripts and not st.session_state.monitoring_active:
+        st.markdown("---")
+        st.subheader("💾 Export Session")
+        
+        if st.button("💾 Save Session"):
+            try:
+                output_file = realtime_processor.save_session()
+                st.success(f"✓ Session saved to: {output_file}")
+                
+                # Download button
+                with open(output_file, 'r') as f:
+                    st.download_button(
+                        "Download Session",
+                        f.read(),
+                        file_name=output_file.name,
+                        mime="text/plain"
+                    )
+            except Exception as e:
+                st.error(f"Failed to save session: {e}")
+        
+        if st.button("🗑️ Clear Session"):
+            st.session_state.live_transcripts = deque(maxlen=LIVE_TRANSCRIPT_LIMIT)
+            st.session_state.live_stats = _new_stats()
+            st.session_state.live_transcript_html = deque(maxlen=LIVE_TRANSCRIPTS_SHOWN)
+            st.session_state.session_start_time = None
+            st.rerun()
+
+
+def _live_panel(realtime_processor: "RealtimeProcessor"):
+    """
+    Render the live region: waveform, speech detection, transcripts and stats.
     
+    Called as a fragment that reruns every LIVE_REFRESH_SECONDS while
+    monitoring, so each tick re-executes only this region.
+    
+    Args:
+        realtime_processor: Processor to read audio and transcripts from
+    """
     # CRITICAL: Pull transcripts from queue at the start of each render cycle
     # Pull even when stopped to catch delayed transcripts that arrived after stop
     logger.debug(f"Checking for transcripts... monitoring_active={st.session_state.monitoring_active}, has queue attr: {hasattr(realtime_processor, 'ui_transcript_queue')}")
     
     if hasattr(realtime_processor, 'ui_transcript_queue'):
-        import queue
         try:
-            # Get all available transcripts from queue (non-blocking)
-            pulled_count = 0
-            while True:
-                try:
-                    transcript = realtime_processor.ui_transcript_queue.get_nowait()
-                    st.session_state.live_transcripts.append(transcript)
-                    pulled_count += 1
-                    logger.debug(f"Pulled transcript from queue: {transcript.get('text', '')[:30]}...")
-                except queue.Empty:
-                    break
+            # Take everything pending from the lock-free rings, then add it
+            # to the bounded history in one step
+            pulled = realtime_processor.ui_transcript_queue.drain()
+            
+            st.session_state.live_transcripts.extend(pulled)
+            _update_stats(st.session_state.live_stats, pulled)
+            
+            # Format each target transcript once, when it arrives
+            st.session_state.live_transcript_html.extend(
+                _transcript_html(t) for t in pulled if t.get('is_target', False)
+            )
+            pulled_count = len(pulled)
             
             if pulled_count > 0:
                 logger.info(f"Pulled {pulled_count} transcript(s) from queue, total now: {len(st.session_state.live_transcripts)}")
@@ -250,102 +336,48 @@ def render_live_tab():
         if st.session_state.monitoring_active:  # Only warn if monitoring is active
             logger.warning(f"⚠️ No ui_transcript_queue found on processor (id: {id(realtime_processor)})")
     
-    # Audio Level Meter & Voice Detection
+    # Waveform & Voice Detection
     if st.session_state.monitoring_active:
-        st.markdown("---")
+        if st.session_state.session_start_time:
+            elapsed = (datetime.now() - st.session_state.session_start_time).total_seconds()
+            st.caption(f"Session Duration: {elapsed:.0f}s")
         
         # Waveform Visualization
         st.subheader("🎙️ Live Audio Waveform")
         try:
             # Get waveform data from processor
-            waveform = realtime_processor.get_waveform_data(num_samples=200)
+            waveform = realtime_processor.get_waveform_data(num_samples=WAVEFORM_POINTS)
             
-            # Create time axis (in seconds, last 2 seconds)
-            time_axis = np.linspace(-2, 0, len(waveform))
+            # Reuse the figure built on the first refresh; only the trace
+            # data changes between frames
+            if '_wave_fig' not in st.session_state:
+                st.session_state._wave_fig = _build_waveform_figure()
+            fig = st.session_state._wave_fig
+            fig.data[0].y = waveform
             
-            # Create plotly figure with better styling
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=time_axis,
-                y=waveform,
-                mode='lines',
-                line=dict(color='#1f77b4', width=1),
-                fill='tozeroy',
-                fillcolor='rgba(31, 119, 180, 0.3)',
-                name='Audio',
-                hovertemplate='Time: %{x:.2f}s<br>Amplitude: %{y:.3f}<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                xaxis_title="Time (seconds)",
-                yaxis_title="Amplitude",
-                height=200,
-                margin=dict(l=20, r=20, t=20, b=40),
-                plot_bgcolor='rgba(240, 242, 246, 0.5)',
-                paper_bgcolor='white',
-                xaxis=dict(
-                    showgrid=True,
-                    gridwidth=1,
-                    gridcolor='rgba(128, 128, 128, 0.2)',
-                    zeroline=True,
-                    zerolinewidth=2,
-                    zerolinecolor='rgba(128, 128, 128, 0.3)'
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridwidth=1,
-                    gridcolor='rgba(128, 128, 128, 0.2)',
-                    zeroline=True,
-                    zerolinewidth=2,
-                    zerolinecolor='rgba(128, 128, 128, 0.3)',
-                    range=[-1, 1]
-                ),
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig, use_container_width=True, key=f"waveform_{time.time()}")
+            st.plotly_chart(fig, use_container_width=True, key="live_waveform")
             
         except Exception as e:
             st.warning(f"Unable to display waveform: {e}")
         
-        # Audio Level & Speech Detection
-        col_a, col_b = st.columns([1, 1])
-        
-        with col_a:
-            st.subheader("📊 Audio Level")
-            try:
-                level = realtime_processor.get_audio_level()
-                level_percent = min(100, level * 100)
-                
-                st.progress(level_percent / 100)
-                
-                # Voice activity indicator
-                if level_percent > 1.0:  # Above 1% means audio detected
-                    st.success(f"🎤 Detecting: {level_percent:.1f}%")
-                else:
-                    st.info(f"🔇 Silent: {level_percent:.1f}%")
-            except Exception as e:
-                st.warning(f"Unable to read audio level: {e}")
-        
-        with col_b:
-            st.subheader("🗣️ Speech Detection")
-            # Get processing stats from realtime processor
-            if hasattr(realtime_processor, 'last_processing_stats'):
-                stats = realtime_processor.last_processing_stats
-                segments_detected = stats.get('segments_detected', 0)
-                target_matched = stats.get('target_matched', False)
-                
-                if segments_detected > 0:
-                    st.success(f"✓ Voice detected ({segments_detected} segment(s))")
-                    if target_matched:
-                        st.success("🎯 **Target speaker detected!**")
-                    else:
-                        st.warning("❌ Not target speaker")
+        # Speech Detection
+        st.subheader("🗣️ Speech Detection")
+        # Get processing stats from realtime processor
+        if hasattr(realtime_processor, 'last_processing_stats'):
+            stats = realtime_processor.last_processing_stats
+            segments_detected = stats.get('segments_detected', 0)
+            target_matched = stats.get('target_matched', False)
+            
+            if segments_detected > 0:
+                st.success(f"✓ Voice detected ({segments_detected} segment(s))")
+                if target_matched:
+                    st.success("🎯 **Target speaker detected!**")
                 else:
-                    st.info("👂 Listening...")
+                    st.warning("❌ Not target speaker")
             else:
-                st.info("👂 Waiting for audio...")
+                st.info("👂 Listening...")
+        else:
+            st.info("👂 Waiting for audio...")
     
     # Live Transcript Section
     st.markdown("---")
@@ -355,25 +387,18 @@ def render_live_tab():
     transcript_container = st.container()
     
     with transcript_container:
-        # Filter to show only target speaker transcripts
-        target_transcripts = [t for t in st.session_state.live_transcripts if t.get('is_target', False)]
+        # Show only target speaker transcripts, pre-formatted as they arrived,
+        # in a single markdown element rather than one per transcript
+        transcript_html = st.session_state.live_transcript_html
         
-        if target_transcripts:
-            for transcript in target_transcripts:
-                timestamp = transcript.get('timestamp', '')
-                text = transcript.get('text', '')
-                confidence = transcript.get('confidence', 0)
-                similarity = transcript.get('similarity', 0)
-                
-                # Display target speaker transcript with nice formatting
-                st.markdown(
-                    f"<div style='background-color: #d4edda; padding: 12px; border-radius: 5px; border-left: 4px solid #28a745; margin-bottom: 10px;'>"
-                    f"<strong style='color: #155724;'>🎯 [{timestamp}]</strong><br>"
-                    f"<span style='color: #155724; font-size: 16px;'>{text}</span><br>"
-                    f"<small style='color: #6c757d;'>Confidence: {confidence:.2f} | Similarity: {similarity:.2f}</small>"
-                    f"</div>",
-                    unsafe_allow_html=True
-                )
+        dropped = getattr(realtime_processor, 'ui_transcripts_dropped', 0)
+        if dropped:
+            st.warning(f"⚠️ {dropped} transcript(s) were lost because the page stopped refreshing")
+        
+        if transcript_html:
+            st.markdown("".join(transcript_html), unsafe_allow_html=True)
+            if st.session_state.live_stats['target_count'] > len(transcript_html):
+                st.caption(f"Showing the latest {len(transcript_html)} transcripts; Save Session keeps them all.")
         else:
             if st.session_state.monitoring_active:
                 st.info("🎤 Listening... Speak to see transcripts appear here")
@@ -385,8 +410,9 @@ def render_live_tab():
                     st.info("💡 Note: Some transcripts may appear a few seconds after you stop (Azure processing delay)")
         
         # Show quality tips if confidence is low
-        if target_transcripts:
-            avg_confidence = sum(t.get('confidence', 0) for t in target_transcripts) / len(target_transcripts)
+        stats = st.session_state.live_stats
+        if stats['target_count']:
+            avg_confidence = stats['target_confidence_sum'] / stats['target_count']
             if avg_confidence < 0.70:
                 with st.expander("💡 Tips to Improve Transcription Quality", expanded=False):
                     st.markdown("""
@@ -421,94 +447,220 @@ def render_live_tab():
         st.markdown("---")
         st.subheader("📈 Session Statistics")
         
-        # Calculate stats
-        target_transcripts = [t for t in st.session_state.live_transcripts if t.get('is_target', False)]
-        other_transcripts = [t for t in st.session_state.live_transcripts if not t.get('is_target', False)]
+        # Running totals, updated as transcripts are pulled from the queue
+        stats = st.session_state.live_stats
+        target_count = stats['target_count']
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric(
                 "🎯 Your Segments",
-                len(target_transcripts),
-                delta=f"{len(target_transcripts)/max(len(st.session_state.live_transcripts),1)*100:.0f}%"
+                target_count,
+                delta=f"{target_count/max(stats['count'],1)*100:.0f}%"
             )
         
         with col2:
             st.metric(
                 "👥 Other Segments",
-                len(other_transcripts)
+                stats['count'] - target_count
             )
         
         with col3:
-            total_chars = sum(
-                len(t.get('text', ''))
-                for t in st.session_state.live_transcripts
-            )
-            st.metric("Total Characters", total_chars)
+            st.metric("Total Characters", stats['chars'])
         
         with col4:
-            if target_transcripts:
-                avg_similarity = sum(t.get('similarity', 0) for t in target_transcripts) / len(target_transcripts)
+            if target_count:
+                avg_similarity = stats['target_similarity_sum'] / target_count
                 st.metric("Avg Similarity", f"{avg_similarity:.2f}")
             else:
                 st.metric("Avg Similarity", "N/A")
+
+
+@st.fragment(run_every="200ms")
+def _level_meter(processor: "RealtimeProcessor"):
+    """
+    Audio level meter, refreshed on its own timer.
+    
+    Only this fragment reruns each tick, not the whole tab.
+    """
+    if not st.session_state.monitoring_active:
+        return
     
-    # Export Session
-    if st.session_state.live_transcripts and not st.session_state.monitoring_active:
-        st.markdown("---")
-        st.subheader("💾 Export Session")
+    try:
+        level = processor.get_audio_level()
+        level_percent = min(100, level * 100)
         
-        if st.button("💾 Save Session"):
-            try:
-                output_file = realtime_processor.save_session()
-                st.success(f"✓ Session saved to: {output_file}")
-                
-                # Download button
-                with open(output_file, 'r') as f:
-                    st.download_button(
-                        "Download Session",
-                        f.read(),
-                        file_name=output_file.name,
-                        mime="text/plain"
-                    )
-            except Exception as e:
-                st.error(f"Failed to save session: {e}")
+        st.progress(level_percent / 100)
         
-        if st.button("🗑️ Clear Session"):
-            st.session_state.live_transcripts = []
-            st.session_state.session_start_time = None
-            st.rerun()
+        # Voice activity indicator
+        if level_percent > 1.0:  # Above 1% means audio detected
+            st.success(f"🎤 Detecting: {level_percent:.1f}%")
+        else:
+            st.info(f"🔇 Silent: {level_percent:.1f}%")
+    except Exception as e:
+        st.warning(f"Unable to read audio level: {e}")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _enumerate_audio_devices(_processor: "RealtimeProcessor") -> tuple:
+    """
+    List audio input devices, cached across reruns and sessions.
     
-    # Auto-refresh: Trigger rerun at the VERY END after all UI elements are rendered
-    # This ensures transcripts, waveforms, and stats are displayed before the next cycle
-    if st.session_state.monitoring_active:
-        time.sleep(0.5)  # Brief pause between refresh cycles
-        st.rerun()
+    Clear with _enumerate_audio_devices.clear() to pick up newly
+    connected devices.
+    
+    Args:
+        _processor: Processor used to enumerate (not hashed)
+    
+    Returns:
+        Tuple of (devices, default device index or None, options dict
+        mapping device index to display label)
+    """
+    devices = _processor.get_audio_devices()
+    
+    default_device_index = next((d['index'] for d in devices if d.get('is_default')), None)
+    
+    device_options = {
+        device['index']: f"{device['name']}{' 🎤 DEFAULT' if device['index'] == default_device_index else ''} ({device['channels']} ch)"
+        for device in devices
+    }
+    
+    return devices, default_device_index, device_options
+
+
+def _build_waveform_figure():
+    """
+    Build the styled live waveform figure with a silent placeholder trace.
+    
+    Returns:
+        Plotly Figure; set fig.data[0].y to update it
+    """
+    # Plotly is only needed while monitoring
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=WAVEFORM_TIME_AXIS,
+        y=np.zeros(WAVEFORM_POINTS, dtype=np.float32),
+        mode='lines',
+        line=dict(color='#1f77b4', width=1),
+        fill='tozeroy',
+        fillcolor='rgba(31, 119, 180, 0.3)',
+        name='Audio',
+        hovertemplate='Time: %{x:.2f}s<br>Amplitude: %{y:.3f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        xaxis_title="Time (seconds)",
+        yaxis_title="Amplitude",
+        height=200,
+        margin=dict(l=20, r=20, t=20, b=40),
+        plot_bgcolor='rgba(240, 242, 246, 0.5)',
+        paper_bgcolor='white',
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='rgba(128, 128, 128, 0.2)',
+            zeroline=True,
+            zerolinewidth=2,
+            zerolinecolor='rgba(128, 128, 128, 0.3)'
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor='rgba(128, 128, 128, 0.2)',
+            zeroline=True,
+            zerolinewidth=2,
+            zerolinecolor='rgba(128, 128, 128, 0.3)',
+            range=[-1, 1]
+        ),
+        showlegend=False
+    )
+    
+    return fig
+
+
+def _transcript_html(transcript: dict) -> str:
+    """Format a target speaker transcript for display."""
+    # Recognized speech is rendered as raw HTML, so escape it
+    timestamp = html.escape(str(transcript.get('timestamp', '')))
+    text = html.escape(transcript.get('text', ''))
+    confidence = transcript.get('confidence', 0)
+    similarity = transcript.get('similarity', 0)
+    
+    return (
+        f"<div style='background-color: #d4edda; padding: 12px; border-radius: 5px; border-left: 4px solid #28a745; margin-bottom: 10px;'>"
+        f"<strong style='color: #155724;'>🎯 [{timestamp}]</strong><br>"
+        f"<span style='color: #155724; font-size: 16px;'>{text}</span><br>"
+        f"<small style='color: #6c757d;'>Confidence: {confidence:.2f} | Similarity: {similarity:.2f}</small>"
+        f"</div>"
+    )
+
+
+def _new_stats() -> dict:
+    """Empty running totals for the session statistics."""
+    return {
+        'count': 0,
+        'chars': 0,
+        'target_count': 0,
+        'target_confidence_sum': 0.0,
+        'target_similarity_sum': 0.0
+    }
+
+
+def _update_stats(stats: dict, transcripts: list):
+    """Add newly pulled transcripts to the running totals."""
+    for t in transcripts:
+        stats['count'] += 1
+        stats['chars'] += len(t.get('text', ''))
+        if t.get('is_target', False):
+            stats['target_count'] += 1
+            stats['target_confidence_sum'] += t.get('confidence', 0)
+            stats['target_similarity_sum'] += t.get('similarity', 0)
 
 
 def start_monitoring(
-    processor: RealtimeProcessor,
+    processor: "RealtimeProcessor",
     device_index: int,
     profile_id: str,
     threshold: float,
     language: str
-):
-    """Start live monitoring."""
+) -> bool:
+    """
+    Start live monitoring.
+    
+    Returns:
+        True if monitoring started; errors are shown in the page
+    """
+    
+    # Last formatted second; strftime only runs when the second changes
+    last_timestamp = [0, ""]
+    drop_lock = threading.Lock()
     
     def transcript_callback(transcript: dict):
         """Callback for new transcripts from background thread."""
         # Add timestamp
-        transcript['timestamp'] = datetime.now().strftime('%H:%M:%S')
+        now = int(time.time())
+        if now != last_timestamp[0]:
+            last_timestamp[:] = [now, time.strftime('%H:%M:%S', time.localtime(now))]
+        transcript['timestamp'] = last_timestamp[1]
         
         # Put in queue (thread-safe)
         # Don't access st.session_state from background thread!
-        import queue
         try:
             # Get the queue from somewhere accessible
             # We'll store it in the processor
             if hasattr(processor, 'ui_transcript_queue'):
-                processor.ui_transcript_queue.put(transcript)
+                # Transcripts arrive from both the processing thread and the
+                # streaming recognizer's thread; each pushes to its own ring.
+                # Never block those threads: a full ring means the UI has
+                # stopped draining, so count the transcript as dropped
+                if not processor.ui_transcript_queue.try_push(transcript):
+                    with drop_lock:
+                        processor.ui_transcripts_dropped += 1
+                    logger.warning("UI transcript ring full; dropping transcript")
+                    return
                 logger.info(f"✅ Queued transcript for UI: [{transcript['timestamp']}] {transcript.get('text', '')[:40]}...")
             else:
                 logger.error("❌ ui_transcript_queue not found on processor!")
@@ -517,8 +669,8 @@ def start_monitoring(
     
     try:
         # Attach queue to processor so callback can access it
-        import queue
-        processor.ui_transcript_queue = queue.Queue()
+        processor.ui_transcript_queue = PerThreadRings(TRANSCRIPT_RING_CAPACITY)
+        processor.ui_transcripts_dropped = 0
         logger.info(f"✅ Created ui_transcript_queue on processor (id: {id(processor)})")
         
         processor.start_monitoring(
@@ -531,26 +683,37 @@ def start_monitoring(
         
         st.session_state.monitoring_active = True
         st.session_state.session_start_time = datetime.now()
-        st.session_state.live_transcripts = []
+        st.session_state.live_transcripts = deque(maxlen=LIVE_TRANSCRIPT_LIMIT)
+        st.session_state.live_stats = _new_stats()
+        st.session_state.live_transcript_html = deque(maxlen=LIVE_TRANSCRIPTS_SHOWN)
         
-        st.success("✓ Monitoring started")
+        st.session_state.live_notice = "✓ Monitoring started"
         logger.info("Live monitoring started")
+        return True
         
     except Exception as e:
         st.error(f"❌ Failed to start monitoring: {e}")
         logger.error(f"Failed to start monitoring: {e}")
+        return False
 
 
-def stop_monitoring(processor: RealtimeProcessor):
-    """Stop live monitoring."""
+def stop_monitoring(processor: "RealtimeProcessor") -> bool:
+    """
+    Stop live monitoring.
+    
+    Returns:
+        True if monitoring stopped; errors are shown in the page
+    """
     try:
         session_summary = processor.stop_monitoring()
         
         st.session_state.monitoring_active = False
         
-        st.success("✓ Monitoring stopped")
+        st.session_state.live_notice = "✓ Monitoring stopped"
         logger.info(f"Live monitoring stopped. Segments: {session_summary.get('total_segments', 0)}")
+        return True
         
     except Exception as e:
         st.error(f"❌ Failed to stop monitoring: {e}")
         logger.error(f"Failed to stop monitoring: {e}")
+        return False
@@ -0,0 +1,223 @@
+"""
+Shared Streamlit resources for the UI tabs.
+
+Services and profile listings are cached at the Streamlit process level,
+so every tab and every browser session reuses the same instances.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+
+from src.services.profile_manager import ProfileManager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Display names for the transcription languages offered in the UI
+LANGUAGE_LABELS = {
+    "en-US": "English (US)", "en-GB": "English (UK)",
+    "he-IL": "Hebrew (Israel)", "es-ES": "Spanish (Spain)",
+    "fr-FR": "French (France)", "de-DE": "German (Germany)",
+    "it-IT": "Italian (Italy)", "pt-BR": "Portuguese (Brazil)",
+    "ja-JP": "Japanese (Japan)", "ko-KR": "Korean (Korea)",
+    "zh-CN": "Chinese (Mandarin)", "ar-SA": "Arabic (Saudi Arabia)"
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_profile_manager() -> ProfileManager:
+    """Profile manager shared by every session in this server process."""
+    return ProfileManager()
+
+
+@st.cache_resource(show_spinner="Loading embedding model...")
+def get_identification_service():
+    """
+    IdentificationService shared by every session, loaded on first use.
+    
+    Its inference is serialized by an internal lock, so one model instance
+    can serve all tabs and sessions instead of one load per session.
+    
+    Returns:
+        IdentificationService instance
+    """
+    # Imported here so tabs that never need the model don't load torch
+    from src.services.identification_service import IdentificationService
+    return IdentificationService()
+
+
+def new_batch_processor():
+    """
+    BatchProcessor for one session, reusing the shared services.
+    
+    The diarization pipeline is tuned per call and stays per-processor.
+    
+    Returns:
+        BatchProcessor instance
+    """
+    from src.processors.batch_processor import BatchProcessor
+    return BatchProcessor(
+        identification=get_identification_service(),
+        profile_manager=get_profile_manager()
+    )
+
+
+def new_realtime_processor():
+    """
+    RealtimeProcessor for one session, reusing the shared services.
+    
+    Each session keeps its own processor: it owns the audio stream and
+    the monitoring state.
+    
+    Returns:
+        RealtimeProcessor instance
+    """
+    from src.processors.realtime_processor import RealtimeProcessor
+    return RealtimeProcessor(
+        identification=get_identification_service(),
+        profile_manager=get_profile_manager()
+    )
+
+
+def profiles_token(profile_manager: ProfileManager) -> int:
+    """
+    Cheap change token for the profile store.
+    
+    Profiles are written by rename and removed by unlink, so any create,
+    update, import or delete bumps the directory mtime.
+    
+    Args:
+        profile_manager: Profile manager whose directory to stat
+    
+    Returns:
+        Directory mtime in nanoseconds
+    """
+    return os.stat(profile_manager.profiles_dir).st_mtime_ns
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_list_profiles(profiles_dir: str, token: int) -> list:
+    """
+    List profile summaries, served from memory until the store changes.
+    
+    Args:
+        profiles_dir: Profiles directory (keys stores apart)
+        token: Value of profiles_token; a new token forces a reload
+    
+    Returns:
+        Profile summaries, as returned by ProfileManager.list_profiles,
+        plus precomputed 'short_id' and 'name_lower' display fields
+    """
+    profiles = get_profile_manager().list_profiles()
+    
+    # Derived once per store change rather than on every rerun
+    for p in profiles:
+        p["short_id"] = p["id"][:8]
+        p["name_lower"] = p["name"].lower()
+    
+    return profiles
+
+
+def list_profiles(profile_manager: ProfileManager) -> list:
+    """
+    List profiles through the shared cache.
+    
+    Args:
+        profile_manager: Profile manager to list
+    
+    Returns:
+        Profile summaries
+    """
+    return cached_list_profiles(
+        str(profile_manager.profiles_dir),
+        profiles_token(profile_manager)
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_load_profile(profiles_dir: str, token: int, profile_id: str) -> Dict:
+    """
+    Load a full profile (with embedding), served from memory until the store changes.
+    
+    Every call returns a fresh copy, so callers may modify it freely.
+    
+    Args:
+        profiles_dir: Profiles directory (keys stores apart)
+        token: Value of profiles_token; a new token forces a reload
+        profile_id: Profile to load
+    
+    Returns:
+        Profile dictionary, as returned by ProfileManager.load_profile
+    """
+    return get_profile_manager().load_profile(profile_id)
+
+
+def load_profile(profile_manager: ProfileManager, profile_id: str) -> Dict:
+    """
+    Load a full profile through the shared cache.
+    
+    Args:
+        profile_manager: Profile manager to load from
+        profile_id: Profile to load
+    
+    Returns:
+        Profile dictionary (a copy owned by the caller)
+    """
+    return cached_load_profile(
+        str(profile_manager.profiles_dir),
+        profiles_token(profile_manager),
+        profile_id
+    )
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_name_index(profiles_dir: str, token: int) -> List[Tuple[str, Dict]]:
+    """
+    Profile summaries paired with their lowercased names, for search.
+    
+    Args:
+        profiles_dir: Profiles directory (keys stores apart)
+        token: Value of profiles_token; a new token forces a rebuild
+    
+    Returns:
+        List of (lowercased name, profile summary) tuples
+    """
+    return [(p["name_lower"], p) for p in cached_list_profiles(profiles_dir, token)]
+
+
+def query_profiles(
+    profile_manager: ProfileManager,
+    query: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = 20
+) -> Tuple[List[Dict], int]:
+    """
+    One page of profiles matching a name query, through the shared cache.
+    
+    Names are lowered once per store change instead of on every keystroke.
+    
+    Args:
+        profile_manager: Profile manager to query
+        query: Case-insensitive substring to match against names
+            (None or empty matches all)
+        offset: Number of matching profiles to skip
+        limit: Maximum number of profiles to return (None for all)
+    
+    Returns:
+        Tuple of (profile summaries for the page, total matching count)
+    """
+    index = cached_name_index(
+        str(profile_manager.profiles_dir),
+        profiles_token(profile_manager)
+    )
+    
+    if query:
+        query_lower = query.lower()
+        profiles = [p for name, p in index if query_lower in name]
+    else:
+        profiles = [p for _, p in index]
+    
+    end = None if limit is None else offset + limit
+    return profiles[offset:end], len(profiles)
@@ -5,14 +5,19 @@ Provides functions for audio file validation, format conversion, and processing.
 """
 
 import librosa
+from collections import deque
 import soundfile as sf
 import numpy as np
 from pathlib import Path
-from typing import Tuple, Optional, Union
+from typing import BinaryIO, List, Tuple, Optional, Union
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Largest buffer PCMPool keeps for reuse: 60 s at 16 kHz, the default
+# batched-session length. Larger requests get one-off buffers
+PCM_POOL_MAX_SAMPLES = 60 * 16000
+
 
 def validate_audio_file(file_path: Union[str, Path]) -> bool:
     """
@@ -53,6 +58,32 @@ def validate_audio_file(file_path: Union[str, Path]) -> bool:
         return False
 
 
+def sniff_audio_format(header: bytes) -> Optional[str]:
+    """
+    Identify an audio container from its leading bytes.
+    
+    A cheap pre-check before handing a file to a decoder; it does not
+    guarantee the rest of the file is valid.
+    
+    Args:
+        header: At least the first 12 bytes of the file
+    
+    Returns:
+        'wav', 'flac', 'mp3' or 'm4a', or None if unrecognized
+    """
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:3] == b"ID3":
+        return "mp3"
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return "mp3"  # Bare MPEG audio frame sync
+    if header[4:8] == b"ftyp":
+        return "m4a"
+    return None
+
+
 def load_audio(
     file_path: Union[str, Path],
     sample_rate: int = 16000,
@@ -96,6 +127,65 @@ def load_audio(
         raise ValueError(f"Cannot load audio file: {e}")
 
 
+# Formats soundfile can seek in without decoding everything before the offset
+SEEKABLE_FORMATS = ('.wav', '.flac')
+
+
+def load_audio_segment(
+    file_path: Union[str, Path],
+    start_time: float,
+    end_time: float,
+    sample_rate: int = 16000
+) -> Tuple[np.ndarray, int]:
+    """
+    Load only the samples between start_time and end_time.
+    
+    WAV/FLAC files are read with a seek, so I/O is proportional to the
+    segment rather than the file; the native sample rate is kept.
+    Compressed formats fall back to a full load_audio at sample_rate.
+    
+    Args:
+        file_path: Path to audio file
+        start_time: Start time in seconds
+        end_time: End time in seconds
+        sample_rate: Target sample rate for the full-decode fallback
+    
+    Returns:
+        Tuple of (mono audio_data, sample_rate)
+    
+    Raises:
+        ValueError: If file cannot be loaded
+    """
+    file_path = Path(file_path)
+    
+    if file_path.suffix.lower() not in SEEKABLE_FORMATS:
+        audio, sr = load_audio(file_path, sample_rate=sample_rate)
+        return extract_segment(audio, sr, start_time, end_time), sr
+    
+    try:
+        with sf.SoundFile(str(file_path), 'r') as f:
+            sr = f.samplerate
+            start_frame = max(0, int(start_time * sr))
+            n_frames = max(0, min(f.frames, int(end_time * sr)) - start_frame)
+            
+            f.seek(start_frame)
+            audio = f.read(n_frames, dtype='float32', always_2d=False)
+        
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        
+        logger.debug(
+            f"Read segment {start_time:.2f}s-{end_time:.2f}s from {file_path.name} "
+            f"({len(audio)} samples, {sr}Hz)"
+        )
+        
+        return audio, sr
+        
+    except Exception as e:
+        logger.error(f"Error reading segment from {file_path}: {e}")
+        raise ValueError(f"Cannot load audio segment: {e}")
+
+
 def save_audio(
     audio: np.ndarray,
     file_path: Union[str, Path],
@@ -124,6 +214,41 @@ def save_audio(
         raise ValueError(f"Cannot save audio file: {e}")
 
 
+def concatenate_audio_files(
+    file_paths: List[Union[str, Path]],
+    output: Union[str, Path, BinaryIO],
+    sample_rate: int = 16000
+) -> float:
+    """
+    Join several audio files, end to end, into one mono WAV.
+    
+    Args:
+        file_paths: Audio files to join, in order
+        output: Output file path or writable binary file object
+        sample_rate: Sample rate to resample every file to
+    
+    Returns:
+        Duration of the joined audio in seconds
+    
+    Raises:
+        ValueError: If a file cannot be loaded or the output cannot be written
+    """
+    try:
+        audio = np.concatenate([
+            load_audio(file_path, sample_rate=sample_rate)[0]
+            for file_path in file_paths
+        ])
+        
+        sf.write(output, audio, sample_rate, format="WAV")
+        logger.debug(f"Concatenated {len(file_paths)} audio files ({len(audio) / sample_rate:.1f}s)")
+        
+        return len(audio) / sample_rate
+        
+    except Exception as e:
+        logger.error(f"Error concatenating audio files: {e}")
+        raise ValueError(f"Cannot concatenate audio files: {e}")
+
+
 def extract_segment(
     audio: np.ndarray,
     sample_rate: int,
@@ -140,7 +265,7 @@ def extract_segment(
         end_time: End time in seconds
     
     Returns:
-        Audio segment as numpy array
+        Audio segment as a view into audio (no copy; do not modify in place)
     """
     start_sample = int(start_time * sample_rate)
     end_sample = int(end_time * sample_rate)
@@ -262,3 +387,79 @@ def normalize_audio(audio: np.ndarray, target_level: float = -20.0) -> np.ndarra
     logger.debug(f"Normalized audio: gain={gain:.2f}")
     
     return normalized
+
+
+class PCMPool:
+    """
+    Pool of reusable scratch buffers (little-endian int16 by default).
+    
+    Batch transcription encodes many segments to 16-bit PCM; reusing
+    buffers avoids allocating a fresh array per segment. Safe to share
+    between threads (deque append/pop are atomic). Buffers above
+    max_samples are never pooled, so one long segment cannot inflate
+    the pool's memory for good.
+    """
+    
+    def __init__(
+        self,
+        max_buffers: int = 8,
+        dtype: Union[str, np.dtype] = '<i2',
+        max_samples: int = PCM_POOL_MAX_SAMPLES
+    ):
+        """
+        Initialize buffer pool.
+        
+        Args:
+            max_buffers: Maximum idle buffers kept for reuse
+            dtype: Element type of the pooled buffers
+            max_samples: Largest buffer kept for reuse
+        """
+        self._pool: deque = deque(maxlen=max_buffers)
+        self._min_samples = 0
+        self._max_samples = max_samples
+        self.dtype = np.dtype(dtype)
+    
+    def reserve(self, n_samples: int) -> None:
+        """
+        Size future buffers for at least n_samples (up to max_samples).
+        
+        Replaces the previous reservation, so a smaller batch stops
+        allocating for an earlier batch's longest segment.
+        
+        Args:
+            n_samples: Expected largest request (e.g. longest segment)
+        """
+        self._min_samples = min(n_samples, self._max_samples)
+    
+    def acquire(self, n_samples: int) -> np.ndarray:
+        """
+        Get a buffer with room for n_samples.
+        
+        Args:
+            n_samples: Number of samples needed
+        
+        Returns:
+            Array of length >= n_samples (contents undefined)
+        """
+        try:
+            buf = self._pool.pop()
+            if len(buf) >= n_samples:
+                return buf
+        except IndexError:
+            pass
+        
+        if n_samples > self._max_samples:
+            # One-off buffer; release() drops it
+            return np.empty(n_samples, dtype=self.dtype)
+        
+        return np.empty(max(n_samples, self._min_samples), dtype=self.dtype)
+    
+    def release(self, buf: np.ndarray) -> None:
+        """
+        Return a buffer to the pool (oversized buffers are dropped).
+        
+        Args:
+            buf: Buffer previously returned by acquire
+        """
+        if len(buf) <= self._max_samples:
+            self._pool.append(buf)
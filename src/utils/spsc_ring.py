@@ -0,0 +1,171 @@
+"""
+Single-producer single-consumer ring buffer.
+
+Hands items from one background thread to one consumer thread without
+locks. Each index is written by only one side, and under the GIL a
+slot write followed by an index store is seen in that order by the
+other thread. PerThreadRings extends this to several producer threads
+by giving each its own ring.
+"""
+
+import itertools
+import threading
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
+
+
+class SPSCRing:
+    """
+    Fixed-capacity lock-free ring for exactly one producer and one consumer.
+    
+    The producer calls try_push; the consumer calls try_pop or drain.
+    Using either side from more than one thread is not safe.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize ring buffer.
+        
+        Args:
+            capacity: Minimum number of items held; rounded up to a power of two
+        
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"Cannot create ring with capacity {capacity}")
+        
+        size = 1 << (capacity - 1).bit_length()
+        self._slots: List[Any] = [None] * size
+        self._mask = size - 1
+        self._head = 0  # Next slot to write; only the producer stores it
+        self._tail = 0  # Next slot to read; only the consumer stores it
+    
+    @property
+    def capacity(self) -> int:
+        """Number of items the ring can hold."""
+        return self._mask + 1
+    
+    def __len__(self) -> int:
+        return self._head - self._tail
+    
+    def try_push(self, item: Any) -> bool:
+        """
+        Append an item (producer side).
+        
+        Args:
+            item: Item to append
+        
+        Returns:
+            True if stored, False if the ring is full
+        """
+        head = self._head
+        if head - self._tail > self._mask:
+            return False
+        
+        self._slots[head & self._mask] = item
+        # Publish only after the slot is written
+        self._head = head + 1
+        return True
+    
+    def try_pop(self) -> Tuple[bool, Any]:
+        """
+        Remove the oldest item (consumer side).
+        
+        Returns:
+            Tuple of (True, item), or (False, None) if the ring is empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return False, None
+        
+        index = tail & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        # Release the slot only after it is read
+        self._tail = tail + 1
+        return True, item
+    
+    def drain(self) -> List[Any]:
+        """
+        Remove every item available now (consumer side).
+        
+        Returns:
+            Items in the order they were pushed
+        """
+        head = self._head
+        tail = self._tail
+        slots = self._slots
+        mask = self._mask
+        
+        items = []
+        for position in range(tail, head):
+            index = position & mask
+            items.append(slots[index])
+            slots[index] = None
+        
+        self._tail = head
+        return items
+
+
+class PerThreadRings:
+    """
+    One SPSCRing per producer thread, drained by a single consumer.
+    
+    Each producer thread gets its own ring on its first push, so every
+    ring keeps exactly one producer and no lock is needed. Items are
+    tagged with a global sequence number, so each drain returns them in
+    push order across threads.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize ring set.
+        
+        Args:
+            capacity: Minimum number of items held per producer thread
+        
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"Cannot create ring with capacity {capacity}")
+        
+        self._capacity = capacity
+        self._rings: Dict[int, SPSCRing] = {}
+        self._sequence = itertools.count()
+    
+    def __len__(self) -> int:
+        return sum(len(ring) for ring in list(self._rings.values()))
+    
+    def try_push(self, item: Any) -> bool:
+        """
+        Append an item to the calling thread's ring (producer side).
+        
+        Args:
+            item: Item to append
+        
+        Returns:
+            True if stored, False if this thread's ring is full
+        """
+        thread_id = threading.get_ident()
+        ring = self._rings.get(thread_id)
+        if ring is None:
+            ring = self._rings.setdefault(thread_id, SPSCRing(self._capacity))
+        
+        return ring.try_push((next(self._sequence), item))
+    
+    def drain(self) -> List[Any]:
+        """
+        Remove every item available now from all rings (consumer side).
+        
+        Returns:
+            Items in the order they were pushed
+        """
+        tagged = []
+        # Snapshot the rings; producers may add one concurrently
+        for ring in list(self._rings.values()):
+            tagged.extend(ring.drain())
+        
+        tagged.sort(key=itemgetter(0))
+        return [item for _, item in tagged]
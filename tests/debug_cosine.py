@@ -4,16 +4,21 @@ Debug embedding comparison - raw numpy check.
 """
 
 import json
+import sys
 import numpy as np
 from pathlib import Path
 from scipy.spatial.distance import cosine
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.profile_manager import decode_embedding
+
 # Load profile
 profile_path = Path("/Users/robenhai/speaker diarization/data/profiles/8fff5552-05c6-4c07-9809-a1dace1c92b4.json")
 with open(profile_path) as f:
     profile = json.load(f)
 
-profile_emb = np.array(profile['embedding'])
+profile_emb = decode_embedding(profile)
 
 print("Profile Embedding:")
 print(f"  Shape: {profile_emb.shape}")
@@ -13,6 +13,7 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.services.identification_service import IdentificationService
+from src.services.profile_manager import decode_embedding
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -38,7 +39,7 @@ def analyze_profile(profile_id_or_name: str):
     with open(profile_path) as f:
         profile = json.load(f)
     
-    embedding = np.array(profile['embedding'])
+    embedding = decode_embedding(profile)
     
     print("\n" + "="*60)
     print(f"📊 Profile Analysis: {profile['name']}")
@@ -84,7 +85,7 @@ def test_live_audio(profile_name: str, num_chunks: int = 5):
     with open(profile_path) as f:
         profile = json.load(f)
     
-    profile_embedding = np.array(profile['embedding'])
+    profile_embedding = decode_embedding(profile)
     
     # Find recent audio chunks
     chunks = sorted(temp_dir.glob("realtime_chunk_*.wav"), key=lambda x: x.stat().st_mtime, reverse=True)[:num_chunks]
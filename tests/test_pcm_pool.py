@@ -0,0 +1,43 @@
+"""
+Unit tests for PCMPool.
+
+Tests buffer reuse and the cap on pooled buffer size.
+"""
+
+import numpy as np
+
+from src.utils.audio_utils import PCMPool
+
+
+class TestPCMPool:
+    """Test cases for PCMPool."""
+    
+    def test_released_buffer_is_reused(self):
+        """Test that a released buffer is handed out again."""
+        pool = PCMPool(max_buffers=2)
+        buf = pool.acquire(100)
+        pool.release(buf)
+        
+        assert pool.acquire(50) is buf
+        assert buf.dtype == np.dtype('<i2')
+    
+    def test_oversized_buffer_not_pooled(self):
+        """Test that buffers above max_samples are one-off."""
+        pool = PCMPool(max_buffers=2, max_samples=1000)
+        big = pool.acquire(5000)
+        assert len(big) == 5000
+        
+        pool.release(big)
+        
+        assert pool.acquire(5000) is not big
+        assert len(pool.acquire(10)) < 5000
+    
+    def test_reserve_is_capped_and_replaced(self):
+        """Test that reservations stay under the cap and can shrink."""
+        pool = PCMPool(max_buffers=2, max_samples=1000)
+        
+        pool.reserve(5000)
+        assert len(pool.acquire(10)) == 1000
+        
+        pool.reserve(200)
+        assert len(pool.acquire(10)) == 200
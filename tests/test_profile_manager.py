@@ -6,6 +6,8 @@ Tests speaker profile CRUD operations.
 
 import pytest
 import json
+import os
+import time
 import numpy as np
 from pathlib import Path
 from datetime import datetime
@@ -200,3 +202,76 @@ class TestProfileManager:
         
         assert len(duplicates) == 2
         assert duplicates[0]['id'] != duplicates[1]['id']
+    
+    def test_quality_display_precomputed(self, manager, sample_embedding):
+        """Test that quality display strings are stored with the profile."""
+        quality = {
+            'overall_score': 0.8234,
+            'duration_score': 1.0,
+            'audio_level_score': 0.75,
+            'embedding_score': 0.9,
+            'snr_score': 0.6
+        }
+        
+        profile = manager.create_profile(
+            "Quality Speaker",
+            sample_embedding,
+            metadata={"quality": quality}
+        )
+        
+        display = manager.load_profile(profile['id'])['quality']['display']
+        assert display['overall'] == "0.82"
+        assert display['overall_percent'] == "82%"
+        assert display['audio_level_score'] == "0.75"
+        assert 'display' not in quality
+    
+    def test_embedding_stored_as_int8(self, manager, temp_profiles_dir, sample_embedding):
+        """Test that embeddings are quantized on disk and restored on load."""
+        embedding = sample_embedding / np.linalg.norm(sample_embedding)
+        profile = manager.create_profile("Quantized Speaker", embedding)
+        
+        with open(temp_profiles_dir / f"{profile['id']}.json", 'r') as f:
+            stored = json.load(f)
+        
+        assert 'embedding' not in stored
+        assert stored['emb_dim'] == 512
+        
+        loaded = manager.load_profile(profile['id'])['embedding']
+        similarity = np.dot(loaded, embedding) / (np.linalg.norm(loaded) * np.linalg.norm(embedding))
+        assert similarity > 0.999
+    
+    def test_load_legacy_float_embedding(self, manager, temp_profiles_dir, sample_embedding):
+        """Test that profiles saved as float lists still load."""
+        legacy = {
+            'id': 'legacy-id',
+            'name': 'Legacy Speaker',
+            'embedding': sample_embedding.tolist(),
+            'created_date': datetime.now().isoformat(),
+            'metadata': {}
+        }
+        with open(temp_profiles_dir / "legacy-id.json", 'w') as f:
+            json.dump(legacy, f)
+        
+        loaded = manager.load_profile('legacy-id')
+        
+        np.testing.assert_allclose(loaded['embedding'], sample_embedding)
+    
+    def test_list_profiles_sees_updates(self, manager, sample_embedding):
+        """Test that cached summaries are refreshed when a profile changes."""
+        profile = manager.create_profile("Before", sample_embedding)
+        assert manager.list_profiles()[0]['name'] == "Before"
+        
+        manager.update_profile(profile['id'], name="After")
+        
+        assert manager.list_profiles()[0]['name'] == "After"
+    
+    def test_save_replaces_file(self, manager, temp_profiles_dir, sample_embedding):
+        """Test that saves leave no temp file and bump the directory mtime."""
+        profile = manager.create_profile("Speaker", sample_embedding)
+        before = os.stat(temp_profiles_dir).st_mtime_ns
+        
+        time.sleep(0.01)
+        manager.update_profile(profile['id'], name="Renamed")
+        
+        assert os.stat(temp_profiles_dir).st_mtime_ns > before
+        assert not list(Path(temp_profiles_dir).glob("*.tmp"))
@@ -0,0 +1,134 @@
+"""
+Unit tests for SPSCRing.
+
+Tests ordering, capacity limits and cross-thread hand-off, for one
+producer and for several producer threads.
+"""
+
+import threading
+
+import pytest
+
+from src.utils.spsc_ring import PerThreadRings, SPSCRing
+
+
+class TestSPSCRing:
+    """Test cases for SPSCRing."""
+    
+    def test_capacity_rounds_up_to_power_of_two(self):
+        """Test that the requested capacity is rounded up."""
+        assert SPSCRing(5).capacity == 8
+        assert SPSCRing(8).capacity == 8
+    
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            SPSCRing(0)
+    
+    def test_push_pop_in_order(self):
+        """Test FIFO order and the empty result."""
+        ring = SPSCRing(4)
+        for i in range(3):
+            assert ring.try_push(i)
+        
+        assert ring.try_pop() == (True, 0)
+        assert ring.drain() == [1, 2]
+        assert ring.try_pop() == (False, None)
+        assert len(ring) == 0
+    
+    def test_full_ring_rejects_push(self):
+        """Test that pushes fail once the ring is full, until it drains."""
+        ring = SPSCRing(2)
+        assert ring.try_push("a")
+        assert ring.try_push("b")
+        assert not ring.try_push("c")
+        
+        assert ring.drain() == ["a", "b"]
+        assert ring.try_push("c")
+    
+    def test_wraps_around(self):
+        """Test that indices keep working past the slot count."""
+        ring = SPSCRing(4)
+        for i in range(10):
+            assert ring.try_push(i)
+            assert ring.try_pop() == (True, i)
+    
+    def test_cross_thread_handoff(self):
+        """Test that every item from a producer thread arrives once, in order."""
+        ring = SPSCRing(64)
+        count = 10_000
+        
+        def produce():
+            for i in range(count):
+                while not ring.try_push(i):
+                    pass
+        
+        producer = threading.Thread(target=produce)
+        producer.start()
+        
+        received = []
+        while len(received) < count:
+            received.extend(ring.drain())
+        
+        producer.join()
+        assert received == list(range(count))
+
+
+class TestPerThreadRings:
+    """Test cases for PerThreadRings."""
+    
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            PerThreadRings(0)
+    
+    def test_full_ring_rejects_push(self):
+        """Test that a thread's pushes fail once its ring is full."""
+        rings = PerThreadRings(2)
+        assert rings.try_push("a")
+        assert rings.try_push("b")
+        assert not rings.try_push("c")
+        
+        assert rings.drain() == ["a", "b"]
+        assert len(rings) == 0
+    
+    def test_drain_keeps_push_order_across_threads(self):
+        """Test that items from different threads come back in push order."""
+        rings = PerThreadRings(8)
+        rings.try_push(0)
+        
+        producer = threading.Thread(target=rings.try_push, args=(1,))
+        producer.start()
+        producer.join()
+        
+        rings.try_push(2)
+        
+        assert rings.drain() == [0, 1, 2]
+    
+    def test_multiple_producers(self):
+        """Test that every item from several producer threads arrives once."""
+        rings = PerThreadRings(64)
+        count = 5_000
+        
+        def produce(base):
+            for i in range(count):
+                while not rings.try_push(base + i):
+                    pass
+        
+        producers = [
+            threading.Thread(target=produce, args=(base,))
+            for base in (0, count)
+        ]
+        for producer in producers:
+            producer.start()
+        
+        received = []
+        while len(received) < 2 * count:
+            received.extend(rings.drain())
+        
+        for producer in producers:
+            producer.join()
+        
+        assert sorted(received) == list(range(2 * count))
+        # Each producer's items stay in its own order
+        assert [x for x in received if x < count] == list(range(count))
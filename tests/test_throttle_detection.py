@@ -0,0 +1,47 @@
+"""
+Unit tests for Azure throttle detection.
+
+Tests which recognition errors are retried with backoff.
+"""
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.services.transcription_service import _is_throttled, _recognition_error
+
+
+class TestThrottleDetection:
+    """Test cases for _is_throttled."""
+    
+    def test_too_many_requests_code(self):
+        """Test that the SDK TooManyRequests code counts as throttling."""
+        error = _recognition_error(
+            "Recognition error: quota exceeded",
+            speechsdk.CancellationErrorCode.TooManyRequests
+        )
+        
+        assert _is_throttled(error)
+    
+    def test_other_code_with_429_in_text(self):
+        """Test that digits in the details do not count as throttling."""
+        error = _recognition_error(
+            "Recognition error: connection failed at offset 14290",
+            speechsdk.CancellationErrorCode.ConnectionFailure
+        )
+        
+        assert not _is_throttled(error)
+    
+    def test_code_found_through_wrapping_error(self):
+        """Test that the code is found on the error a RuntimeError wraps."""
+        try:
+            try:
+                raise _recognition_error("Recognition error", speechsdk.CancellationErrorCode.TooManyRequests)
+            except Exception as e:
+                raise RuntimeError(f"Cannot transcribe audio: {e}")
+        except RuntimeError as wrapped:
+            assert _is_throttled(wrapped)
+    
+    def test_text_fallback(self):
+        """Test errors without a code, such as REST failures."""
+        assert _is_throttled(RuntimeError("Too many requests"))
+        assert _is_throttled(RuntimeError("HTTP 429: rate limited"))
+        assert not _is_throttled(RuntimeError("Session 4291 timed out"))
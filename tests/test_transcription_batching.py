@@ -0,0 +1,129 @@
+"""
+Unit tests for batched segment transcription.
+
+Tests how phrases from one recognition session are split back into
+segments, without calling Azure.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.services.transcription_service import (
+    TICKS_PER_SECOND,
+    TranscriptionService,
+    _attribute_phrase,
+    _ContinuousSink
+)
+
+
+def _ticks(seconds: float) -> int:
+    return int(seconds * TICKS_PER_SECOND)
+
+
+class TestBatchedTranscription:
+    """Test cases for splitting a batched session into segments."""
+    
+    SAMPLE_RATE = 16000
+    
+    # Three 1 s segments; in the session they sit at 0-1 s, 2-3 s and
+    # 4-5 s, separated by the 1 s BATCH_SILENCE_GAP
+    GROUP = [
+        {"start": 10.0, "end": 11.0},
+        {"start": 20.0, "end": 21.0},
+        {"start": 30.0, "end": 31.0}
+    ]
+    
+    @pytest.fixture
+    def service(self, monkeypatch):
+        """Service whose recognition returns scripted phrases."""
+        service = TranscriptionService.__new__(TranscriptionService)
+        phrases = []
+        
+        monkeypatch.setattr(service, "_create_push_audio_config", lambda audio, sr: None)
+        monkeypatch.setattr(service, "_create_recognizer", lambda *args, **kwargs: None)
+        monkeypatch.setattr(
+            service,
+            "_run_continuous",
+            lambda recognizer, timeout: SimpleNamespace(
+                error=None,
+                texts=[text for text, _, _ in phrases],
+                confidences=[0.9] * len(phrases),
+                offsets=[(_ticks(start), _ticks(end - start)) for _, start, end in phrases]
+            )
+        )
+        
+        service.phrases = phrases
+        return service
+    
+    def _transcribe(self, service):
+        audio = np.zeros(40 * self.SAMPLE_RATE, dtype=np.float32)
+        return service._transcribe_group(audio, self.SAMPLE_RATE, self.GROUP)
+    
+    def test_phrase_crossing_gap_goes_to_larger_overlap(self, service):
+        """Test that a phrase spanning a gap goes where most of it lies."""
+        # 0.9-2.9 s: midpoint is in the first gap, but 0.9 s of it is in
+        # the second segment and only 0.1 s in the first
+        service.phrases.append(("crossing", 0.9, 2.9))
+        
+        results = self._transcribe(service)
+        
+        assert [r["text"] for r in results] == ["", "crossing", ""]
+    
+    def test_phrase_in_gap_goes_to_nearer_segment(self, service):
+        """Test that a phrase inside a gap goes to the closer segment."""
+        service.phrases.append(("late", 3.1, 3.3))
+        
+        results = self._transcribe(service)
+        
+        assert [r["text"] for r in results] == ["", "late", ""]
+    
+    def test_identical_texts_in_consecutive_segments_kept(self, service):
+        """Test that the same reply in two segments is kept for both."""
+        service.phrases.extend([
+            ("yes.", 0.2, 0.6),
+            ("yes.", 2.2, 2.6),
+            ("no.", 4.2, 4.6)
+        ])
+        
+        results = self._transcribe(service)
+        
+        assert [r["text"] for r in results] == ["yes.", "yes.", "no."]
+        assert [(r["start"], r["end"]) for r in results] == [(10.0, 11.0), (20.0, 21.0), (30.0, 31.0)]
+    
+    def test_repeat_within_segment_dropped(self, service):
+        """Test that a phrase repeated inside one segment is kept once."""
+        service.phrases.extend([
+            ("hello", 0.1, 0.4),
+            ("hello", 0.5, 0.9)
+        ])
+        
+        results = self._transcribe(service)
+        
+        assert results[0]["text"] == "hello"
+    
+    def test_attribute_phrase_inside_segment(self):
+        """Test attribution of a phrase wholly inside one segment."""
+        spans = [(_ticks(0), _ticks(1)), (_ticks(2), _ticks(3))]
+        starts = [start for start, _ in spans]
+        
+        assert _attribute_phrase(spans, starts, _ticks(0.2), _ticks(0.5)) == 0
+        assert _attribute_phrase(spans, starts, _ticks(2.2), _ticks(0.5)) == 1
+    
+    def test_sink_keeps_repeated_phrases_for_batches(self):
+        """Test that batched sessions leave deduplication to the caller."""
+        sink = _ContinuousSink(SimpleNamespace(_get_confidence=lambda result: 0.9))
+        
+        for offset in (0, _ticks(2)):
+            sink.on_recognized(SimpleNamespace(result=SimpleNamespace(
+                reason=speechsdk.ResultReason.RecognizedSpeech,
+                text="yes.",
+                offset=offset,
+                duration=_ticks(0.4)
+            )))
+        
+        assert sink.texts == ["yes.", "yes."]
+        assert len(sink.offsets) == 2
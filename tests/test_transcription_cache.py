@@ -0,0 +1,94 @@
+"""
+Unit tests for TranscriptionCache.
+
+Tests LRU eviction, key derivation and on-disk persistence.
+"""
+
+import pytest
+
+from src.services.transcription_cache import TranscriptionCache, get_shared_cache
+
+
+class TestTranscriptionCache:
+    """Test cases for TranscriptionCache."""
+    
+    @pytest.fixture
+    def sample_result(self):
+        """Sample transcription result."""
+        return {
+            "text": "hello world",
+            "confidence": 0.92,
+            "duration": 1.2,
+            "language": "en-US",
+            "start": 3.0,
+            "end": 4.2
+        }
+    
+    def test_key_depends_on_audio_and_language(self):
+        """Test that keys differ by PCM content and by language."""
+        key = TranscriptionCache.make_key(b"\x00\x01" * 100, "en-US")
+        
+        assert key == TranscriptionCache.make_key(b"\x00\x01" * 100, "en-US")
+        assert key != TranscriptionCache.make_key(b"\x00\x02" * 100, "en-US")
+        assert key != TranscriptionCache.make_key(b"\x00\x01" * 100, "he-IL")
+    
+    def test_get_returns_copy(self, sample_result):
+        """Test that callers cannot mutate cached entries."""
+        cache = TranscriptionCache(max_size=4)
+        key = TranscriptionCache.make_key(b"pcm", "en-US")
+        cache.put(key, sample_result)
+        
+        hit = cache.get(key)
+        hit["start"] = 99.0
+        
+        assert cache.get(key)["start"] == 3.0
+    
+    def test_miss_returns_none(self):
+        """Test lookup of an unknown key."""
+        cache = TranscriptionCache(max_size=4)
+        
+        assert cache.get("en-US:missing") is None
+    
+    def test_lru_eviction(self, sample_result):
+        """Test that the least recently used entry is evicted."""
+        cache = TranscriptionCache(max_size=2)
+        cache.put("a", sample_result)
+        cache.put("b", sample_result)
+        cache.get("a")  # 'b' is now least recently used
+        cache.put("c", sample_result)
+        
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+    
+    def test_persistence(self, tmp_path, sample_result):
+        """Test that entries survive reopening the shelf."""
+        path = tmp_path / ".trans_cache"
+        key = TranscriptionCache.make_key(b"pcm", "en-US")
+        
+        cache = TranscriptionCache(max_size=4, path=path)
+        cache.put(key, sample_result)
+        cache.close()
+        
+        reopened = TranscriptionCache(max_size=4, path=path)
+        assert reopened.get(key) == sample_result
+        reopened.close()
+    
+    def test_shared_cache_per_path(self, tmp_path, sample_result):
+        """Test that services share one cache (and one shelf) per path."""
+        path = tmp_path / ".trans_cache"
+        first = get_shared_cache(max_size=4, path=path)
+        second = get_shared_cache(max_size=4, path=path)
+        
+        assert first is second
+        assert get_shared_cache(max_size=4, path=tmp_path / "other") is not first
+        
+        # Writes through either reference land in the same shelf
+        first.put("k1", sample_result)
+        second.put("k2", sample_result)
+        first.close()
+        
+        reopened = TranscriptionCache(max_size=4, path=path)
+        assert reopened.get("k1") == sample_result
+        assert reopened.get("k2") == sample_result
+        reopened.close()